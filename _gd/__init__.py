@@ -1,7 +1,7 @@
 try:
-    from _gd._gd import cyclic_xor, xor  # type: ignore
+    from _gd._gd import cyclic_xor, parse_object, xor, xor_in_place  # type: ignore
 
 except ImportError:
     pass
 
-__all__ = ("cyclic_xor", "xor")
+__all__ = ("cyclic_xor", "parse_object", "xor", "xor_in_place")
@@ -51,6 +51,7 @@ from gd.enums import (
     Orientation,
     PadType,
     PickupItemMode,
+    PickupItemType,
     Platform,
     PlayerColor,
     PortalType,
@@ -107,7 +108,9 @@ from gd.level_packs import Gauntlet, MapPack
 from gd.message import Message
 from gd.password import Password
 from gd.platform import SYSTEM_PLATFORM
+from gd.rate_limiter import RateLimiter
 from gd.relationship import Relationship
+from gd.retries import RetryPolicy
 from gd.rewards import Chest, Quest
 from gd.session import Session
 from gd.song import Song
@@ -174,6 +177,7 @@ __all__ = (
     "InstantCountComparison",
     "OrbType",
     "PadType",
+    "PickupItemType",
     "PickupItemMode",
     "GameMode",
     "LevelType",
@@ -198,4 +202,7 @@ __all__ = (
     "Orientation",
     "ResponseType",
     "CollectedCoins",
+    # networking
+    "RateLimiter",
+    "RetryPolicy",
 )
@@ -1,10 +1,13 @@
 from gd.api.color_channels import Channel, Channels, ColorChannel, ColorChannels
+from gd.api.convert import convert_level, convert_levels
 from gd.api.database import Database
-from gd.api.editor import Editor
+from gd.api.editor import Editor, LazyBinaryEditor, LazyEditor
 from gd.api.folder import Folder
+from gd.api.group_index import GroupIndex, IDAllocator, InvertedIndex
 from gd.api.header import Header
 from gd.api.hsv import HSV
 from gd.api.level import LevelAPI
+from gd.api.object_table import ObjectTable, ObjectTableView
 from gd.api.objects import (
     AlphaTrigger,
     AnimatedObject,
@@ -36,6 +39,10 @@ from gd.api.objects import (
 from gd.api.ordered_set import OrderedSet
 from gd.api.recording import Recording, RecordingItem
 from gd.api.save_manager import SaveManager, create_database, save, save_manager
+from gd.api.spatial_index import SpatialIndex
+from gd.api.speed_timeline import SpeedTimeline
+from gd.api.transform import Selection, Transform
+from gd.api.trigger_graph import TriggerGraph
 
 __all__ = (
     # database
@@ -46,8 +53,17 @@ __all__ = (
     "Folder",
     # level API
     "LevelAPI",
+    # convert
+    "convert_level",
+    "convert_levels",
     # editor
     "Editor",
+    "LazyEditor",
+    "LazyBinaryEditor",
+    # group index
+    "GroupIndex",
+    "IDAllocator",
+    "InvertedIndex",
     # header
     "Header",
     # color channels
@@ -84,9 +100,21 @@ __all__ = (
     "Text",
     "ToggleTrigger",
     "TouchTrigger",
+    # object table
+    "ObjectTable",
+    "ObjectTableView",
     # recording
     "Recording",
     "RecordingItem",
+    # spatial index
+    "SpatialIndex",
+    # speed timeline
+    "SpeedTimeline",
+    # transform
+    "Transform",
+    "Selection",
+    # trigger graph
+    "TriggerGraph",
     # save manager
     "SaveManager",
     "create_database",
@@ -4,8 +4,8 @@ from attrs import define, field
 
 from gd.api.hsv import HSV
 from gd.binary import VERSION, Binary
-from gd.binary_constants import BITS, BYTE
-from gd.binary_utils import Reader, Writer
+from gd.binary_constants import BITS, BYTE, F32, U8, U16, U32
+from gd.binary_utils import Codec, Reader, Writer
 from gd.color import Color
 from gd.constants import DEFAULT_ID
 from gd.enums import ByteOrder, PlayerColor
@@ -55,6 +55,9 @@ PLAYER_COLOR_MASK = 0b00000011
 UNKNOWN_BIT = 0b00000100
 UNKNOWN_ANOTHER_BIT = 0b00001000
 
+# ID, color and opacity, unknowns and player color, HSV, to color and opacity, delta, copied ID
+COLOR_CHANNEL_CODEC = Codec(U16 + U32 + U8 + U32 + U32 + F32 + U16)
+
 RED = 1
 GREEN = 2
 BLUE = 3
@@ -207,9 +210,15 @@ class ColorChannel(Binary):
 
         reader = Reader(binary)
 
-        id = reader.read_u16(order)
-
-        value = reader.read_u32(order)
+        (
+            id,
+            value,
+            unknowns_and_player_color,
+            hsv_value,
+            to_value,
+            delta,
+            copied_id,
+        ) = reader.unpack(COLOR_CHANNEL_CODEC, order)
 
         blending_and_opacity = value & byte
 
@@ -221,8 +230,6 @@ class ColorChannel(Binary):
 
         color = Color(value)
 
-        unknowns_and_player_color = reader.read_u8(order)
-
         unknown = unknowns_and_player_color & unknown_bit == unknown_bit
         unknown_another = unknowns_and_player_color & unknown_another_bit == unknown_another_bit
 
@@ -234,9 +241,7 @@ class ColorChannel(Binary):
         else:
             player_color = PlayerColor(player_color_value)
 
-        hsv = HSV.from_binary(binary, order, version)
-
-        to_value = reader.read_u32(order)
+        hsv = HSV.from_value(hsv_value)
 
         copy_opacity_and_to_opacity = to_value & byte
 
@@ -248,10 +253,6 @@ class ColorChannel(Binary):
 
         to_color = Color(to_value)
 
-        delta = reader.read_f32(order)
-
-        copied_id = reader.read_u16(order)
-
         return cls(
             id=id,
             color=color,
@@ -284,8 +285,6 @@ class ColorChannel(Binary):
 
         writer = Writer(binary)
 
-        writer.write_u16(self.id, order)
-
         value = self.color.value
 
         opacity = round(self.opacity * opacity_multiply)
@@ -295,8 +294,6 @@ class ColorChannel(Binary):
 
         value = (value << bits) | opacity
 
-        writer.write_u32(value, order)
-
         player_color = self.player_color
 
         if player_color.is_not_used():
@@ -311,10 +308,6 @@ class ColorChannel(Binary):
         if self.is_unknown_another():
             unknowns_and_player_color |= unknown_another_bit
 
-        writer.write_u8(unknowns_and_player_color, order)
-
-        self.hsv.to_binary(binary, order, version)
-
         to_value = self.to_color.value
 
         to_opacity = round(self.to_opacity * opacity_multiply)
@@ -324,11 +317,17 @@ class ColorChannel(Binary):
 
         to_value = (to_value << bits) | to_opacity
 
-        writer.write_u32(to_value, order)
-
-        writer.write_f32(self.delta, order)
-
-        writer.write_u16(self.copied_id, order)
+        writer.pack(
+            COLOR_CHANNEL_CODEC,
+            self.id,
+            value,
+            unknowns_and_player_color,
+            self.hsv.to_value(),
+            to_value,
+            self.delta,
+            self.copied_id,
+            order=order,
+        )
 
     def is_blending(self) -> bool:
         return self.blending
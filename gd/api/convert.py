@@ -0,0 +1,110 @@
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from os import cpu_count
+from typing import Deque, Iterable, Iterator, Optional
+
+from tqdm import tqdm as progress  # type: ignore
+
+from gd.api.editor import Editor
+from gd.binary import VERSION
+from gd.constants import DEFAULT_ENCODING, DEFAULT_ERRORS, DEFAULT_WITH_BAR
+from gd.encoding import unzip_level
+from gd.enums import ByteOrder
+
+__all__ = ("convert_level", "convert_levels")
+
+DEFAULT_WORKERS = 1
+IN_FLIGHT_PER_WORKER = 4
+
+UNIT = "level"
+
+IN_FLIGHT_MUST_BE_POSITIVE = "`in_flight` must be positive"
+
+
+def convert_level(
+    data: bytes,
+    order: ByteOrder = ByteOrder.DEFAULT,
+    version: int = VERSION,
+    encoding: str = DEFAULT_ENCODING,
+    errors: str = DEFAULT_ERRORS,
+) -> bytes:
+    """Converts the zipped level `data` to the binary editor format."""
+    string = unzip_level(data).decode(encoding, errors)
+
+    return Editor.from_robtop(string).to_bytes(order, version)
+
+
+def convert_levels(
+    levels: Iterable[bytes],
+    workers: Optional[int] = None,
+    in_flight: Optional[int] = None,
+    order: ByteOrder = ByteOrder.DEFAULT,
+    version: int = VERSION,
+    encoding: str = DEFAULT_ENCODING,
+    errors: str = DEFAULT_ERRORS,
+    total: Optional[int] = None,
+    with_bar: bool = DEFAULT_WITH_BAR,
+) -> Iterator[bytes]:
+    """Converts zipped `levels` to the binary editor format in parallel,
+    yielding the results in the order of `levels`.
+
+    Each level is decoded, parsed and encoded in one of the `workers` processes;
+    only the raw bytes are sent between processes.
+
+    At most `in_flight` levels are submitted at once (`4` per worker by default),
+    so `levels` can be arbitrarily large (or lazy) without exhausting memory.
+
+    Parameters:
+        levels: The zipped level data to convert.
+        workers: The amount of processes to use (the amount of CPUs by default).
+        in_flight: The maximum amount of levels being converted at once.
+        order: The byte order to use.
+        version: The binary version to use.
+        encoding: The encoding of level strings.
+        errors: The error handling scheme of the encoding.
+        total: The total amount of levels, used for progress reporting.
+        with_bar: Whether to report the progress using the bar.
+
+    Returns:
+        The iterator over converted levels.
+    """
+    if workers is None:
+        workers = cpu_count() or DEFAULT_WORKERS
+
+    if in_flight is None:
+        in_flight = workers * IN_FLIGHT_PER_WORKER
+
+    if in_flight < 1:
+        raise ValueError(IN_FLIGHT_MUST_BE_POSITIVE)
+
+    convert = partial(convert_level, order=order, version=version, encoding=encoding, errors=errors)
+
+    with ProcessPoolExecutor(workers) as executor:
+        pending: Deque[Future[bytes]] = deque()
+
+        bar = progress(total=total, unit=UNIT, disable=not with_bar)
+
+        try:
+            for level in levels:
+                if len(pending) >= in_flight:
+                    result = pending.popleft().result()
+
+                    bar.update()
+
+                    yield result
+
+                pending.append(executor.submit(convert, level))
+
+            while pending:
+                result = pending.popleft().result()
+
+                bar.update()
+
+                yield result
+
+        finally:
+            for future in pending:
+                future.cancel()
+
+            bar.close()
@@ -1,48 +1,74 @@
+from __future__ import annotations
+
+from array import array
+from functools import partial
+from io import SEEK_CUR, BytesIO
 from itertools import count
+from math import hypot
 from operator import attrgetter as get_attribute_factory
-from typing import BinaryIO, Iterable, Iterator, List, Sequence, Set, Type, TypeVar, Union, overload
+from struct import unpack_from
+from types import TracebackType as Traceback
+from typing import (
+    AbstractSet,
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
 from attrs import define, field
 from iters import iter
 
 from gd.api.color_channels import ColorChannels
+from gd.api.group_index import GroupIndex
 from gd.api.header import Header
+from gd.api.object_table import ObjectTable
 from gd.api.objects import (
+    GRID_UNITS,
+    OBSERVER_ALREADY_ATTACHED,
+    SPEED_CHANGE_IDS,
+    TYPE_TO_OBJECT_TYPE,
     Object,
+    ObjectType,
     Trigger,
+    find_object_id,
     has_additional_group,
     has_target_group,
     is_trigger,
-    object_from_binary,
+    object_from_bytes,
     object_from_robtop,
     object_to_binary,
     object_to_robtop,
+    object_to_robtop_cached,
+    objects_from_binary,
+    objects_from_robtop,
+    objects_to_binary,
 )
-from gd.binary import VERSION, Binary
+from gd.api.spatial_index import SpatialIndex
+from gd.api.speed_timeline import SPEED_CHANGE_TO_MAGIC, SPEED_TO_MAGIC, SpeedTimeline
+from gd.api.transform import Selection
+from gd.api.trigger_graph import TriggerGraph
+from gd.binary import RANDOM_ACCESS_VERSION, VERSION, Binary, Buffer, BufferReader
+from gd.binary_constants import U32, U32_SIZE, U64, U64_SIZE
 from gd.binary_utils import Reader, Writer
-from gd.enums import ByteOrder, Speed, SpeedChangeType, SpeedMagic
+from gd.constants import DEFAULT_ENCODING, DEFAULT_ERRORS, EMPTY
+from gd.encoding import DEFAULT_CHUNK_SIZE, iter_unzip_level_string, unzip_level_string
+from gd.enums import ByteOrder, Speed, SpeedChangeType
 from gd.models_constants import OBJECTS_SEPARATOR
-from gd.models_utils import concat_objects, split_objects
+from gd.models_utils import concat_objects, split_objects, split_objects_chunks
 from gd.robtop import RobTop
-from gd.typing import is_instance
-
-__all__ = ("Editor", "get_time_length")
+from gd.typing import AnyException, is_instance
 
-SPEED_TO_MAGIC = {
-    Speed.SLOW: SpeedMagic.SLOW,
-    Speed.NORMAL: SpeedMagic.NORMAL,
-    Speed.FAST: SpeedMagic.FAST,
-    Speed.FASTER: SpeedMagic.FASTER,
-    Speed.FASTEST: SpeedMagic.FASTEST,
-}
-
-SPEED_CHANGE_TO_MAGIC = {
-    SpeedChangeType.SLOW: SpeedMagic.SLOW,
-    SpeedChangeType.NORMAL: SpeedMagic.NORMAL,
-    SpeedChangeType.FAST: SpeedMagic.FAST,
-    SpeedChangeType.FASTER: SpeedMagic.FASTER,
-    SpeedChangeType.FASTEST: SpeedMagic.FASTEST,
-}
+__all__ = ("Editor", "LazyEditor", "LazyBinaryEditor", "get_time_length")
 
 
 def get_time_length(
@@ -101,12 +127,45 @@ def find_next(values: Set[int], start: int = DEFAULT_START) -> int:
     return DEFAULT_NEXT  # pragma: never
 
 
+def group_indices_by_type(objects: Iterable[Object]) -> Dict[ObjectType, List[int]]:
+    sections: Dict[ObjectType, List[int]] = {}
+
+    for index, object in enumerate(objects):
+        object_type = TYPE_TO_OBJECT_TYPE[type(object)]
+
+        indices = sections.get(object_type)
+
+        if indices is None:
+            indices = sections[object_type] = []
+
+        indices.append(index)
+
+    return sections
+
+
+def skip_random_access_tables(
+    binary: BinaryIO, count: int, order: ByteOrder = ByteOrder.DEFAULT
+) -> None:
+    reader = Reader(binary)
+
+    binary.read((count + 1) * U64_SIZE)
+
+    section_count = reader.read_u8(order)
+
+    for _ in range(section_count):
+        reader.read_u8(order)
+
+        binary.read(reader.read_u32(order) * U32_SIZE)
+
+
 DEFAULT_X = 0.0
 
 X = "x"
 
 get_x = get_attribute_factory(X)
 
+ID = "id"
+
 E = TypeVar("E", bound="Editor")
 
 
@@ -115,6 +174,13 @@ class Editor(RobTop, Binary, Sequence[Object]):
     header: Header = field(factory=Header)
     objects: List[Object] = field(factory=list)
 
+    _spatial_index: Optional[SpatialIndex] = field(default=None, init=False, repr=False, eq=False)
+    _group_index: Optional[GroupIndex] = field(default=None, init=False, repr=False, eq=False)
+
+    _robtop_cache: bool = field(default=False, init=False, repr=False, eq=False)
+
+    _speed_timeline: Optional[SpeedTimeline] = field(default=None, init=False, repr=False, eq=False)
+
     @classmethod
     def from_objects(cls: Type[E], *objects: Object, header: Header) -> E:
         return cls(header, list(objects))
@@ -125,6 +191,13 @@ class Editor(RobTop, Binary, Sequence[Object]):
     def from_object_iterable(cls: Type[E], objects: Iterable[Object], header: Header) -> E:
         return cls(header, list(objects))
 
+    @classmethod
+    def from_object_table(cls: Type[E], table: ObjectTable, header: Header) -> E:
+        return cls.from_object_iterable(table, header)
+
+    def to_object_table(self) -> ObjectTable:
+        return ObjectTable.from_object_iterable(self.objects)
+
     def __len__(self) -> int:
         return len(self.objects)
 
@@ -142,6 +215,254 @@ class Editor(RobTop, Binary, Sequence[Object]):
 
         return self.from_object_iterable(self.objects[index], self.header)
 
+    def add_objects(self: E, *objects: Object) -> E:
+        return self.add_objects_from_iterable(objects)
+
+    def add_objects_from_iterable(self: E, objects: Iterable[Object]) -> E:
+        for object in objects:
+            self.on_add(object)
+
+            self.objects.append(object)
+
+        return self
+
+    def remove_objects(self: E, *objects: Object) -> E:
+        return self.remove_objects_from_iterable(objects)
+
+    def remove_objects_from_iterable(self: E, objects: Iterable[Object]) -> E:
+        """Removes `objects` from the editor, comparing them by identity."""
+        removed = {id(object): object for object in objects}
+
+        self.objects = [object for object in self.objects if id(object) not in removed]
+
+        for object in removed.values():
+            self.on_remove(object)
+
+        return self
+
+    def has_indexes(self) -> bool:
+        return self._spatial_index is not None or self._group_index is not None
+
+    def on_add(self, object: Object) -> None:
+        if self.has_indexes():
+            object.attach_observer(self)
+
+        spatial_index = self._spatial_index
+
+        if spatial_index is not None:
+            spatial_index.add(object)
+
+        group_index = self._group_index
+
+        if group_index is not None:
+            group_index.add(object)
+
+        if object.is_speed_change():
+            self.invalidate_speed_timeline()
+
+    def on_remove(self, object: Object) -> None:
+        spatial_index = self._spatial_index
+
+        if spatial_index is not None:
+            spatial_index.discard(object)
+
+        group_index = self._group_index
+
+        if group_index is not None:
+            group_index.remove(object)
+
+        if object.observer is self:
+            object.detach_observer()
+
+        if object.is_speed_change():
+            self.invalidate_speed_timeline()
+
+    def on_move(self, object: Object, x: float, y: float) -> None:
+        spatial_index = self._spatial_index
+
+        if spatial_index is not None:
+            spatial_index.move(object)
+
+        if object.is_speed_change():
+            self.invalidate_speed_timeline()
+
+    def on_add_groups(self, object: Object, groups: Iterable[int]) -> None:
+        group_index = self._group_index
+
+        if group_index is not None:
+            group_index.add_groups(object, groups)
+
+    def on_remove_groups(self, object: Object, groups: Iterable[int]) -> None:
+        group_index = self._group_index
+
+        if group_index is not None:
+            group_index.remove_groups(object, groups)
+
+    def on_set(self, object: Object, name: str, value: Any) -> None:
+        group_index = self._group_index
+
+        if group_index is not None:
+            group_index.update(object, name, value)
+
+        if object.is_speed_change() or (name == ID and value in SPEED_CHANGE_IDS):
+            self.invalidate_speed_timeline()
+
+    def attach_to_objects(self) -> None:
+        objects = self.objects
+
+        for object in objects:  # check every object before attaching to any of them
+            if not object.can_attach_observer(self):
+                raise ValueError(OBSERVER_ALREADY_ATTACHED)
+
+        for object in objects:
+            object.attach_observer(self)
+
+    def detach_from_objects(self) -> None:
+        if self.has_indexes():
+            return
+
+        self.invalidate_speed_timeline()  # speed changes are detached as well
+
+        for object in self.objects:
+            if object.observer is self:
+                object.detach_observer()
+
+    @property
+    def spatial_index(self) -> Optional[SpatialIndex]:
+        return self._spatial_index
+
+    def enable_spatial_index(self, cell_size: float = GRID_UNITS) -> SpatialIndex:
+        """Builds the [`SpatialIndex`][gd.api.spatial_index.SpatialIndex] over the objects.
+
+        The index is kept up to date when objects are added or removed via editor methods,
+        and when they are moved via [`move`][gd.api.objects.Object.move].
+        Objects that are changed otherwise (or added to `objects` directly) must be
+        reindexed via [`reindex`][gd.api.editor.Editor.reindex].
+        """
+        self.attach_to_objects()
+
+        self._spatial_index = spatial_index = SpatialIndex(cell_size)
+
+        spatial_index.add_from_iterable(self.objects)
+
+        return spatial_index
+
+    def disable_spatial_index(self) -> None:
+        self._spatial_index = None
+
+        self.detach_from_objects()
+
+    @property
+    def group_index(self) -> Optional[GroupIndex]:
+        return self._group_index
+
+    def enable_group_index(self) -> GroupIndex:
+        """Builds the [`GroupIndex`][gd.api.group_index.GroupIndex] over the objects.
+
+        The index is kept up to date when objects are added or removed via editor methods,
+        and when groups are changed via [`add_groups`][gd.api.objects.Object.add_groups]
+        and [`remove_groups`][gd.api.objects.Object.remove_groups] (and their iterable forms).
+        Objects that are changed otherwise (for instance, color IDs or target groups)
+        must be reindexed via [`reindex`][gd.api.editor.Editor.reindex].
+        """
+        self.attach_to_objects()
+
+        self._group_index = group_index = GroupIndex()
+
+        group_index.add_from_iterable(self.objects)
+
+        return group_index
+
+    def disable_group_index(self) -> None:
+        self._group_index = None
+
+        self.detach_from_objects()
+
+    def has_robtop_cache(self) -> bool:
+        return self._robtop_cache
+
+    def enable_robtop_cache(self) -> None:
+        """Enables caching of serialized objects in [`to_robtop`][gd.api.editor.Editor.to_robtop].
+
+        Only objects that are [dirty][gd.api.objects.Object.is_dirty] are serialized again,
+        while the cached strings are reused for the rest.
+        """
+        self._robtop_cache = True
+
+    def disable_robtop_cache(self) -> None:
+        self._robtop_cache = False
+
+        for object in self.objects:
+            object.mark_dirty()
+
+    def reindex(self, *objects: Object) -> None:
+        """Updates the indexes of `objects` that have been changed in place,
+        also [marking them dirty][gd.api.objects.Object.mark_dirty].
+        """
+        spatial_index = self._spatial_index
+        group_index = self._group_index
+
+        for object in objects:
+            if self.has_indexes():
+                object.attach_observer(self)
+
+            object.mark_dirty()
+
+            if object.is_speed_change():
+                self.invalidate_speed_timeline()
+
+            if spatial_index is not None:
+                if object in spatial_index:
+                    spatial_index.move(object)
+
+                else:
+                    spatial_index.add(object)
+
+            if group_index is not None:
+                group_index.reindex(object)
+
+    def iter_objects_in_x_range(self, x_start: float, x_stop: float) -> Iterator[Object]:
+        spatial_index = self._spatial_index
+
+        if spatial_index is not None:
+            return spatial_index.query_x_range(x_start, x_stop)
+
+        return (object for object in self.objects if x_start <= object.x <= x_stop)
+
+    def iter_objects_in_rectangle(
+        self, x_start: float, y_start: float, x_stop: float, y_stop: float
+    ) -> Iterator[Object]:
+        spatial_index = self._spatial_index
+
+        if spatial_index is not None:
+            return spatial_index.query_rectangle(x_start, y_start, x_stop, y_stop)
+
+        return (
+            object
+            for object in self.objects
+            if x_start <= object.x <= x_stop and y_start <= object.y <= y_stop
+        )
+
+    def nearest_object(
+        self, x: float, y: float, max_distance: Optional[float] = None
+    ) -> Optional[Object]:
+        spatial_index = self._spatial_index
+
+        if spatial_index is not None:
+            return spatial_index.nearest(x, y, max_distance)
+
+        best: Optional[Object] = None
+        best_distance = max_distance
+
+        for object in self.objects:
+            distance = hypot(object.x - x, object.y - y)
+
+            if best_distance is None or distance <= best_distance:
+                best = object
+                best_distance = distance
+
+        return best
+
     @property
     def color_channels(self) -> ColorChannels:
         return self.header.color_channels
@@ -149,6 +470,8 @@ class Editor(RobTop, Binary, Sequence[Object]):
     def set_header(self: E, header: Header) -> E:
         self.header = header
 
+        self.invalidate_speed_timeline()
+
         return self
 
     def set_color_channels(self: E, color_channels: ColorChannels) -> E:
@@ -157,6 +480,13 @@ class Editor(RobTop, Binary, Sequence[Object]):
         return self
 
     def iter_groups(self) -> Iterator[int]:
+        group_index = self._group_index
+
+        if group_index is not None:
+            yield from group_index.iter_group_ids()
+
+            return
+
         for object in self.objects:
             yield from object.groups
 
@@ -172,12 +502,23 @@ class Editor(RobTop, Binary, Sequence[Object]):
 
     @property
     def free_group(self) -> int:
+        group_index = self._group_index
+
+        if group_index is not None:
+            return group_index.free_group()
+
         return find_next(self.groups)
 
     def iter_color_ids(self) -> Iterator[int]:
-        for editor_object in self.objects:
-            yield editor_object.base_color_id
-            yield editor_object.detail_color_id
+        group_index = self._group_index
+
+        if group_index is not None:
+            yield from group_index.iter_color_ids()
+
+        else:
+            for editor_object in self.objects:
+                yield editor_object.base_color_id
+                yield editor_object.detail_color_id
 
         yield from self.color_channels
 
@@ -187,8 +528,47 @@ class Editor(RobTop, Binary, Sequence[Object]):
 
     @property
     def free_color_id(self) -> int:
+        group_index = self._group_index
+
+        if group_index is not None:
+            return group_index.free_color_id(self.color_channels)
+
         return find_next(self.color_ids)
 
+    def iter_objects_in_group(self, group: int) -> Iterator[Object]:
+        group_index = self._group_index
+
+        if group_index is not None:
+            return group_index.groups.iter(group)
+
+        return (object for object in self.objects if group in object.groups)
+
+    def iter_objects_with_color_id(self, color_id: int) -> Iterator[Object]:
+        group_index = self._group_index
+
+        if group_index is not None:
+            return group_index.colors.iter(color_id)
+
+        return (
+            object
+            for object in self.objects
+            if object.base_color_id == color_id or object.detail_color_id == color_id
+        )
+
+    def iter_objects_targeting(self, group: int) -> Iterator[Object]:
+        """Finds objects (usually triggers) that target the `group`."""
+        group_index = self._group_index
+
+        if group_index is not None:
+            return group_index.targets.iter(group)
+
+        return (
+            object
+            for object in self.objects
+            if (has_target_group(object) and object.target_group_id == group)
+            or (has_additional_group(object) and object.additional_group_id == group)
+        )
+
     def iter_portals(self) -> Iterator[Object]:
         for object in self.objects:
             if object.is_portal():
@@ -216,17 +596,81 @@ class Editor(RobTop, Binary, Sequence[Object]):
     def triggers(self) -> List[Trigger]:
         return sorted(self.iter_triggers(), key=get_x)
 
+    def select(self, *objects: Object) -> Selection:
+        return self.select_from_iterable(objects)
+
+    def select_from_iterable(self, objects: Iterable[Object]) -> Selection:
+        """Creates the [`Selection`][gd.api.transform.Selection] of `objects`,
+        which can be transformed in bulk.
+        """
+        return Selection.from_object_iterable(objects)
+
+    def select_all(self) -> Selection:
+        return self.select_from_iterable(self.objects)
+
+    def select_group(self, group: int) -> Selection:
+        return self.select_from_iterable(self.iter_objects_in_group(group))
+
+    def trigger_graph(self) -> TriggerGraph:
+        """Builds the [`TriggerGraph`][gd.api.trigger_graph.TriggerGraph] of the objects."""
+        return TriggerGraph.from_object_iterable(self.objects)
+
     @property
     def x_length(self) -> float:
+        spatial_index = self._spatial_index
+
+        if spatial_index is not None:
+            x = spatial_index.max_x()
+
+            return DEFAULT_X if x is None else x
+
         return max(map(get_x, self.objects), default=DEFAULT_X)
 
     @property
     def start_speed(self) -> Speed:
         return self.header.speed
 
+    @property
+    def speed_timeline(self) -> SpeedTimeline:
+        """The [`SpeedTimeline`][gd.api.speed_timeline.SpeedTimeline] of the editor.
+
+        The timeline is cached only while any index is enabled, since objects are observed
+        then; the cache is invalidated whenever speed changes are added, removed, moved
+        or changed otherwise, or when the start speed changes.
+
+        Without indexes, the timeline is built on each access, so changing objects
+        (or the object list itself) directly is always taken into account.
+        """
+        start_speed = self.start_speed
+
+        if not self.has_indexes():
+            return SpeedTimeline.from_speed_changes(start_speed, self.iter_speed_changes())
+
+        speed_timeline = self._speed_timeline
+
+        if speed_timeline is None or speed_timeline.start_speed is not start_speed:
+            speed_timeline = SpeedTimeline.from_speed_changes(
+                start_speed, self.iter_speed_changes()
+            )
+
+            self._speed_timeline = speed_timeline
+
+        return speed_timeline
+
+    def invalidate_speed_timeline(self) -> None:
+        self._speed_timeline = None
+
+    def time_at(self, x: float) -> float:
+        """Computes the time (in seconds) to travel from `0` to `x`."""
+        return self.speed_timeline.time_at(x)
+
+    def x_at(self, time: float) -> float:
+        """Computes the position reached after `time` seconds."""
+        return self.speed_timeline.x_at(time)
+
     @property
     def length(self) -> float:
-        return get_time_length(self.x_length, self.start_speed, self.speed_changes)
+        return self.speed_timeline.time_at(self.x_length)
 
     @classmethod
     def from_binary(
@@ -238,13 +682,24 @@ class Editor(RobTop, Binary, Sequence[Object]):
 
         iterable_length = reader.read_u32(order)
 
-        iterable = (object_from_binary(binary, order, version) for _ in range(iterable_length))
+        if version >= RANDOM_ACCESS_VERSION:
+            skip_random_access_tables(binary, iterable_length, order)
 
-        return cls.from_object_iterable(iterable, header)
+        objects = objects_from_binary(binary, iterable_length, order, version)
+
+        return cls.from_object_iterable(objects, header)
 
     def to_binary(
         self, binary: BinaryIO, order: ByteOrder = ByteOrder.DEFAULT, version: int = VERSION
     ) -> None:
+        """Writes the editor to the `binary`.
+
+        Starting with [`RANDOM_ACCESS_VERSION`][gd.binary.RANDOM_ACCESS_VERSION],
+        the object count is followed by the offset table (`count + 1` offsets of records,
+        relative to the first one) and sections (indices of objects of each type),
+        which allow [`LazyBinaryEditor`][gd.api.editor.LazyBinaryEditor] to access objects
+        without reading the preceding ones.
+        """
         self.header.to_binary(binary, order, version)
 
         writer = Writer(binary)
@@ -253,12 +708,44 @@ class Editor(RobTop, Binary, Sequence[Object]):
 
         writer.write_u32(len(objects), order)
 
+        if version < RANDOM_ACCESS_VERSION:
+            objects_to_binary(objects, binary, order, version)
+
+            return
+
+        records = BytesIO()
+
+        writer.write_u64(records.tell(), order)
+
         for object in objects:
-            object_to_binary(object, binary, order, version)
+            object_to_binary(object, records, order, version)
+
+            writer.write_u64(records.tell(), order)
+
+        sections = group_indices_by_type(objects)
+
+        writer.write_u8(len(sections), order)
+
+        for object_type, indices in sections.items():
+            writer.write_u8(object_type.value, order)
+            writer.write_u32(len(indices), order)
+
+            for index in indices:
+                writer.write_u32(index, order)
+
+        binary.write(records.getbuffer())
 
     @classmethod
     def from_robtop(cls: Type[E], string: str) -> E:
-        iterator = iter(split_objects(string)).filter(None)
+        return cls.from_robtop_iterable(split_objects(string))
+
+    @classmethod
+    def from_robtop_iterable(cls: Type[E], strings: Iterable[str]) -> E:
+        """Creates the editor from `strings`, the first of which is the header.
+
+        Objects are parsed one by one as the `strings` are consumed.
+        """
+        iterator = iter(strings).filter(None)
 
         header_string = iterator.next_or_none()
 
@@ -268,17 +755,382 @@ class Editor(RobTop, Binary, Sequence[Object]):
         else:
             header = Header.from_robtop(header_string)
 
-        objects = list(object_from_robtop(object_string) for object_string in iterator.unwrap())
+        return cls.from_object_iterable(objects_from_robtop(iterator.unwrap()), header)
+
+    @classmethod
+    def from_robtop_chunks(cls: Type[E], chunks: Iterable[str]) -> E:
+        """Creates the editor from the level string given by its `chunks`.
 
-        return cls(header, objects)
+        The string is split incrementally, therefore it is never held in memory at once.
+        """
+        return cls.from_robtop_iterable(split_objects_chunks(chunks))
+
+    @classmethod
+    def from_level_data(
+        cls: Type[E],
+        data: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        encoding: str = DEFAULT_ENCODING,
+        errors: str = DEFAULT_ERRORS,
+    ) -> E:
+        """Creates the editor from the zipped level `data`, decompressing it incrementally.
+
+        This is equivalent to `Editor.from_robtop(unzip_level_string(data))`,
+        but avoids materializing the whole decompressed level string.
+        """
+        return cls.from_robtop_chunks(iter_unzip_level_string(data, chunk_size, encoding, errors))
 
     def to_robtop(self) -> str:
-        iterator = iter.once(self.header.to_robtop()).chain(
-            object_to_robtop(object) for object in self.objects
-        )
+        if self.has_robtop_cache():
+            to_robtop = object_to_robtop_cached
+
+        else:
+            to_robtop = object_to_robtop
+
+        iterator = iter.once(self.header.to_robtop()).chain(map(to_robtop, self.objects))
 
         return concat_objects(iterator.unwrap())
 
     @classmethod
     def can_be_in(cls, string: str) -> bool:
         return OBJECTS_SEPARATOR in string
+
+
+OFFSET_TYPE = "Q"
+INDEX_TYPE = "L"
+
+OFFSET_FORMAT = "{}{}" + U64
+INDEX_FORMAT = "{}{}" + U32
+
+L = TypeVar("L", bound="LazyEditor")
+
+
+@define()
+class LazyEditor(RobTop, Sequence[Object]):
+    """The editor that parses objects on demand.
+
+    On load, only the header is parsed and the boundaries of object strings are recorded;
+    objects are parsed on access and cached, so changes to them are preserved.
+
+    Optionally, `object_ids` can be given to skip objects with other IDs entirely;
+    only the ID of each object is parsed in order to filter them.
+
+    ```python
+    editor = LazyEditor.from_robtop(string, object_ids={TEXT_ID})
+    ```
+    """
+
+    header: Header = field(factory=Header)
+    string: str = field(default=EMPTY, repr=False)
+    starts: array[int] = field(factory=partial(array, OFFSET_TYPE), repr=False)
+    stops: array[int] = field(factory=partial(array, OFFSET_TYPE), repr=False)
+
+    _objects: Dict[int, Object] = field(factory=dict, init=False, repr=False)
+
+    @classmethod
+    def from_robtop(cls: Type[L], string: str, object_ids: Optional[AbstractSet[int]] = None) -> L:
+        separator = OBJECTS_SEPARATOR
+
+        find = string.find
+
+        length = len(string)
+
+        header: Optional[Header] = None
+
+        starts = array(OFFSET_TYPE)
+        stops = array(OFFSET_TYPE)
+
+        start = 0
+
+        while start < length:
+            stop = find(separator, start)
+
+            if stop < 0:
+                stop = length
+
+            if stop > start:  # skip empty strings
+                if header is None:
+                    header = Header.from_robtop(string[start:stop])
+
+                elif object_ids is None or find_object_id(string, start, stop) in object_ids:
+                    starts.append(start)
+                    stops.append(stop)
+
+            start = stop + 1
+
+        if header is None:
+            header = Header()
+
+        return cls(header, string, starts, stops)
+
+    @classmethod
+    def from_level_data(
+        cls: Type[L],
+        data: str,
+        object_ids: Optional[AbstractSet[int]] = None,
+        encoding: str = DEFAULT_ENCODING,
+        errors: str = DEFAULT_ERRORS,
+    ) -> L:
+        return cls.from_robtop(unzip_level_string(data, encoding, errors), object_ids)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def get_object_string(self, index: int) -> str:
+        return self.string[self.starts[index] : self.stops[index]]
+
+    def iter_object_strings(self) -> Iterator[str]:
+        string = self.string
+
+        for start, stop in zip(self.starts, self.stops):
+            yield string[start:stop]
+
+    def iter_object_ids(self) -> Iterator[int]:
+        """Iterates over object IDs without parsing objects."""
+        string = self.string
+
+        for start, stop in zip(self.starts, self.stops):
+            yield find_object_id(string, start, stop)
+
+    def is_parsed(self, index: int) -> bool:
+        return index in self._objects
+
+    def parse(self, index: int) -> Object:
+        objects = self._objects
+
+        object = objects.get(index)
+
+        if object is None:
+            object = objects[index] = object_from_robtop(self.get_object_string(index))
+
+        return object
+
+    @overload
+    def __getitem__(self, index: int) -> Object:
+        ...
+
+    @overload
+    def __getitem__(self: L, index: slice) -> L:
+        ...
+
+    def __getitem__(self: L, index: Union[int, slice]) -> Union[Object, L]:
+        indices = range(len(self))
+
+        if is_instance(index, int):
+            return self.parse(indices[index])
+
+        indices = indices[index]
+
+        editor = type(self)(self.header, self.string, self.starts[index], self.stops[index])
+
+        objects = self._objects
+
+        editor._objects.update(
+            (new_index, objects[old_index])
+            for new_index, old_index in enumerate(indices)
+            if old_index in objects
+        )
+
+        return editor
+
+    def __iter__(self) -> Iterator[Object]:
+        parse = self.parse
+
+        for index in range(len(self)):
+            yield parse(index)
+
+    def to_editor(self) -> Editor:
+        return Editor(self.header, list(self))
+
+    def to_robtop(self) -> str:
+        """Serializes the editor, reusing the strings of objects that were not parsed."""
+        objects = self._objects
+
+        string = self.string
+
+        object_strings = (
+            object_to_robtop(objects[index]) if index in objects else string[start:stop]
+            for index, (start, stop) in enumerate(zip(self.starts, self.stops))
+        )
+
+        return concat_objects(iter.once(self.header.to_robtop()).chain(object_strings).unwrap())
+
+    @classmethod
+    def can_be_in(cls, string: str) -> bool:
+        return OBJECTS_SEPARATOR in string
+
+
+B = TypeVar("B", bound="LazyBinaryEditor")
+
+AE = TypeVar("AE", bound=AnyException)
+
+REQUIRES_RANDOM_ACCESS_VERSION = "random access requires version {} or higher, got {}"
+
+
+@define()
+class LazyBinaryEditor(Sequence[Object]):
+    """The editor that reads objects from the binary buffer on demand.
+
+    Only the header, the offset table and sections are read on load;
+    objects are read on access and cached. The buffer is never copied,
+    so it can be [`mmap`][mmap.mmap]-ed:
+
+    ```python
+    with open(path, "rb") as file, mmap(file.fileno(), 0, access=ACCESS_READ) as buffer:
+        with LazyBinaryEditor.from_bytes(buffer, version=RANDOM_ACCESS_VERSION) as editor:
+            ...
+    ```
+
+    The editor holds views of the buffer, which have to be released
+    (see [`release`][gd.api.editor.LazyBinaryEditor.release]) before the buffer is closed;
+    exiting the context manager does that automatically.
+
+    The data has to be written by [`Editor.to_binary`][gd.api.editor.Editor.to_binary]
+    with the version at least [`RANDOM_ACCESS_VERSION`][gd.binary.RANDOM_ACCESS_VERSION].
+    """
+
+    header: Header = field()
+    view: memoryview = field(repr=False)
+    offsets: array[int] = field(repr=False)
+    sections: Dict[ObjectType, array[int]] = field(repr=False)
+    indices: range = field()
+    order: ByteOrder = field(default=ByteOrder.DEFAULT)
+    version: int = field(default=RANDOM_ACCESS_VERSION)
+
+    _objects: Dict[int, Object] = field(factory=dict, init=False, repr=False)
+
+    @classmethod
+    def from_bytes(
+        cls: Type[B],
+        data: Buffer,
+        order: ByteOrder = ByteOrder.DEFAULT,
+        version: int = RANDOM_ACCESS_VERSION,
+    ) -> B:
+        if version < RANDOM_ACCESS_VERSION:
+            raise ValueError(REQUIRES_RANDOM_ACCESS_VERSION.format(RANDOM_ACCESS_VERSION, version))
+
+        binary = BufferReader(data)
+
+        view = binary.view
+
+        header = Header.from_binary(binary, order, version)  # type: ignore
+
+        reader = Reader(binary)
+
+        count = reader.read_u32(order)
+
+        offsets = array(
+            OFFSET_TYPE,
+            unpack_from(OFFSET_FORMAT.format(order.value, count + 1), view, binary.tell()),
+        )
+
+        binary.seek((count + 1) * U64_SIZE, SEEK_CUR)
+
+        sections: Dict[ObjectType, array[int]] = {}
+
+        section_count = reader.read_u8(order)
+
+        for _ in range(section_count):
+            object_type = ObjectType(reader.read_u8(order))
+
+            index_count = reader.read_u32(order)
+
+            sections[object_type] = array(
+                INDEX_TYPE,
+                unpack_from(INDEX_FORMAT.format(order.value, index_count), view, binary.tell()),
+            )
+
+            binary.seek(index_count * U32_SIZE, SEEK_CUR)
+
+        start = binary.tell()
+
+        return cls(header, view[start:], offsets, sections, range(count), order, version)
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def read(self, index: int) -> Object:
+        """Reads the object at the absolute (non-negative) `index` in the buffer."""
+        objects = self._objects
+
+        object = objects.get(index)
+
+        if object is None:
+            offsets = self.offsets
+
+            object = objects[index] = object_from_bytes(
+                self.view[offsets[index] : offsets[index + 1]], self.order, self.version
+            )
+
+        return object
+
+    def is_read(self, index: int) -> bool:
+        return self.indices[index] in self._objects
+
+    @overload
+    def __getitem__(self, index: int) -> Object:
+        ...
+
+    @overload
+    def __getitem__(self: B, index: slice) -> B:
+        ...
+
+    def __getitem__(self: B, index: Union[int, slice]) -> Union[Object, B]:
+        if is_instance(index, int):
+            return self.read(self.indices[index])
+
+        editor = type(self)(
+            self.header,
+            self.view,
+            self.offsets,
+            self.sections,
+            self.indices[index],
+            self.order,
+            self.version,
+        )
+
+        editor._objects = self._objects  # share the cache, since absolute indices are used
+
+        return editor
+
+    def __iter__(self) -> Iterator[Object]:
+        read = self.read
+
+        for index in self.indices:
+            yield read(index)
+
+    def iter_objects_of_type(self, object_type: ObjectType) -> Iterator[Object]:
+        """Iterates over objects of the given `object_type`, reading only them."""
+        indices = self.indices
+
+        read = self.read
+
+        for index in self.sections.get(object_type, ()):
+            if index in indices:
+                yield read(index)
+
+    def to_editor(self) -> Editor:
+        return Editor(self.header, list(self))
+
+    def release(self) -> None:
+        """Releases the view of the buffer, after which no more objects can be read.
+
+        Since slices of the editor share the view, they are released as well.
+        """
+        self.view.release()
+
+    def __enter__(self: B) -> B:
+        return self
+
+    @overload
+    def __exit__(self, error_type: None, error: None, traceback: None) -> None:
+        ...
+
+    @overload
+    def __exit__(self, error_type: Type[AE], error: AE, traceback: Traceback) -> None:
+        ...
+
+    def __exit__(
+        self, error_type: Optional[Type[AE]], error: Optional[AE], traceback: Optional[Traceback]
+    ) -> None:
+        self.release()
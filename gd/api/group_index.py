@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+from typing import AbstractSet, Any, Container, Dict, Iterable, Iterator, KeysView, List, Tuple
+
+from attrs import define, field
+
+from gd.api.objects import Object, has_additional_group, has_target_group
+from gd.typing import Predicate
+
+__all__ = ("InvertedIndex", "IDAllocator", "GroupIndex")
+
+DEFAULT_START = 1
+
+GROUPS = "groups"
+BASE_COLOR_ID = "base_color_id"
+DETAIL_COLOR_ID = "detail_color_id"
+TARGET_GROUP_ID = "target_group_id"
+ADDITIONAL_GROUP_ID = "additional_group_id"
+
+INDEXED_NAMES = frozenset(
+    (GROUPS, BASE_COLOR_ID, DETAIL_COLOR_ID, TARGET_GROUP_ID, ADDITIONAL_GROUP_ID)
+)
+
+
+@define()
+class InvertedIndex:
+    """Maps keys (like group IDs) to objects, which are compared by identity."""
+
+    _entries: Dict[int, Dict[int, Object]] = field(factory=dict, init=False, repr=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._entries
+
+    def keys(self) -> KeysView[int]:
+        return self._entries.keys()
+
+    def iter(self, key: int) -> Iterator[Object]:
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            yield from entry.values()
+
+    def get(self, key: int) -> List[Object]:
+        return list(self.iter(key))
+
+    def count(self, key: int) -> int:
+        entry = self._entries.get(key)
+
+        return 0 if entry is None else len(entry)
+
+    def add(self, key: int, object: Object) -> None:
+        entries = self._entries
+
+        entry = entries.get(key)
+
+        if entry is None:
+            entry = entries[key] = {}
+
+        entry[id(object)] = object
+
+    def remove(self, key: int, object: Object) -> bool:
+        """Removes the `object` from the `key` entry, returning whether the entry became empty."""
+        entries = self._entries
+
+        entry = entries.get(key)
+
+        if entry is None:
+            return False
+
+        entry.pop(id(object), None)
+
+        if entry:
+            return False
+
+        del entries[key]
+
+        return True
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+@define()
+class IDAllocator:
+    """Finds the smallest unused IDs, starting from `start`.
+
+    The allocator keeps the cursor below which every ID is known to be used,
+    so allocating IDs one after another takes amortized `O(1)` time.
+    """
+
+    start: int = field(default=DEFAULT_START)
+
+    _cursor: int = field(init=False, repr=False)
+
+    @_cursor.default
+    def default_cursor(self) -> int:
+        return self.start
+
+    def free(self, is_used: Predicate[int]) -> int:
+        cursor = self._cursor
+
+        while is_used(cursor):
+            cursor += 1
+
+        self._cursor = cursor
+
+        return cursor
+
+    def release(self, value: int) -> None:
+        if self.start <= value < self._cursor:
+            self._cursor = value
+
+    def reset(self) -> None:
+        self._cursor = self.start
+
+
+Keys = Tuple[AbstractSet[int], Tuple[int, ...], Tuple[int, ...]]
+
+
+def get_keys(object: Object) -> Keys:
+    targets: Tuple[int, ...] = ()
+
+    if has_target_group(object):
+        targets += (object.target_group_id,)
+
+    if has_additional_group(object):
+        targets += (object.additional_group_id,)
+
+    return (
+        frozenset(object.groups),
+        (object.base_color_id, object.detail_color_id),
+        targets,
+    )
+
+
+@define()
+class GroupIndex:
+    """Maintains the inverted indexes of groups, color IDs and target groups.
+
+    - `groups` maps group IDs to objects in these groups;
+    - `colors` maps color IDs to objects that use these colors;
+    - `targets` maps group IDs to objects (usually triggers) that target them.
+    """
+
+    groups: InvertedIndex = field(factory=InvertedIndex)
+    colors: InvertedIndex = field(factory=InvertedIndex)
+    targets: InvertedIndex = field(factory=InvertedIndex)
+
+    _group_allocator: IDAllocator = field(factory=IDAllocator, init=False, repr=False)
+    _color_allocator: IDAllocator = field(factory=IDAllocator, init=False, repr=False)
+
+    _keys: Dict[int, Keys] = field(factory=dict, init=False, repr=False)
+
+    def __contains__(self, object: Object) -> bool:
+        return id(object) in self._keys
+
+    def add(self, object: Object) -> None:
+        if object in self:
+            return
+
+        self.insert(object, get_keys(object))
+
+    def insert(self, object: Object, keys: Keys) -> None:
+        group_ids, color_ids, target_group_ids = keys
+
+        for group_id in group_ids:
+            self.groups.add(group_id, object)
+
+        for color_id in color_ids:
+            self.colors.add(color_id, object)
+
+        for target_group_id in target_group_ids:
+            self.targets.add(target_group_id, object)
+
+        self._keys[id(object)] = keys
+
+    def add_from_iterable(self, objects: Iterable[Object]) -> None:
+        for object in objects:
+            self.add(object)
+
+    def remove(self, object: Object) -> None:
+        keys = self._keys.pop(id(object), None)
+
+        if keys is None:
+            return
+
+        group_ids, color_ids, target_group_ids = keys
+
+        for group_id in group_ids:
+            if self.groups.remove(group_id, object):
+                self.release_group(group_id)
+
+        for color_id in color_ids:
+            if self.colors.remove(color_id, object):
+                self._color_allocator.release(color_id)
+
+        for target_group_id in target_group_ids:
+            if self.targets.remove(target_group_id, object):
+                self.release_group(target_group_id)
+
+    def reindex(self, object: Object) -> None:
+        self.remove(object)
+        self.add(object)
+
+    def update(self, object: Object, name: str, value: Any) -> None:
+        """Updates the keys of the `object`, the `name` attribute of which
+        is about to be set to `value`.
+        """
+        if name not in INDEXED_NAMES or object not in self:
+            return
+
+        group_ids, color_ids, target_group_ids = get_keys(object)
+
+        if name == GROUPS:
+            group_ids = frozenset(value)
+
+        elif name == BASE_COLOR_ID:
+            color_ids = (value, object.detail_color_id)
+
+        elif name == DETAIL_COLOR_ID:
+            color_ids = (object.base_color_id, value)
+
+        elif name == TARGET_GROUP_ID:
+            if has_target_group(object):
+                target_group_ids = (value,) + target_group_ids[1:]
+
+        elif name == ADDITIONAL_GROUP_ID:
+            if has_additional_group(object):
+                target_group_ids = target_group_ids[:-1] + (value,)
+
+        self.remove(object)
+        self.insert(object, (group_ids, color_ids, target_group_ids))
+
+    def add_groups(self, object: Object, group_ids: Iterable[int]) -> None:
+        keys = self._keys.get(id(object))
+
+        if keys is None:
+            return
+
+        object_group_ids, color_ids, target_group_ids = keys
+
+        for group_id in group_ids:
+            self.groups.add(group_id, object)
+
+        self._keys[id(object)] = (object_group_ids.union(group_ids), color_ids, target_group_ids)
+
+    def remove_groups(self, object: Object, group_ids: Iterable[int]) -> None:
+        keys = self._keys.get(id(object))
+
+        if keys is None:
+            return
+
+        object_group_ids, color_ids, target_group_ids = keys
+
+        removed = object_group_ids.intersection(group_ids)
+
+        for group_id in removed:
+            if self.groups.remove(group_id, object):
+                self.release_group(group_id)
+
+        self._keys[id(object)] = (object_group_ids.difference(removed), color_ids, target_group_ids)
+
+    def release_group(self, group_id: int) -> None:
+        if not self.is_group_used(group_id):
+            self._group_allocator.release(group_id)
+
+    def is_group_used(self, group_id: int) -> bool:
+        return group_id in self.groups or group_id in self.targets
+
+    def is_color_id_used(self, color_id: int) -> bool:
+        return color_id in self.colors
+
+    def iter_group_ids(self) -> Iterator[int]:
+        yield from self.groups.keys()
+        yield from self.targets.keys()
+
+    def iter_color_ids(self) -> Iterator[int]:
+        yield from self.colors.keys()
+
+    def free_group(self) -> int:
+        return self._group_allocator.free(self.is_group_used)
+
+    def free_color_id(self, reserved: Container[int] = ()) -> int:
+        """Finds the smallest unused color ID that is also not `reserved`."""
+        is_color_id_used = self.is_color_id_used
+
+        def is_used(color_id: int) -> bool:
+            return is_color_id_used(color_id) or color_id in reserved
+
+        return self._color_allocator.free(is_used)
+
+    def clear(self) -> None:
+        self.groups.clear()
+        self.colors.clear()
+        self.targets.clear()
+
+        self._group_allocator.reset()
+        self._color_allocator.reset()
+
+        self._keys.clear()
@@ -5,8 +5,8 @@ from attrs import define, field
 from gd.api.color_channels import ColorChannels
 from gd.api.guidelines import Guidelines
 from gd.binary import VERSION, Binary
-from gd.binary_constants import HALF_BITS, HALF_BYTE
-from gd.binary_utils import Reader, Writer
+from gd.binary_constants import F32, HALF_BITS, HALF_BYTE, U8
+from gd.binary_utils import Codec, Reader, Writer
 from gd.constants import DEFAULT_ID
 from gd.enums import ByteOrder, GameMode, Speed
 from gd.models import Model
@@ -46,6 +46,9 @@ SONG_FADE_IN_BIT = 0b00000100
 SONG_FADE_OUT_BIT = 0b00000010
 PLATFORMER_MODE_BIT = 0b00000001
 
+# background, ground, ground line and font IDs, game mode and speed, bits, song offset
+HEADER_PREFIX_CODEC = Codec(U8 + U8 + U8 + U8 + U8 + U8 + F32)
+
 H = TypeVar("H", bound="Header")
 
 
@@ -103,12 +106,15 @@ class Header(Model, Binary):
 
         reader = Reader(binary)
 
-        background_id = reader.read_u8(order)
-        ground_id = reader.read_u8(order)
-        ground_line_id = reader.read_u8(order)
-        font_id = reader.read_u8(order)
-
-        value = reader.read_u8(order)
+        (
+            background_id,
+            ground_id,
+            ground_line_id,
+            font_id,
+            value,
+            bits,
+            song_offset,
+        ) = reader.unpack(HEADER_PREFIX_CODEC, order)
 
         speed = Speed(value & HALF_BYTE)
 
@@ -116,8 +122,6 @@ class Header(Model, Binary):
 
         game_mode = GameMode(value)
 
-        bits = reader.read_u8(order)
-
         mini_mode = bits & mini_mode_bit == mini_mode_bit
         dual_mode = bits & dual_mode_bit == dual_mode_bit
         start_position = bits & start_position_bit == start_position_bit
@@ -127,8 +131,6 @@ class Header(Model, Binary):
         song_fade_out = bits & song_fade_out_bit == song_fade_out_bit
         platformer_mode = bits & platformer_mode_bit == platformer_mode_bit
 
-        song_offset = reader.read_f32(order)
-
         guidelines = Guidelines.from_binary(binary, order, version)
 
         color_channels = ColorChannels.from_binary(binary, order, version)
@@ -158,17 +160,10 @@ class Header(Model, Binary):
     ) -> None:
         writer = Writer(binary)
 
-        writer.write_u8(self.background_id, order)
-        writer.write_u8(self.ground_id, order)
-        writer.write_u8(self.ground_line_id, order)
-        writer.write_u8(self.font_id, order)
-
         value = self.game_mode.value
 
         value = (value << HALF_BITS) | self.speed.value
 
-        writer.write_u8(value, order)
-
         bits = 0
 
         if self.is_mini_mode():
@@ -195,9 +190,17 @@ class Header(Model, Binary):
         if self.is_platformer_mode():
             bits |= PLATFORMER_MODE_BIT
 
-        writer.write_u8(bits, order)
-
-        writer.write_f32(self.song_offset, order)
+        writer.pack(
+            HEADER_PREFIX_CODEC,
+            self.background_id,
+            self.ground_id,
+            self.ground_line_id,
+            self.font_id,
+            value,
+            bits,
+            self.song_offset,
+            order=order,
+        )
 
         self.guidelines.to_binary(binary, order, version)
 
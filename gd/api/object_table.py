@@ -0,0 +1,431 @@
+from __future__ import annotations
+
+from array import array
+from copy import copy
+from functools import partial
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from attrs import NOTHING, Factory, define, field, fields
+
+from gd.api.objects import (
+    DISABLE_GLOW_BIT,
+    DO_NOT_ENTER_BIT,
+    DO_NOT_FADE_BIT,
+    GROUP_PARENT_BIT,
+    H_FLIPPED_BIT,
+    HIGH_DETAIL_BIT,
+    SPECIAL_CHECKED_BIT,
+    V_FLIPPED_BIT,
+    Groups,
+    MoveTrigger,
+    Object,
+    RotateTrigger,
+)
+from gd.api.transform import Transform
+from gd.enum_extensions import Enum
+from gd.typing import is_instance
+
+__all__ = ("ObjectTable", "ObjectTableView")
+
+ID_TYPE = "H"
+FLOAT_TYPE = "d"
+FLAGS_TYPE = "B"
+
+ID = "id"
+X = "x"
+Y = "y"
+ROTATION = "rotation"
+SCALE = "scale"
+GROUPS = "groups"
+
+X_OFFSET = "x_offset"
+Y_OFFSET = "y_offset"
+TARGET_ROTATION = "target_rotation"
+
+FLAG_BITS = {
+    "h_flipped": H_FLIPPED_BIT,
+    "v_flipped": V_FLIPPED_BIT,
+    "do_not_fade": DO_NOT_FADE_BIT,
+    "do_not_enter": DO_NOT_ENTER_BIT,
+    "group_parent": GROUP_PARENT_BIT,
+    "high_detail": HIGH_DETAIL_BIT,
+    "disable_glow": DISABLE_GLOW_BIT,
+    "special_checked": SPECIAL_CHECKED_BIT,
+}
+
+DENSE = frozenset((ID, X, Y, ROTATION, SCALE, GROUPS)).union(FLAG_BITS)
+
+IMMUTABLE = (bool, int, float, str, bytes, Enum)
+
+AnyObjectType = Type[Object]
+
+TYPE_TO_DEFAULTS: Dict[AnyObjectType, Dict[str, Any]] = {}
+
+
+def get_defaults(object_type: AnyObjectType) -> Dict[str, Any]:
+    """Returns the default values of attributes of `object_type`
+    that are not stored in dense columns.
+    """
+    defaults = TYPE_TO_DEFAULTS.get(object_type)
+
+    if defaults is None:
+        defaults = {}
+
+        for attribute in fields(object_type):
+            name = attribute.name
+
+            if not attribute.init or name in DENSE:
+                continue
+
+            default = attribute.default
+
+            if default is NOTHING:
+                continue
+
+            if is_instance(default, Factory):
+                default = default.factory()  # type: ignore
+
+            defaults[name] = default
+
+        TYPE_TO_DEFAULTS[object_type] = defaults
+
+    return defaults
+
+
+def copy_value(value: Any) -> Any:
+    return value if is_instance(value, IMMUTABLE) else copy(value)
+
+
+def compute_flags(object: Object) -> int:
+    flags = 0
+
+    for name, bit in FLAG_BITS.items():
+        if getattr(object, name):
+            flags |= bit
+
+    return flags
+
+
+def normalize_index(length: int, index: int) -> int:
+    return range(length)[index]
+
+
+T = TypeVar("T", bound="ObjectTable")
+
+
+@define()
+class ObjectTable(Sequence[Object]):
+    """The columnar (struct-of-arrays) storage of objects.
+
+    Ids, positions, rotations, scales and flags are stored in typed [`array`][array.array]
+    columns, which can be accessed without copying via [`memoryview`][memoryview].
+
+    Other attributes are stored in sparse side tables (mapping attribute names to
+    row indices to values) only if they differ from their defaults, and groups are stored
+    as tuples of group IDs.
+
+    [`Object`][gd.api.objects.Object] instances are only created on access;
+    modifying them does not affect the table, use `table[index] = object` to write them back.
+    """
+
+    ids: array[int] = field(factory=partial(array, ID_TYPE), repr=False)
+    xs: array[float] = field(factory=partial(array, FLOAT_TYPE), repr=False)
+    ys: array[float] = field(factory=partial(array, FLOAT_TYPE), repr=False)
+    rotations: array[float] = field(factory=partial(array, FLOAT_TYPE), repr=False)
+    scales: array[float] = field(factory=partial(array, FLOAT_TYPE), repr=False)
+    flags: array[int] = field(factory=partial(array, FLAGS_TYPE), repr=False)
+
+    types: Dict[int, AnyObjectType] = field(factory=dict, repr=False)
+    groups: Dict[int, Tuple[int, ...]] = field(factory=dict, repr=False)
+    attributes: Dict[str, Dict[int, Any]] = field(factory=dict, repr=False)
+
+    @classmethod
+    def from_objects(cls: Type[T], *objects: Object) -> T:
+        return cls.from_object_iterable(objects)
+
+    @classmethod
+    def from_object_iterable(cls: Type[T], objects: Iterable[Object]) -> T:
+        table = cls()
+
+        table.extend(objects)
+
+        return table
+
+    def to_objects(self) -> List[Object]:
+        return list(self)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @overload
+    def __getitem__(self, index: int) -> Object:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> ObjectTableView:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Object, ObjectTableView]:
+        if is_instance(index, int):
+            return self.materialize(normalize_index(len(self), index))
+
+        return ObjectTableView(self, range(len(self))[index])
+
+    def __setitem__(self, index: int, object: Object) -> None:
+        self.set(normalize_index(len(self), index), object)
+
+    def __iter__(self) -> Iterator[Object]:
+        materialize = self.materialize
+
+        for index in range(len(self)):
+            yield materialize(index)
+
+    def append(self, object: Object) -> None:
+        flags = compute_flags(object)
+
+        self.ids.append(object.id)
+        self.xs.append(object.x)
+        self.ys.append(object.y)
+        self.rotations.append(object.rotation)
+        self.scales.append(object.scale)
+        self.flags.append(flags)
+
+        self.set_sparse(len(self) - 1, object)
+
+    def extend(self, objects: Iterable[Object]) -> None:
+        append = self.append
+
+        for object in objects:
+            append(object)
+
+    def set(self, index: int, object: Object) -> None:
+        flags = compute_flags(object)
+
+        self.ids[index] = object.id
+        self.xs[index] = object.x
+        self.ys[index] = object.y
+        self.rotations[index] = object.rotation
+        self.scales[index] = object.scale
+        self.flags[index] = flags
+
+        self.clear_sparse(index)
+        self.set_sparse(index, object)
+
+    def clear_sparse(self, index: int) -> None:
+        self.types.pop(index, None)
+        self.groups.pop(index, None)
+
+        for values in self.attributes.values():
+            values.pop(index, None)
+
+    def set_sparse(self, index: int, object: Object) -> None:
+        object_type = type(object)
+
+        if object_type is not Object:
+            self.types[index] = object_type
+
+        groups = object.groups
+
+        if groups:
+            self.groups[index] = tuple(groups)
+
+        attributes = self.attributes
+
+        for name, default in get_defaults(object_type).items():
+            value = getattr(object, name)
+
+            if value != default:
+                values = attributes.get(name)
+
+                if values is None:
+                    values = attributes[name] = {}
+
+                values[index] = copy_value(value)
+
+    def get_type(self, index: int) -> AnyObjectType:
+        return self.types.get(index, Object)
+
+    def materialize(self, index: int) -> Object:
+        """Creates the [`Object`][gd.api.objects.Object] stored at the (non-negative) `index`."""
+        flags = self.flags[index]
+
+        arguments = {name: flags & bit == bit for name, bit in FLAG_BITS.items()}
+
+        arguments[ID] = self.ids[index]
+        arguments[X] = self.xs[index]
+        arguments[Y] = self.ys[index]
+        arguments[ROTATION] = self.rotations[index]
+        arguments[SCALE] = self.scales[index]
+
+        groups = self.groups.get(index)
+
+        if groups is not None:
+            arguments[GROUPS] = Groups(groups)
+
+        for name, values in self.attributes.items():
+            if index in values:
+                arguments[name] = copy_value(values[index])
+
+        return self.get_type(index)(**arguments)
+
+    def apply_transform(
+        self, transform: Transform, indices: Optional[Iterable[int]] = None
+    ) -> None:
+        """Applies the `transform` to objects at `indices` (or to all objects if
+        `indices` is [`None`][None]), operating on the columns directly.
+
+        See [`Transform.apply_to_objects`][gd.api.transform.Transform.apply_to_objects].
+        """
+        a, b, c = transform.a, transform.b, transform.c
+        d, e, f = transform.d, transform.e, transform.f
+
+        sign = transform.sign
+        angle = transform.angle
+        scale = transform.scale
+
+        flip_mask = 0
+
+        if transform.h_flip:
+            flip_mask |= H_FLIPPED_BIT
+
+        if transform.v_flip:
+            flip_mask |= V_FLIPPED_BIT
+
+        xs = self.xs
+        ys = self.ys
+        rotations = self.rotations
+        scales = self.scales
+        flags = self.flags
+
+        if indices is None:
+            xs[:], ys[:] = (
+                array(FLOAT_TYPE, [a * x + b * y + c for x, y in zip(xs, ys)]),
+                array(FLOAT_TYPE, [d * x + e * y + f for x, y in zip(xs, ys)]),
+            )
+
+            if transform.is_translation():
+                return
+
+            rotations[:] = array(FLOAT_TYPE, [sign * rotation + angle for rotation in rotations])
+
+            if scale != 1.0:
+                scales[:] = array(FLOAT_TYPE, [scale * value for value in scales])
+
+            if flip_mask:
+                flags[:] = array(FLAGS_TYPE, [value ^ flip_mask for value in flags])
+
+            selected: Iterable[int] = self.types
+
+        else:
+            selected = indices = list(indices)
+
+            translation = transform.is_translation()
+
+            for index in indices:
+                x = xs[index]
+                y = ys[index]
+
+                xs[index] = a * x + b * y + c
+                ys[index] = d * x + e * y + f
+
+                if translation:
+                    continue
+
+                rotations[index] = sign * rotations[index] + angle
+                scales[index] *= scale
+                flags[index] ^= flip_mask
+
+            if translation:
+                return
+
+        types = self.types
+        attributes = self.attributes
+
+        x_offsets = attributes.setdefault(X_OFFSET, {})
+        y_offsets = attributes.setdefault(Y_OFFSET, {})
+        target_rotations = attributes.setdefault(TARGET_ROTATION, {})
+
+        for index in selected:
+            object_type = types.get(index, Object)
+
+            if issubclass(object_type, MoveTrigger):
+                x_offset = x_offsets.pop(index, 0.0)
+                y_offset = y_offsets.pop(index, 0.0)
+
+                x_offset, y_offset = (a * x_offset + b * y_offset, d * x_offset + e * y_offset)
+
+                if x_offset:
+                    x_offsets[index] = x_offset
+
+                if y_offset:
+                    y_offsets[index] = y_offset
+
+            elif issubclass(object_type, RotateTrigger):
+                target_rotation = target_rotations.pop(index, 0.0) * sign
+
+                if target_rotation:
+                    target_rotations[index] = target_rotation
+
+        for name in (X_OFFSET, Y_OFFSET, TARGET_ROTATION):
+            if not attributes[name]:
+                del attributes[name]
+
+    def iter_indices_with_ids(self, *ids: int) -> Iterator[int]:
+        """Finds indices of objects with any of the `ids` by scanning the `ids` column only."""
+        ids_set = set(ids)
+
+        for index, id in enumerate(self.ids):
+            if id in ids_set:
+                yield index
+
+    def iter_indices_in_group(self, group: int) -> Iterator[int]:
+        for index, groups in self.groups.items():
+            if group in groups:
+                yield index
+
+
+@define()
+class ObjectTableView(Sequence[Object]):
+    """The view of the [`ObjectTable`][gd.api.object_table.ObjectTable] rows.
+
+    Views do not copy any data, objects are created on access.
+    """
+
+    table: ObjectTable = field()
+    indices: range = field()
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    @overload
+    def __getitem__(self, index: int) -> Object:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> ObjectTableView:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Object, ObjectTableView]:
+        if is_instance(index, int):
+            return self.table.materialize(self.indices[index])
+
+        return type(self)(self.table, self.indices[index])
+
+    def __iter__(self) -> Iterator[Object]:
+        materialize = self.table.materialize
+
+        for index in self.indices:
+            yield materialize(index)
@@ -1,14 +1,33 @@
-from io import BytesIO
-from typing import BinaryIO, Dict, Iterable, Mapping, Type, TypeVar
+from abc import abstractmethod
+from array import array
+from bisect import bisect_left
+from io import SEEK_END, BytesIO
+from typing import (
+    AbstractSet,
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableSet,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
-from attrs import define, field
-from typing_extensions import Literal, TypeGuard
+from attrs import Attribute, define, field
+from typing_extensions import Literal, Protocol, TypeGuard, runtime_checkable
 
 from gd.api.hsv import HSV
-from gd.api.ordered_set import OrderedSet
-from gd.binary import VERSION, Binary
-from gd.binary_constants import BITS
-from gd.binary_utils import Reader, Writer
+from gd.binary import VERSION, Binary, Buffer, BufferReader
+from gd.binary_constants import BITS, F32, U8, U16, U32
+from gd.binary_utils import Codec, Reader, Writer, get_array_codec
 from gd.color import Color
 from gd.constants import DEFAULT_ENCODING, DEFAULT_ERRORS, DEFAULT_ID, EMPTY
 from gd.encoding import decode_base64_string_url_safe, encode_base64_string_url_safe
@@ -21,6 +40,7 @@ from gd.enums import (
     MiscType,
     OrbType,
     PickupItemMode,
+    PickupItemType,
     PlayerColor,
     PortalType,
     PulseMode,
@@ -29,6 +49,7 @@ from gd.enums import (
     SpeedChangeType,
     TargetType,
     ToggleType,
+    TriggerType,
     ZLayer,
 )
 from gd.models import Model
@@ -44,9 +65,11 @@ from gd.models_utils import (
     split_object,
 )
 from gd.robtop import RobTop
+from gd.typing import Parse, get_name, is_instance
 
 __all__ = (
     "Groups",
+    "ObjectObserver",
     "Object",
     "AnimatedObject",
     "Orb",
@@ -77,6 +100,16 @@ __all__ = (
     "object_to_binary",
     "object_from_bytes",
     "object_to_bytes",
+    "objects_from_binary",
+    "objects_from_buffer",
+    "objects_to_binary",
+    "objects_to_buffer",
+    "object_from_robtop",
+    "object_from_robtop_reference",
+    "object_to_robtop",
+    "object_to_robtop_cached",
+    "objects_from_robtop",
+    "find_object_id",
 )
 
 GRID_UNITS = 30.0
@@ -155,21 +188,172 @@ DEFAULT_DISABLE_GLOW = False
 DEFAULT_SPECIAL_CHECKED = False
 
 
+GROUP_TYPE = "H"
+
+EMPTY_GROUPS = array(GROUP_TYPE)  # shared by all empty groups, never mutated
+
+EMPTY_GROUPS_REPRESENTATION = "{}()"
+GROUPS_REPRESENTATION = "{}({})"
+
+GROUP_NOT_IN_GROUPS = "group {!r} is not in the groups"
+
+
 G = TypeVar("G", bound="Groups")
 
 
-class Groups(RobTop, OrderedSet[int]):
+class Groups(RobTop, MutableSet[int]):
+    """The compact set of group IDs, which are stored in the sorted [`array`][array.array]
+    of unsigned 16-bit integers.
+
+    Empty groups share the same storage, which is replaced on the first addition.
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self, iterable: Iterable[int] = ()) -> None:
+        values = sorted(set(iterable))
+
+        self._values = array(GROUP_TYPE, values) if values else EMPTY_GROUPS
+
     @classmethod
     def from_robtop(cls: Type[G], string: str) -> G:
         return cls(map(int, split_groups(string)))
 
     def to_robtop(self) -> str:
-        return concat_groups(map(str, self))
+        return concat_groups(map(str, self._values))
 
     @classmethod
     def can_be_in(cls, string: str) -> bool:
         return GROUPS_SEPARATOR in string
 
+    @property
+    def values(self) -> "array[int]":
+        """The sorted array of group IDs; it should not be modified."""
+        return self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._values)
+
+    def __reversed__(self) -> Iterator[int]:
+        return reversed(self._values)
+
+    def __contains__(self, item: Any) -> bool:
+        values = self._values
+
+        try:
+            index = bisect_left(values, item)
+
+        except TypeError:  # not comparable with group IDs
+            return False
+
+        return index < len(values) and values[index] == item
+
+    @overload
+    def __getitem__(self, index: int) -> int:
+        ...
+
+    @overload
+    def __getitem__(self: G, index: slice) -> G:
+        ...
+
+    def __getitem__(self: G, index: Union[int, slice]) -> Union[int, G]:
+        if is_instance(index, slice):
+            return type(self)(self._values[index])
+
+        return self._values[index]
+
+    def __repr__(self) -> str:
+        name = get_name(type(self))
+
+        values = self._values
+
+        if not values:
+            return EMPTY_GROUPS_REPRESENTATION.format(name)
+
+        return GROUPS_REPRESENTATION.format(name, values.tolist())
+
+    def __eq__(self, other: Any) -> bool:
+        if is_instance(other, Groups):
+            return self._values == other._values
+
+        if is_instance(other, AbstractSet):
+            return len(self) == len(other) and all(item in other for item in self._values)
+
+        if is_instance(other, Iterable):
+            return set(self._values) == set(other)
+
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def copy(self: G) -> G:
+        groups = type(self).__new__(type(self))
+
+        values = self._values
+
+        groups._values = array(GROUP_TYPE, values) if values else EMPTY_GROUPS
+
+        return groups
+
+    def __copy__(self: G) -> G:
+        return self.copy()
+
+    def __deepcopy__(self: G, memo: Dict[int, Any]) -> G:
+        return self.copy()
+
+    def add(self, item: int) -> None:
+        values = self._values
+
+        index = bisect_left(values, item)
+
+        if index < len(values) and values[index] == item:
+            return
+
+        if values is EMPTY_GROUPS:
+            values = self._values = array(GROUP_TYPE)
+
+        values.insert(index, item)
+
+    def discard(self, item: int) -> None:
+        values = self._values
+
+        index = bisect_left(values, item)
+
+        if index < len(values) and values[index] == item:
+            del values[index]
+
+    def remove(self, item: int) -> None:
+        if item not in self:
+            raise KeyError(GROUP_NOT_IN_GROUPS.format(item))
+
+        self.discard(item)
+
+    def clear(self) -> None:
+        self._values = EMPTY_GROUPS
+
+    def update(self, iterable: Iterable[int]) -> None:
+        values = self._values
+
+        items = set(iterable).union(values)
+
+        if len(items) != len(values):
+            self._values = array(GROUP_TYPE, sorted(items))
+
+    def difference_update(self, iterable: Iterable[int]) -> None:
+        values = self._values
+
+        if not values:
+            return
+
+        items = set(iterable)
+
+        remaining = [value for value in values if value not in items]
+
+        self._values = array(GROUP_TYPE, remaining) if remaining else EMPTY_GROUPS
+
 
 ID = 1
 X = 2
@@ -198,10 +382,61 @@ SPECIAL_CHECKED = 13
 LINK_ID = 108
 
 
+OBJECT_PREFIX_CODEC = Codec(U8 + U16 + F32 + F32 + U8)  # flag, id, x, y, bits
+ROTATION_AND_SCALE_CODEC = Codec(F32 + F32)
+EDITOR_LAYERS_CODEC = Codec(U16 + U16)
+COLORS_CODEC = Codec(U16 + U16 + U32 + U32)  # color IDs and HSV values
+
+
 O = TypeVar("O", bound="Object")
 
+V = TypeVar("V")
+
+PRIVATE_PREFIX = "_"
+
+OBSERVER_ALREADY_ATTACHED = "object is already attached to another observer"
+
+
+def mark_dirty_on_setattr(object: "Object", attribute: "Attribute[V]", value: V) -> V:
+    name = attribute.name
+
+    if not name.startswith(PRIVATE_PREFIX):
+        object.mark_dirty()
 
-@define()
+        observer = object.observer
+
+        if observer is not None:
+            observer.on_set(object, name, value)
+
+    return value
+
+
+@runtime_checkable
+class ObjectObserver(Protocol):
+    """Represents observers that are notified when the objects they are attached to change."""
+
+    @abstractmethod
+    def on_move(self, object: "Object", x: float, y: float) -> None:
+        """Called after the `object` has been moved from `(x, y)`."""
+        ...
+
+    @abstractmethod
+    def on_add_groups(self, object: "Object", groups: Iterable[int]) -> None:
+        """Called after `groups` have been added to the `object`."""
+        ...
+
+    @abstractmethod
+    def on_remove_groups(self, object: "Object", groups: Iterable[int]) -> None:
+        """Called after `groups` have been removed from the `object`."""
+        ...
+
+    @abstractmethod
+    def on_set(self, object: "Object", name: str, value: Any) -> None:
+        """Called before the `name` attribute of the `object` is set to `value`."""
+        ...
+
+
+@define(on_setattr=mark_dirty_on_setattr)
 class Object(Model, Binary):
     id: int = field()
     x: float = field(default=DEFAULT_X)
@@ -241,6 +476,51 @@ class Object(Model, Binary):
 
     link_id: int = field(default=DEFAULT_ID)
 
+    _observer: Optional[ObjectObserver] = field(default=None, init=False, repr=False, eq=False)
+
+    _robtop: Optional[str] = field(default=None, init=False, repr=False, eq=False)
+
+    @property
+    def observer(self) -> Optional[ObjectObserver]:
+        return self._observer
+
+    def is_dirty(self) -> bool:
+        """Checks whether the object has changed since it was last serialized
+        by [`to_robtop_cached`][gd.api.objects.Object.to_robtop_cached].
+
+        Assigning attributes marks the object as dirty automatically; changing mutable
+        attributes in place (other than via [`add_groups`][gd.api.objects.Object.add_groups]
+        and [`remove_groups`][gd.api.objects.Object.remove_groups]) requires calling
+        [`mark_dirty`][gd.api.objects.Object.mark_dirty] explicitly.
+        """
+        return self._robtop is None
+
+    def mark_dirty(self) -> None:
+        self._robtop = None
+
+    def can_attach_observer(self, observer: ObjectObserver) -> bool:
+        current = self._observer
+
+        return current is None or current is observer
+
+    def attach_observer(self: O, observer: ObjectObserver) -> O:
+        """Attaches the `observer` to the object.
+
+        Objects can have only one observer at a time; attaching another one
+        while the current one is still attached raises [`ValueError`][ValueError].
+        """
+        if not self.can_attach_observer(observer):
+            raise ValueError(OBSERVER_ALREADY_ATTACHED)
+
+        self._observer = observer
+
+        return self
+
+    def detach_observer(self: O) -> O:
+        self._observer = None
+
+        return self
+
     @classmethod
     def from_binary(
         cls: Type[O], binary: BinaryIO, order: ByteOrder = ByteOrder.DEFAULT, version: int = VERSION
@@ -256,17 +536,10 @@ class Object(Model, Binary):
 
         reader = Reader(binary)
 
-        flag_value = reader.read_u8(order)
+        flag_value, id, x, y, value = reader.unpack(OBJECT_PREFIX_CODEC, order)
 
         flag = ObjectFlag(flag_value)
 
-        id = reader.read_u16(order)
-
-        x = reader.read_f32(order)
-        y = reader.read_f32(order)
-
-        value = reader.read_u8(order)
-
         h_flipped = value & h_flipped_bit == h_flipped_bit
         v_flipped = value & v_flipped_bit == v_flipped_bit
         do_not_fade = value & do_not_fade_bit == do_not_fade_bit
@@ -277,8 +550,7 @@ class Object(Model, Binary):
         special_checked = value & special_checked_bit == special_checked_bit
 
         if flag.has_rotation_and_scale():
-            rotation = reader.read_f32(order)
-            scale = reader.read_f32(order)
+            rotation, scale = reader.unpack(ROTATION_AND_SCALE_CODEC, order)
 
         else:
             rotation = DEFAULT_ROTATION
@@ -297,19 +569,22 @@ class Object(Model, Binary):
             z_order = 0
 
         if flag.has_editor_layer():
-            base_editor_layer = reader.read_u16(order)
-            additional_editor_layer = reader.read_u16(order)
+            base_editor_layer, additional_editor_layer = reader.unpack(EDITOR_LAYERS_CODEC, order)
 
         else:
             base_editor_layer = 0
             additional_editor_layer = 0
 
         if flag.has_colors():
-            base_color_id = reader.read_u16(order)
-            detail_color_id = reader.read_u16(order)
+            (
+                base_color_id,
+                detail_color_id,
+                base_color_hsv_value,
+                detail_color_hsv_value,
+            ) = reader.unpack(COLORS_CODEC, order)
 
-            base_color_hsv = HSV.from_binary(binary, order, version)
-            detail_color_hsv = HSV.from_binary(binary, order, version)
+            base_color_hsv = HSV.from_value(base_color_hsv_value)
+            detail_color_hsv = HSV.from_value(detail_color_hsv_value)
 
         else:
             base_color_id = 0
@@ -323,7 +598,7 @@ class Object(Model, Binary):
         if flag.has_groups():
             length = reader.read_u16(order)
 
-            groups = Groups(reader.read_u16(order) for _ in range(length))
+            groups = Groups(reader.unpack(get_array_codec(U16, length), order))
 
         else:
             groups = Groups()
@@ -409,13 +684,6 @@ class Object(Model, Binary):
         if link_id:
             flag |= ObjectFlag.HAS_LINK
 
-        writer.write_u8(flag.value, order)
-
-        writer.write_u16(self.id, order)
-
-        writer.write_f32(self.x, order)
-        writer.write_f32(self.y, order)
-
         value = 0
 
         if self.is_h_flipped():
@@ -442,11 +710,10 @@ class Object(Model, Binary):
         if self.is_special_checked():
             value |= SPECIAL_CHECKED_BIT
 
-        writer.write_u8(value, order)
+        writer.pack(OBJECT_PREFIX_CODEC, flag.value, self.id, self.x, self.y, value, order=order)
 
         if flag.has_rotation_and_scale():
-            writer.write_f32(self.rotation, order)
-            writer.write_f32(self.scale, order)
+            writer.pack(ROTATION_AND_SCALE_CODEC, rotation, scale, order=order)
 
         if flag.has_z():
             z_layer_order = z_order & Z_ORDER_MASK
@@ -455,21 +722,26 @@ class Object(Model, Binary):
             writer.write_u16(z_layer_order, order)
 
         if flag.has_editor_layer():
-            writer.write_u16(base_editor_layer, order)
-            writer.write_u16(additional_editor_layer, order)
+            writer.pack(
+                EDITOR_LAYERS_CODEC, base_editor_layer, additional_editor_layer, order=order
+            )
 
         if flag.has_colors():
-            writer.write_u16(base_color_id, order)
-            writer.write_u16(detail_color_id, order)
-
-            base_color_hsv.to_binary(binary, order, version)
-            detail_color_hsv.to_binary(binary, order, version)
+            writer.pack(
+                COLORS_CODEC,
+                base_color_id,
+                detail_color_id,
+                base_color_hsv.to_value(),
+                detail_color_hsv.to_value(),
+                order=order,
+            )
 
         if flag.has_groups():
-            writer.write_u16(len(groups), order)
+            length = len(groups)
+
+            writer.write_u16(length, order)
 
-            for group in sorted(groups):
-                writer.write_u16(group, order)
+            writer.pack(get_array_codec(U16, length), *groups.values, order=order)
 
         if flag.has_link():
             writer.write_u16(link_id, order)
@@ -553,6 +825,17 @@ class Object(Model, Binary):
     def to_robtop(self) -> str:
         return concat_object(self.to_robtop_mapping())
 
+    def to_robtop_cached(self) -> str:
+        """Same as [`to_robtop`][gd.api.objects.Object.to_robtop], except the result is cached
+        until the object is [marked dirty][gd.api.objects.Object.mark_dirty].
+        """
+        string = self._robtop
+
+        if string is None:
+            string = self._robtop = self.to_robtop()
+
+        return string
+
     def to_robtop_mapping(self) -> Dict[int, str]:
         mapping = {ID: str(self.id), X: float_str(self.x), Y: float_str(self.y)}
 
@@ -687,28 +970,56 @@ class Object(Model, Binary):
         return self.special_checked
 
     def add_groups(self: O, *groups: int) -> O:
-        self.groups.update(groups)
-
-        return self
+        return self.add_groups_from_iterable(groups)
 
     def add_groups_from_iterable(self: O, iterable: Iterable[int]) -> O:
-        self.groups.update(iterable)
+        self.mark_dirty()
 
-        return self
+        observer = self._observer
 
-    def remove_groups(self: O, *groups: int) -> O:
-        self.groups.difference_update(groups)
+        if observer is None:
+            self.groups.update(iterable)
+
+        else:
+            groups = tuple(iterable)
+
+            self.groups.update(groups)
+
+            observer.on_add_groups(self, groups)
 
         return self
 
+    def remove_groups(self: O, *groups: int) -> O:
+        return self.remove_groups_from_iterable(groups)
+
     def remove_groups_from_iterable(self: O, iterable: Iterable[int]) -> O:
-        self.groups.difference_update(iterable)
+        self.mark_dirty()
+
+        observer = self._observer
+
+        if observer is None:
+            self.groups.difference_update(iterable)
+
+        else:
+            groups = tuple(iterable)
+
+            self.groups.difference_update(groups)
+
+            observer.on_remove_groups(self, groups)
 
         return self
 
     def move(self: O, x: float = 0.0, y: float = 0.0) -> O:
-        self.x += x
-        self.y += y
+        old_x = self.x
+        old_y = self.y
+
+        self.x = old_x + x
+        self.y = old_y + y
+
+        observer = self._observer
+
+        if observer is not None:
+            observer.on_move(self, old_x, old_y)
 
         return self
 
@@ -766,7 +1077,7 @@ COIN_ID = 12
 SC = TypeVar("SC", bound="SecretCoin")
 
 
-@define()
+@define(on_setattr=mark_dirty_on_setattr)
 class SecretCoin(Object):
     coin_id: int = DEFAULT_ID
 
@@ -817,7 +1128,7 @@ CONTENT = 31
 S = TypeVar("S", bound="Text")
 
 
-@define()
+@define(on_setattr=mark_dirty_on_setattr)
 class Text(Object):
     content: str = EMPTY
 
@@ -892,7 +1203,7 @@ SMOOTH = 55
 P = TypeVar("P", bound="Teleport")
 
 
-@define()
+@define(on_setattr=mark_dirty_on_setattr)
 class Teleport(Object):
     portal_offset: float = DEFAULT_PORTAL_OFFSET
     smooth: bool = DEFAULT_SMOOTH
@@ -974,7 +1285,7 @@ ANIMATION_SPEED = 107
 AO = TypeVar("AO", bound="AnimatedObject")
 
 
-@define()
+@define(on_setattr=mark_dirty_on_setattr)
 class AnimatedObject(Object):
     randomize_start: bool = DEFAULT_RANDOMIZE_START
     animation_speed: float = DEFAULT_ANIMATION_SPEED
@@ -1022,7 +1333,7 @@ class AnimatedObject(Object):
 
     @classmethod
     def from_robtop_mapping(cls: Type[AO], mapping: Mapping[int, str]) -> AO:
-        animated_object = cls.from_robtop_mapping(mapping)
+        animated_object = super().from_robtop_mapping(mapping)
 
         randomize_start = parse_get_or(int_bool, DEFAULT_RANDOMIZE_START, mapping.get(RANDOMIZE_START))
 
@@ -1062,7 +1373,7 @@ DYNAMIC = 94
 CB = TypeVar("CB", bound="CollisionBlock")
 
 
-@define()
+@define(on_setattr=mark_dirty_on_setattr)
 class CollisionBlock(Object):
     block_id: int = DEFAULT_ID
     dynamic: bool = DEFAULT_DYNAMIC
@@ -1138,6 +1449,9 @@ class HasItem:
     item_id: int = DEFAULT_ID
 
 
+COUNT = 77
+
+
 DEFAULT_COUNT = 0
 
 
@@ -1146,6 +1460,9 @@ class HasCount:
     count: int = DEFAULT_COUNT
 
 
+TARGET_GROUP_ID = 51
+
+
 @define(slots=False)
 class HasTargetGroup:
     target_group_id: int = DEFAULT_ID
@@ -1154,6 +1471,9 @@ class HasTargetGroup:
         return True
 
 
+ADDITIONAL_GROUP_ID = 71
+
+
 @define(slots=False)
 class HasAdditionalGroup:
     additional_group_id: int = DEFAULT_ID
@@ -1162,6 +1482,9 @@ class HasAdditionalGroup:
         return True
 
 
+ACTIVATE_GROUP = 56
+
+
 DEFAULT_ACTIVATE_GROUP = False
 
 
@@ -1173,6 +1496,9 @@ class HasActivateGroup:
         return self.activate_group
 
 
+DURATION = 10
+
+
 DEFAULT_DURATION = 0.0
 
 
@@ -1189,6 +1515,10 @@ class HasDelay:
     delay: float = DEFAULT_DELAY
 
 
+EASING = 30
+EASING_RATE = 85
+
+
 DEFAULT_EASING_RATE = 2.0
 
 
@@ -1198,6 +1528,13 @@ class HasEasing:
     easing_rate: float = DEFAULT_EASING_RATE
 
 
+def easing_to_robtop_mapping(easing: Easing, easing_rate: float) -> Dict[int, str]:
+    if easing is Easing.NONE:
+        return {}
+
+    return {EASING: str(easing.value), EASING_RATE: float_str(easing_rate)}
+
+
 DEFAULT_MULTI_ACTIVATE = False
 
 
@@ -1209,11 +1546,32 @@ class HasMultiActivate:
         return self.multi_activate
 
 
+RED = 7
+GREEN = 8
+BLUE = 9
+
+
 @define(slots=False)
 class HasColor:
     color: Color = field(factory=Color.default)
 
 
+def parse_color(mapping: Mapping[int, str]) -> Color:
+    default = Color.default()
+
+    red = parse_get_or(int, default.red, mapping.get(RED))
+    green = parse_get_or(int, default.green, mapping.get(GREEN))
+    blue = parse_get_or(int, default.blue, mapping.get(BLUE))
+
+    return Color.from_rgb(red, green, blue)
+
+
+def color_to_robtop_mapping(color: Color) -> Dict[int, str]:
+    red, green, blue = color.to_rgb()
+
+    return {RED: str(red), GREEN: str(green), BLUE: str(blue)}
+
+
 MULTI_ACTIVATE_BIT = 0b00000010
 
 
@@ -1223,7 +1581,7 @@ ORB_MULTI_ACTIVATE = 99
 OP = TypeVar("OP", bound="Orb")
 
 
-@define()
+@define(on_setattr=mark_dirty_on_setattr)
 class Orb(HasMultiActivate, Object):
     @classmethod
     def from_binary(
@@ -1289,7 +1647,7 @@ ITEM_ID = 80
 IC = TypeVar("IC", bound="ItemCounter")
 
 
-@define()
+@define(on_setattr=mark_dirty_on_setattr)
 class ItemCounter(HasItem, Object):
     @classmethod
     def from_binary(
@@ -1338,10 +1696,13 @@ class ItemCounter(HasItem, Object):
         return mapping
 
 
+PICKUP_MODE = 79
+
+
 PI = TypeVar("PI", bound="PickupItem")
 
 
-@define()
+@define(on_setattr=mark_dirty_on_setattr)
 class PickupItem(HasTargetGroup, HasItem, Object):
     mode: PickupItemMode = PickupItemMode.DEFAULT
 
@@ -1383,6 +1744,39 @@ class PickupItem(HasTargetGroup, HasItem, Object):
 
         writer.write_u8(self.mode.value, order)
 
+    @classmethod
+    def from_robtop_mapping(cls: Type[PI], mapping: Mapping[int, str]) -> PI:
+        pickup_item = super().from_robtop_mapping(mapping)
+
+        target_group_id = parse_get_or(int, DEFAULT_ID, mapping.get(TARGET_GROUP_ID))
+        item_id = parse_get_or(int, DEFAULT_ID, mapping.get(ITEM_ID))
+
+        mode = parse_get_or(
+            partial_parse_enum(int, PickupItemMode),
+            PickupItemMode.DEFAULT,
+            mapping.get(PICKUP_MODE),
+        )
+
+        pickup_item.target_group_id = target_group_id
+        pickup_item.item_id = item_id
+
+        pickup_item.mode = mode
+
+        return pickup_item
+
+    def to_robtop_mapping(self) -> Dict[int, str]:
+        mapping = super().to_robtop_mapping()
+
+        mapping[TARGET_GROUP_ID] = str(self.target_group_id)
+        mapping[ITEM_ID] = str(self.item_id)
+
+        mode = self.mode
+
+        if mode is not PickupItemMode.DEFAULT:
+            mapping[PICKUP_MODE] = str(mode.value)
+
+        return mapping
+
 
 TOUCH_TRIGGERED_BIT = 0b00000001
 SPAWN_TRIGGERED_BIT = 0b00000010
@@ -1394,10 +1788,15 @@ DEFAULT_SPAWN_TRIGGERED = False
 DEFAULT_MULTI_TRIGGER = False
 
 
+TOUCH_TRIGGERED = 11
+SPAWN_TRIGGERED = 62
+MULTI_TRIGGER = 87
+
+
 T = TypeVar("T", bound="Trigger")
 
 
-@define()
+@define(on_setattr=mark_dirty_on_setattr)
 class Trigger(Object):
     touch_triggered: bool = DEFAULT_TOUCH_TRIGGERED
     spawn_triggered: bool = DEFAULT_SPAWN_TRIGGERED
@@ -1447,6 +1846,44 @@ class Trigger(Object):
 
         writer.write_u8(value, order)
 
+    @classmethod
+    def from_robtop_mapping(cls: Type[T], mapping: Mapping[int, str]) -> T:
+        trigger = super().from_robtop_mapping(mapping)
+
+        touch_triggered = parse_get_or(
+            int_bool, DEFAULT_TOUCH_TRIGGERED, mapping.get(TOUCH_TRIGGERED)
+        )
+        spawn_triggered = parse_get_or(
+            int_bool, DEFAULT_SPAWN_TRIGGERED, mapping.get(SPAWN_TRIGGERED)
+        )
+        multi_trigger = parse_get_or(int_bool, DEFAULT_MULTI_TRIGGER, mapping.get(MULTI_TRIGGER))
+
+        trigger.touch_triggered = touch_triggered
+        trigger.spawn_triggered = spawn_triggered
+        trigger.multi_trigger = multi_trigger
+
+        return trigger
+
+    def to_robtop_mapping(self) -> Dict[int, str]:
+        mapping = super().to_robtop_mapping()
+
+        touch_triggered = self.is_touch_triggered()
+
+        if touch_triggered:
+            mapping[TOUCH_TRIGGERED] = str(int(touch_triggered))
+
+        spawn_triggered = self.is_spawn_triggered()
+
+        if spawn_triggered:
+            mapping[SPAWN_TRIGGERED] = str(int(spawn_triggered))
+
+        multi_trigger = self.is_multi_trigger()
+
+        if multi_trigger:
+            mapping[MULTI_TRIGGER] = str(int(multi_trigger))
+
+        return mapping
+
     def is_trigger(self) -> Literal[True]:
         return True
 
@@ -1469,10 +1906,19 @@ DEFAULT_BLENDING = False
 DEFAULT_COPY_OPACITY = False
 
 
+BLENDING = 17
+TARGET_COLOR_ID = 23
+PLAYER_COLOR_1 = 15
+PLAYER_COLOR_2 = 16
+COPIED_COLOR_ID = 50
+COPIED_COLOR_HSV = 49
+COPY_OPACITY = 60
+
+
 CLT = TypeVar("CLT", bound="ColorTrigger")
 
 
-@define()
+@define(on_setattr=mark_dirty_on_setattr)
 class ColorTrigger(HasColor, HasDuration, Trigger):
     blending: bool = field(default=DEFAULT_BLENDING)
     target_color_id: int = field(default=DEFAULT_ID)
@@ -1577,14 +2023,105 @@ class ColorTrigger(HasColor, HasDuration, Trigger):
 
         self.copied_color_hsv.to_binary(binary, order, version)
 
+    @classmethod
+    def from_robtop_mapping(cls: Type[CLT], mapping: Mapping[int, str]) -> CLT:
+        color_trigger = super().from_robtop_mapping(mapping)
+
+        color = parse_color(mapping)
+
+        duration = parse_get_or(float, DEFAULT_DURATION, mapping.get(DURATION))
+
+        blending = parse_get_or(int_bool, DEFAULT_BLENDING, mapping.get(BLENDING))
+
+        target_color_id = parse_get_or(int, DEFAULT_ID, mapping.get(TARGET_COLOR_ID))
+
+        copied_color_id = parse_get_or(int, DEFAULT_ID, mapping.get(COPIED_COLOR_ID))
+        copied_color_hsv = parse_get_or(HSV.from_robtop, HSV(), mapping.get(COPIED_COLOR_HSV))
+
+        copy_opacity = parse_get_or(int_bool, DEFAULT_COPY_OPACITY, mapping.get(COPY_OPACITY))
+
+        player_color_1 = parse_get_or(int_bool, False, mapping.get(PLAYER_COLOR_1))
+        player_color_2 = parse_get_or(int_bool, False, mapping.get(PLAYER_COLOR_2))
+
+        if player_color_1 and player_color_2:
+            player_color = PlayerColor.NOT_USED
+
+        elif player_color_1:
+            player_color = PlayerColor.COLOR_1
+
+        elif player_color_2:
+            player_color = PlayerColor.COLOR_2
+
+        else:
+            player_color = PlayerColor.DEFAULT
+
+        color_trigger.color = color
+
+        color_trigger.duration = duration
+
+        color_trigger.blending = blending
+
+        color_trigger.target_color_id = target_color_id
+
+        color_trigger.copied_color_id = copied_color_id
+        color_trigger.copied_color_hsv = copied_color_hsv
+
+        color_trigger.copy_opacity = copy_opacity
+
+        color_trigger.player_color = player_color
+
+        return color_trigger
+
+    def to_robtop_mapping(self) -> Dict[int, str]:
+        mapping = super().to_robtop_mapping()
+
+        mapping.update(color_to_robtop_mapping(self.color))
+
+        mapping[DURATION] = float_str(self.duration)
+
+        blending = self.is_blending()
+
+        if blending:
+            mapping[BLENDING] = str(int(blending))
+
+        mapping[TARGET_COLOR_ID] = str(self.target_color_id)
+
+        copied_color_id = self.copied_color_id
+
+        if copied_color_id:
+            mapping[COPIED_COLOR_ID] = str(copied_color_id)
+
+            mapping[COPIED_COLOR_HSV] = self.copied_color_hsv.to_robtop()
+
+        copy_opacity = self.is_copy_opacity()
+
+        if copy_opacity:
+            mapping[COPY_OPACITY] = str(int(copy_opacity))
+
+        player_color = self.player_color
+
+        # unused player colors set both flags, just like both bits are set in the binary format
+        not_used = player_color.is_not_used()
+
+        if not_used or player_color is PlayerColor.COLOR_1:
+            mapping[PLAYER_COLOR_1] = str(int(True))
+
+        if not_used or player_color is PlayerColor.COLOR_2:
+            mapping[PLAYER_COLOR_2] = str(int(True))
+
+        return mapping
+
 
 DEFAULT_OPACITY = 1.0
 
 
+OPACITY = 35
+
+
 ALT = TypeVar("ALT", bound="AlphaTrigger")
 
 
-@define()
+@define(on_setattr=mark_dirty_on_setattr)
 class AlphaTrigger(HasTargetGroup, HasDuration, Trigger):
     opacity: float = DEFAULT_OPACITY
 
@@ -1622,14 +2159,43 @@ class AlphaTrigger(HasTargetGroup, HasDuration, Trigger):
         writer.write_u16(self.target_group_id, order)
         writer.write_f32(self.opacity, order)
 
+    @classmethod
+    def from_robtop_mapping(cls: Type[ALT], mapping: Mapping[int, str]) -> ALT:
+        alpha_trigger = super().from_robtop_mapping(mapping)
 
-PULSE_TARGET_TYPE_BIT = 0b00000001
-PULSE_TYPE_MASK = 0b00000110
-PULSE_MODE_BIT = 0b00001000
-EXCLUSIVE_BIT = 0b00010000
+        target_group_id = parse_get_or(int, DEFAULT_ID, mapping.get(TARGET_GROUP_ID))
 
-PULSE_TYPE_SHIFT = PULSE_TARGET_TYPE_BIT.bit_length()
-PULSE_MODE_SHIFT = PULSE_TYPE_MASK.bit_length()
+        duration = parse_get_or(float, DEFAULT_DURATION, mapping.get(DURATION))
+
+        opacity = parse_get_or(float, DEFAULT_OPACITY, mapping.get(OPACITY))
+
+        alpha_trigger.target_group_id = target_group_id
+
+        alpha_trigger.duration = duration
+
+        alpha_trigger.opacity = opacity
+
+        return alpha_trigger
+
+    def to_robtop_mapping(self) -> Dict[int, str]:
+        mapping = super().to_robtop_mapping()
+
+        mapping[TARGET_GROUP_ID] = str(self.target_group_id)
+
+        mapping[DURATION] = float_str(self.duration)
+
+        mapping[OPACITY] = float_str(self.opacity)
+
+        return mapping
+
+
+PULSE_TARGET_TYPE_BIT = 0b00000001
+PULSE_TYPE_MASK = 0b00000110
+PULSE_MODE_BIT = 0b00001000
+EXCLUSIVE_BIT = 0b00010000
+
+PULSE_TYPE_SHIFT = PULSE_TARGET_TYPE_BIT.bit_length()
+PULSE_MODE_SHIFT = PULSE_TYPE_MASK.bit_length()
 
 
 DEFAULT_FADE_IN = 0.0
@@ -1639,10 +2205,21 @@ DEFAULT_FADE_OUT = 0.0
 DEFAULT_EXCLUSIVE = False
 
 
+FADE_IN = 45
+HOLD = 46
+FADE_OUT = 47
+PULSE_MODE = 48
+PULSE_HSV = 49
+PULSE_TARGET_TYPE = 52
+MAIN_ONLY = 65
+DETAIL_ONLY = 66
+EXCLUSIVE = 86
+
+
 PLT = TypeVar("PLT", bound="PulseTrigger")
 
 
-@define()
+@define(on_setattr=mark_dirty_on_setattr)
 class PulseTrigger(Trigger):
     fade_in: float = field(default=DEFAULT_FADE_IN)
     hold: float = field(default=DEFAULT_HOLD)
@@ -1735,6 +2312,87 @@ class PulseTrigger(Trigger):
 
         self.hsv.to_binary(binary, order, version)
 
+    @classmethod
+    def from_robtop_mapping(cls: Type[PLT], mapping: Mapping[int, str]) -> PLT:
+        pulse_trigger = super().from_robtop_mapping(mapping)
+
+        fade_in = parse_get_or(float, DEFAULT_FADE_IN, mapping.get(FADE_IN))
+        hold = parse_get_or(float, DEFAULT_HOLD, mapping.get(HOLD))
+        fade_out = parse_get_or(float, DEFAULT_FADE_OUT, mapping.get(FADE_OUT))
+
+        color = parse_color(mapping)
+
+        hsv = parse_get_or(HSV.from_robtop, HSV(), mapping.get(PULSE_HSV))
+
+        target_type = parse_get_or(
+            partial_parse_enum(int, PulseTargetType),
+            PulseTargetType.DEFAULT,
+            mapping.get(PULSE_TARGET_TYPE),
+        )
+
+        if parse_get_or(int_bool, False, mapping.get(MAIN_ONLY)):
+            type = PulseType.MAIN
+
+        elif parse_get_or(int_bool, False, mapping.get(DETAIL_ONLY)):
+            type = PulseType.DETAIL
+
+        else:
+            type = PulseType.BOTH
+
+        mode = parse_get_or(
+            partial_parse_enum(int, PulseMode), PulseMode.DEFAULT, mapping.get(PULSE_MODE)
+        )
+
+        exclusive = parse_get_or(int_bool, DEFAULT_EXCLUSIVE, mapping.get(EXCLUSIVE))
+
+        pulse_trigger.fade_in = fade_in
+        pulse_trigger.hold = hold
+        pulse_trigger.fade_out = fade_out
+
+        pulse_trigger.color = color
+        pulse_trigger.hsv = hsv
+
+        pulse_trigger.target_type = target_type
+        pulse_trigger.type = type
+        pulse_trigger.mode = mode
+
+        pulse_trigger.exclusive = exclusive
+
+        return pulse_trigger
+
+    def to_robtop_mapping(self) -> Dict[int, str]:
+        mapping = super().to_robtop_mapping()
+
+        mapping[FADE_IN] = float_str(self.fade_in)
+        mapping[HOLD] = float_str(self.hold)
+        mapping[FADE_OUT] = float_str(self.fade_out)
+
+        mapping.update(color_to_robtop_mapping(self.color))
+
+        mode = self.mode
+
+        mapping[PULSE_MODE] = str(mode.value)
+
+        if mode is PulseMode.HSV:
+            mapping[PULSE_HSV] = self.hsv.to_robtop()
+
+        mapping[PULSE_TARGET_TYPE] = str(self.target_type.value)
+
+        type = self.type
+
+        if type is PulseType.MAIN:
+            mapping[MAIN_ONLY] = str(int(True))
+
+        if type is PulseType.DETAIL:
+            mapping[DETAIL_ONLY] = str(int(True))
+
+        exclusive = self.is_exclusive()
+
+        if exclusive:
+            mapping[EXCLUSIVE] = str(int(exclusive))
+
+        return mapping
+
 
 TARGET_TYPE_MASK = 0b00000011
 LOCKED_TO_PLAYER_X_BIT = 0b00000100
@@ -1748,10 +2406,30 @@ DEFAULT_LOCKED_TO_PLAYER_X = False
 DEFAULT_LOCKED_TO_PLAYER_Y = False
 
 
+X_OFFSET = 28
+Y_OFFSET = 29
+LOCKED_TO_PLAYER_X = 58
+LOCKED_TO_PLAYER_Y = 59
+USE_TARGET = 100
+MOVE_TARGET_MODE = 101
+
+
+DEFAULT_MOVE_TARGET_MODE = 0
+
+
+MOVE_TARGET_MODE_TO_TARGET_TYPE = {0: TargetType.BOTH, 1: TargetType.X, 2: TargetType.Y}
+
+DEFAULT_MOVE_TARGET_TYPE = MOVE_TARGET_MODE_TO_TARGET_TYPE[DEFAULT_MOVE_TARGET_MODE]
+
+TARGET_TYPE_TO_MOVE_TARGET_MODE = {
+    target_type: mode for mode, target_type in MOVE_TARGET_MODE_TO_TARGET_TYPE.items()
+}
+
+
 MT = TypeVar("MT", bound="MoveTrigger")
 
 
-@define()
+@define(on_setattr=mark_dirty_on_setattr)
 class MoveTrigger(HasTargetGroup, HasEasing, HasDuration, Trigger):
     x_offset: float = DEFAULT_X_OFFSET
     y_offset: float = DEFAULT_Y_OFFSET
@@ -1841,6 +2519,86 @@ class MoveTrigger(HasTargetGroup, HasEasing, HasDuration, Trigger):
 
         writer.write_u8(value, order)
 
+    @classmethod
+    def from_robtop_mapping(cls: Type[MT], mapping: Mapping[int, str]) -> MT:
+        move_trigger = super().from_robtop_mapping(mapping)
+
+        target_group_id = parse_get_or(int, DEFAULT_ID, mapping.get(TARGET_GROUP_ID))
+
+        duration = parse_get_or(float, DEFAULT_DURATION, mapping.get(DURATION))
+
+        easing = parse_get_or(partial_parse_enum(int, Easing), Easing.DEFAULT, mapping.get(EASING))
+        easing_rate = parse_get_or(float, DEFAULT_EASING_RATE, mapping.get(EASING_RATE))
+
+        x_offset = parse_get_or(float, DEFAULT_X_OFFSET, mapping.get(X_OFFSET))
+        y_offset = parse_get_or(float, DEFAULT_Y_OFFSET, mapping.get(Y_OFFSET))
+
+        locked_to_player_x = parse_get_or(
+            int_bool, DEFAULT_LOCKED_TO_PLAYER_X, mapping.get(LOCKED_TO_PLAYER_X)
+        )
+        locked_to_player_y = parse_get_or(
+            int_bool, DEFAULT_LOCKED_TO_PLAYER_Y, mapping.get(LOCKED_TO_PLAYER_Y)
+        )
+
+        if parse_get_or(int_bool, False, mapping.get(USE_TARGET)):
+            move_target_mode = parse_get_or(
+                int, DEFAULT_MOVE_TARGET_MODE, mapping.get(MOVE_TARGET_MODE)
+            )
+
+            target_type = MOVE_TARGET_MODE_TO_TARGET_TYPE.get(
+                move_target_mode, DEFAULT_MOVE_TARGET_TYPE
+            )
+
+        else:
+            target_type = TargetType.NONE
+
+        move_trigger.target_group_id = target_group_id
+
+        move_trigger.duration = duration
+
+        move_trigger.easing = easing
+        move_trigger.easing_rate = easing_rate
+
+        move_trigger.x_offset = x_offset
+        move_trigger.y_offset = y_offset
+
+        move_trigger.locked_to_player_x = locked_to_player_x
+        move_trigger.locked_to_player_y = locked_to_player_y
+
+        move_trigger.target_type = target_type
+
+        return move_trigger
+
+    def to_robtop_mapping(self) -> Dict[int, str]:
+        mapping = super().to_robtop_mapping()
+
+        mapping[TARGET_GROUP_ID] = str(self.target_group_id)
+
+        mapping[DURATION] = float_str(self.duration)
+
+        mapping.update(easing_to_robtop_mapping(self.easing, self.easing_rate))
+
+        mapping[X_OFFSET] = float_str(self.x_offset)
+        mapping[Y_OFFSET] = float_str(self.y_offset)
+
+        locked_to_player_x = self.is_locked_to_player_x()
+
+        if locked_to_player_x:
+            mapping[LOCKED_TO_PLAYER_X] = str(int(locked_to_player_x))
+
+        locked_to_player_y = self.is_locked_to_player_y()
+
+        if locked_to_player_y:
+            mapping[LOCKED_TO_PLAYER_Y] = str(int(locked_to_player_y))
+
+        target_type = self.target_type
+
+        if target_type is not TargetType.NONE:
+            mapping[USE_TARGET] = str(int(True))
+            mapping[MOVE_TARGET_MODE] = str(TARGET_TYPE_TO_MOVE_TARGET_MODE[target_type])
+
+        return mapping
+
     def is_locked_to_player_x(self) -> bool:
         return self.locked_to_player_x
 
@@ -1880,10 +2638,14 @@ EDITOR_DISABLE_BIT = 0b00000001
 DEFAULT_EDITOR_DISABLE = False
 
 
+SPAWN_DELAY = 63
+EDITOR_DISABLE = 102
+
+
 SPT = TypeVar("SPT", bound="SpawnTrigger")
 
 
-@define()
+@define(on_setattr=mark_dirty_on_setattr)
 class SpawnTrigger(HasDelay, HasTargetGroup, Trigger):
     editor_disable: bool = DEFAULT_EDITOR_DISABLE
 
@@ -1934,6 +2696,38 @@ class SpawnTrigger(HasDelay, HasTargetGroup, Trigger):
 
         writer.write_u8(value, order)
 
+    @classmethod
+    def from_robtop_mapping(cls: Type[SPT], mapping: Mapping[int, str]) -> SPT:
+        spawn_trigger = super().from_robtop_mapping(mapping)
+
+        target_group_id = parse_get_or(int, DEFAULT_ID, mapping.get(TARGET_GROUP_ID))
+
+        delay = parse_get_or(float, DEFAULT_DELAY, mapping.get(SPAWN_DELAY))
+
+        editor_disable = parse_get_or(int_bool, DEFAULT_EDITOR_DISABLE, mapping.get(EDITOR_DISABLE))
+
+        spawn_trigger.target_group_id = target_group_id
+
+        spawn_trigger.delay = delay
+
+        spawn_trigger.editor_disable = editor_disable
+
+        return spawn_trigger
+
+    def to_robtop_mapping(self) -> Dict[int, str]:
+        mapping = super().to_robtop_mapping()
+
+        mapping[TARGET_GROUP_ID] = str(self.target_group_id)
+
+        mapping[SPAWN_DELAY] = float_str(self.delay)
+
+        editor_disable = self.is_editor_disable()
+
+        if editor_disable:
+            mapping[EDITOR_DISABLE] = str(int(editor_disable))
+
+        return mapping
+
     def is_editor_disable(self) -> bool:
         return self.editor_disable
 
@@ -1941,7 +2735,7 @@ class SpawnTrigger(HasDelay, HasTargetGroup, Trigger):
 ST = TypeVar("ST", bound="StopTrigger")
 
 
-@define()
+@define(on_setattr=mark_dirty_on_setattr)
 class StopTrigger(HasTargetGroup, Trigger):
     @classmethod
     def from_binary(
@@ -1969,6 +2763,23 @@ class StopTrigger(HasTargetGroup, Trigger):
 
         writer.write_u16(self.target_group_id, order)
 
+    @classmethod
+    def from_robtop_mapping(cls: Type[ST], mapping: Mapping[int, str]) -> ST:
+        stop_trigger = super().from_robtop_mapping(mapping)
+
+        target_group_id = parse_get_or(int, DEFAULT_ID, mapping.get(TARGET_GROUP_ID))
+
+        stop_trigger.target_group_id = target_group_id
+
+        return stop_trigger
+
+    def to_robtop_mapping(self) -> Dict[int, str]:
+        mapping = super().to_robtop_mapping()
+
+        mapping[TARGET_GROUP_ID] = str(self.target_group_id)
+
+        return mapping
+
 
 TOGGLED_BIT = 0b10000000
 ACTIVATE_GROUP_BIT = 0b00000001
@@ -1977,10 +2788,14 @@ ACTIVATE_GROUP_BIT = 0b00000001
 DEFAULT_TOGGLED = False
 
 
+# the game does not store this flag, so the key is outside of the range it uses
+TOGGLED = 1000
+
+
 TT = TypeVar("TT", bound="ToggleTrigger")
 
 
-@define()
+@define(on_setattr=mark_dirty_on_setattr)
 class ToggleTrigger(HasActivateGroup, HasTargetGroup, Trigger):
     toggled: bool = DEFAULT_TOGGLED
 
@@ -2033,6 +2848,41 @@ class ToggleTrigger(HasActivateGroup, HasTargetGroup, Trigger):
 
         writer.write_u8(value, order)
 
+    @classmethod
+    def from_robtop_mapping(cls: Type[TT], mapping: Mapping[int, str]) -> TT:
+        toggle_trigger = super().from_robtop_mapping(mapping)
+
+        target_group_id = parse_get_or(int, DEFAULT_ID, mapping.get(TARGET_GROUP_ID))
+
+        activate_group = parse_get_or(int_bool, DEFAULT_ACTIVATE_GROUP, mapping.get(ACTIVATE_GROUP))
+
+        toggled = parse_get_or(int_bool, DEFAULT_TOGGLED, mapping.get(TOGGLED))
+
+        toggle_trigger.target_group_id = target_group_id
+
+        toggle_trigger.activate_group = activate_group
+
+        toggle_trigger.toggled = toggled
+
+        return toggle_trigger
+
+    def to_robtop_mapping(self) -> Dict[int, str]:
+        mapping = super().to_robtop_mapping()
+
+        mapping[TARGET_GROUP_ID] = str(self.target_group_id)
+
+        activate_group = self.is_activate_group()
+
+        if activate_group:
+            mapping[ACTIVATE_GROUP] = str(int(activate_group))
+
+        toggled = self.is_toggled()
+
+        if toggled:
+            mapping[TOGGLED] = str(int(toggled))
+
+        return mapping
+
     def is_toggled(self) -> bool:
         return self.toggled
 
@@ -2049,10 +2899,21 @@ DEFAULT_TARGET_ROTATION = 0.0
 DEFAULT_ROTATION_LOCKED = False
 
 
+DEGREES = 68
+TIMES = 69
+ROTATION_LOCKED = 70
+
+
+DEFAULT_TIMES = 0
+
+
+FULL_ROTATION = 360.0
+
+
 RT = TypeVar("RT", bound="RotateTrigger")
 
 
-@define()
+@define(on_setattr=mark_dirty_on_setattr)
 class RotateTrigger(HasEasing, HasAdditionalGroup, HasTargetGroup, HasDuration, Trigger):
     target_rotation: float = DEFAULT_TARGET_ROTATION
     rotation_locked: bool = DEFAULT_ROTATION_LOCKED
@@ -2125,6 +2986,65 @@ class RotateTrigger(HasEasing, HasAdditionalGroup, HasTargetGroup, HasDuration,
 
         writer.write_u8(value, order)
 
+    @classmethod
+    def from_robtop_mapping(cls: Type[RT], mapping: Mapping[int, str]) -> RT:
+        rotate_trigger = super().from_robtop_mapping(mapping)
+
+        target_group_id = parse_get_or(int, DEFAULT_ID, mapping.get(TARGET_GROUP_ID))
+        additional_group_id = parse_get_or(int, DEFAULT_ID, mapping.get(ADDITIONAL_GROUP_ID))
+
+        duration = parse_get_or(float, DEFAULT_DURATION, mapping.get(DURATION))
+
+        easing = parse_get_or(partial_parse_enum(int, Easing), Easing.DEFAULT, mapping.get(EASING))
+        easing_rate = parse_get_or(float, DEFAULT_EASING_RATE, mapping.get(EASING_RATE))
+
+        degrees = parse_get_or(float, DEFAULT_TARGET_ROTATION, mapping.get(DEGREES))
+        times = parse_get_or(int, DEFAULT_TIMES, mapping.get(TIMES))
+
+        rotation_locked = parse_get_or(
+            int_bool, DEFAULT_ROTATION_LOCKED, mapping.get(ROTATION_LOCKED)
+        )
+
+        rotate_trigger.target_group_id = target_group_id
+        rotate_trigger.additional_group_id = additional_group_id
+
+        rotate_trigger.duration = duration
+
+        rotate_trigger.easing = easing
+        rotate_trigger.easing_rate = easing_rate
+
+        rotate_trigger.target_rotation = times * FULL_ROTATION + degrees
+
+        rotate_trigger.rotation_locked = rotation_locked
+
+        return rotate_trigger
+
+    def to_robtop_mapping(self) -> Dict[int, str]:
+        mapping = super().to_robtop_mapping()
+
+        mapping[TARGET_GROUP_ID] = str(self.target_group_id)
+        mapping[ADDITIONAL_GROUP_ID] = str(self.additional_group_id)
+
+        mapping[DURATION] = float_str(self.duration)
+
+        mapping.update(easing_to_robtop_mapping(self.easing, self.easing_rate))
+
+        target_rotation = self.target_rotation
+
+        times = int(target_rotation / FULL_ROTATION)  # truncate towards zero
+
+        mapping[DEGREES] = float_str(target_rotation - times * FULL_ROTATION)
+
+        if times:
+            mapping[TIMES] = str(times)
+
+        rotation_locked = self.is_rotation_locked()
+
+        if rotation_locked:
+            mapping[ROTATION_LOCKED] = str(int(rotation_locked))
+
+        return mapping
+
     def target_rotate(self: RT, angle: float) -> RT:
         self.target_rotation += angle
 
@@ -2148,10 +3068,14 @@ DEFAULT_X_MODIFIER = 1.0
 DEFAULT_Y_MODIFIER = 1.0
 
 
+X_MODIFIER = 72
+Y_MODIFIER = 73
+
+
 FT = TypeVar("FT", bound="FollowTrigger")
 
 
-@define()
+@define(on_setattr=mark_dirty_on_setattr)
 class FollowTrigger(HasEasing, HasAdditionalGroup, HasTargetGroup, HasDuration, Trigger):
     x_modifier: float = DEFAULT_X_MODIFIER
     y_modifier: float = DEFAULT_Y_MODIFIER
@@ -2212,33 +3136,80 @@ class FollowTrigger(HasEasing, HasAdditionalGroup, HasTargetGroup, HasDuration,
         writer.write_f32(self.x_modifier, order)
         writer.write_f32(self.y_modifier, order)
 
+    @classmethod
+    def from_robtop_mapping(cls: Type[FT], mapping: Mapping[int, str]) -> FT:
+        follow_trigger = super().from_robtop_mapping(mapping)
 
-DEFAULT_STRENGTH = 0.0
-DEFAULT_INTERVAL = 0.0
+        target_group_id = parse_get_or(int, DEFAULT_ID, mapping.get(TARGET_GROUP_ID))
+        additional_group_id = parse_get_or(int, DEFAULT_ID, mapping.get(ADDITIONAL_GROUP_ID))
 
+        duration = parse_get_or(float, DEFAULT_DURATION, mapping.get(DURATION))
 
-SHT = TypeVar("SHT", bound="ShakeTrigger")
+        easing = parse_get_or(partial_parse_enum(int, Easing), Easing.DEFAULT, mapping.get(EASING))
+        easing_rate = parse_get_or(float, DEFAULT_EASING_RATE, mapping.get(EASING_RATE))
 
+        x_modifier = parse_get_or(float, DEFAULT_X_MODIFIER, mapping.get(X_MODIFIER))
+        y_modifier = parse_get_or(float, DEFAULT_Y_MODIFIER, mapping.get(Y_MODIFIER))
 
-@define()
-class ShakeTrigger(HasDuration, Trigger):
-    strength: float = DEFAULT_STRENGTH
-    interval: float = DEFAULT_INTERVAL
+        follow_trigger.target_group_id = target_group_id
+        follow_trigger.additional_group_id = additional_group_id
 
-    @classmethod
-    def from_binary(
-        cls: Type[SHT],
-        binary: BinaryIO,
-        order: ByteOrder = ByteOrder.DEFAULT,
-        version: int = VERSION,
-    ) -> SHT:
-        shake_trigger = super().from_binary(binary, order, version)
+        follow_trigger.duration = duration
 
-        reader = Reader(binary)
+        follow_trigger.easing = easing
+        follow_trigger.easing_rate = easing_rate
+
+        follow_trigger.x_modifier = x_modifier
+        follow_trigger.y_modifier = y_modifier
+
+        return follow_trigger
+
+    def to_robtop_mapping(self) -> Dict[int, str]:
+        mapping = super().to_robtop_mapping()
+
+        mapping[TARGET_GROUP_ID] = str(self.target_group_id)
+        mapping[ADDITIONAL_GROUP_ID] = str(self.additional_group_id)
+
+        mapping[DURATION] = float_str(self.duration)
+
+        mapping.update(easing_to_robtop_mapping(self.easing, self.easing_rate))
+
+        mapping[X_MODIFIER] = float_str(self.x_modifier)
+        mapping[Y_MODIFIER] = float_str(self.y_modifier)
+
+        return mapping
+
+
+DEFAULT_STRENGTH = 0.0
+DEFAULT_INTERVAL = 0.0
+
+
+STRENGTH = 75
+INTERVAL = 84
+
+
+SHT = TypeVar("SHT", bound="ShakeTrigger")
 
-        duration = reader.read_f32(order)
-        strength = reader.read_f32(order)
-        interval = reader.read_f32(order)
+
+@define(on_setattr=mark_dirty_on_setattr)
+class ShakeTrigger(HasDuration, Trigger):
+    strength: float = DEFAULT_STRENGTH
+    interval: float = DEFAULT_INTERVAL
+
+    @classmethod
+    def from_binary(
+        cls: Type[SHT],
+        binary: BinaryIO,
+        order: ByteOrder = ByteOrder.DEFAULT,
+        version: int = VERSION,
+    ) -> SHT:
+        shake_trigger = super().from_binary(binary, order, version)
+
+        reader = Reader(binary)
+
+        duration = reader.read_f32(order)
+        strength = reader.read_f32(order)
+        interval = reader.read_f32(order)
 
         shake_trigger.duration = duration
         shake_trigger.strength = strength
@@ -2257,11 +3228,40 @@ class ShakeTrigger(HasDuration, Trigger):
         writer.write_f32(self.strength, order)
         writer.write_f32(self.interval, order)
 
+    @classmethod
+    def from_robtop_mapping(cls: Type[SHT], mapping: Mapping[int, str]) -> SHT:
+        shake_trigger = super().from_robtop_mapping(mapping)
+
+        duration = parse_get_or(float, DEFAULT_DURATION, mapping.get(DURATION))
+
+        strength = parse_get_or(float, DEFAULT_STRENGTH, mapping.get(STRENGTH))
+        interval = parse_get_or(float, DEFAULT_INTERVAL, mapping.get(INTERVAL))
+
+        shake_trigger.duration = duration
+
+        shake_trigger.strength = strength
+        shake_trigger.interval = interval
+
+        return shake_trigger
+
+    def to_robtop_mapping(self) -> Dict[int, str]:
+        mapping = super().to_robtop_mapping()
+
+        mapping[DURATION] = float_str(self.duration)
+
+        mapping[STRENGTH] = float_str(self.strength)
+        mapping[INTERVAL] = float_str(self.interval)
+
+        return mapping
+
+
+ANIMATION_ID = 76
+
 
 AT = TypeVar("AT", bound="AnimateTrigger")
 
 
-@define()
+@define(on_setattr=mark_dirty_on_setattr)
 class AnimateTrigger(HasTargetGroup, Trigger):
     animation_id: int = DEFAULT_ID
 
@@ -2297,6 +3297,28 @@ class AnimateTrigger(HasTargetGroup, Trigger):
 
         writer.write_u8(self.animation_id, order)
 
+    @classmethod
+    def from_robtop_mapping(cls: Type[AT], mapping: Mapping[int, str]) -> AT:
+        animate_trigger = super().from_robtop_mapping(mapping)
+
+        target_group_id = parse_get_or(int, DEFAULT_ID, mapping.get(TARGET_GROUP_ID))
+
+        animation_id = parse_get_or(int, DEFAULT_ID, mapping.get(ANIMATION_ID))
+
+        animate_trigger.target_group_id = target_group_id
+
+        animate_trigger.animation_id = animation_id
+
+        return animate_trigger
+
+    def to_robtop_mapping(self) -> Dict[int, str]:
+        mapping = super().to_robtop_mapping()
+
+        mapping[TARGET_GROUP_ID] = str(self.target_group_id)
+
+        mapping[ANIMATION_ID] = str(self.animation_id)
+
+        return mapping
 
 
 TOGGLE_TYPE_MASK = 0b00000011
@@ -2308,10 +3330,15 @@ DEFAULT_HOLD_MODE = False
 DEFAULT_DUAL_MODE = False
 
 
+HOLD_MODE = 81
+TOGGLE_TYPE = 82
+DUAL_MODE = 89
+
+
 THT = TypeVar("THT", bound="TouchTrigger")
 
 
-@define()
+@define(on_setattr=mark_dirty_on_setattr)
 class TouchTrigger(HasTargetGroup, Trigger):
     hold_mode: bool = DEFAULT_HOLD_MODE
     dual_mode: bool = DEFAULT_DUAL_MODE
@@ -2370,6 +3397,50 @@ class TouchTrigger(HasTargetGroup, Trigger):
 
         writer.write_u8(value, order)
 
+    @classmethod
+    def from_robtop_mapping(cls: Type[THT], mapping: Mapping[int, str]) -> THT:
+        touch_trigger = super().from_robtop_mapping(mapping)
+
+        target_group_id = parse_get_or(int, DEFAULT_ID, mapping.get(TARGET_GROUP_ID))
+
+        hold_mode = parse_get_or(int_bool, DEFAULT_HOLD_MODE, mapping.get(HOLD_MODE))
+        dual_mode = parse_get_or(int_bool, DEFAULT_DUAL_MODE, mapping.get(DUAL_MODE))
+
+        toggle_type = parse_get_or(
+            partial_parse_enum(int, ToggleType), ToggleType.DEFAULT, mapping.get(TOGGLE_TYPE)
+        )
+
+        touch_trigger.target_group_id = target_group_id
+
+        touch_trigger.hold_mode = hold_mode
+        touch_trigger.dual_mode = dual_mode
+
+        touch_trigger.toggle_type = toggle_type
+
+        return touch_trigger
+
+    def to_robtop_mapping(self) -> Dict[int, str]:
+        mapping = super().to_robtop_mapping()
+
+        mapping[TARGET_GROUP_ID] = str(self.target_group_id)
+
+        hold_mode = self.is_hold_mode()
+
+        if hold_mode:
+            mapping[HOLD_MODE] = str(int(hold_mode))
+
+        dual_mode = self.is_dual_mode()
+
+        if dual_mode:
+            mapping[DUAL_MODE] = str(int(dual_mode))
+
+        toggle_type = self.toggle_type
+
+        if toggle_type is not ToggleType.DEFAULT:
+            mapping[TOGGLE_TYPE] = str(toggle_type.value)
+
+        return mapping
+
     def is_hold_mode(self) -> bool:
         return self.hold_mode
 
@@ -2377,11 +3448,14 @@ class TouchTrigger(HasTargetGroup, Trigger):
         return self.dual_mode
 
 
+TRIGGER_MULTI_ACTIVATE = 104
+
+
 CT = TypeVar("CT", bound="CountTrigger")
 
 
-@define()
-class CountTrigger(HasMultiActivate, HasActivateGroup, HasCount, HasItem, Trigger):
+@define(on_setattr=mark_dirty_on_setattr)
+class CountTrigger(HasMultiActivate, HasActivateGroup, HasTargetGroup, HasCount, HasItem, Trigger):
     @classmethod
     def from_binary(
         cls: Type[CT],
@@ -2405,6 +3479,8 @@ class CountTrigger(HasMultiActivate, HasActivateGroup, HasCount, HasItem, Trigge
         activate_group = value & activate_group_bit == activate_group_bit
         multi_activate = value & multi_activate_bit == multi_activate_bit
 
+        count_trigger.target_group_id = target_group_id
+
         count_trigger.item_id = item_id
 
         count_trigger.count = count
@@ -2435,6 +3511,58 @@ class CountTrigger(HasMultiActivate, HasActivateGroup, HasCount, HasItem, Trigge
 
         writer.write_u8(value, order)
 
+    @classmethod
+    def from_robtop_mapping(cls: Type[CT], mapping: Mapping[int, str]) -> CT:
+        count_trigger = super().from_robtop_mapping(mapping)
+
+        target_group_id = parse_get_or(int, DEFAULT_ID, mapping.get(TARGET_GROUP_ID))
+
+        item_id = parse_get_or(int, DEFAULT_ID, mapping.get(ITEM_ID))
+
+        count = parse_get_or(int, DEFAULT_COUNT, mapping.get(COUNT))
+
+        activate_group = parse_get_or(int_bool, DEFAULT_ACTIVATE_GROUP, mapping.get(ACTIVATE_GROUP))
+
+        multi_activate = parse_get_or(
+            int_bool, DEFAULT_MULTI_ACTIVATE, mapping.get(TRIGGER_MULTI_ACTIVATE)
+        )
+
+        count_trigger.target_group_id = target_group_id
+
+        count_trigger.item_id = item_id
+
+        count_trigger.count = count
+
+        count_trigger.activate_group = activate_group
+
+        count_trigger.multi_activate = multi_activate
+
+        return count_trigger
+
+    def to_robtop_mapping(self) -> Dict[int, str]:
+        mapping = super().to_robtop_mapping()
+
+        mapping[TARGET_GROUP_ID] = str(self.target_group_id)
+
+        mapping[ITEM_ID] = str(self.item_id)
+
+        mapping[COUNT] = str(self.count)
+
+        activate_group = self.is_activate_group()
+
+        if activate_group:
+            mapping[ACTIVATE_GROUP] = str(int(activate_group))
+
+        multi_activate = self.is_multi_activate()
+
+        if multi_activate:
+            mapping[TRIGGER_MULTI_ACTIVATE] = str(int(multi_activate))
+
+        return mapping
+
+
+COMPARISON = 88
+
 
 ICT = TypeVar("ICT", bound="InstantCountTrigger")
 
@@ -2442,8 +3570,8 @@ COMPARISON_MASK = 0b00000110
 COMPARISON_SHIFT = ACTIVATE_GROUP_BIT.bit_length()
 
 
-@define()
-class InstantCountTrigger(HasActivateGroup, HasCount, HasItem, Trigger):
+@define(on_setattr=mark_dirty_on_setattr)
+class InstantCountTrigger(HasActivateGroup, HasTargetGroup, HasCount, HasItem, Trigger):
     comparison: InstantCountComparison = InstantCountComparison.DEFAULT
 
     @classmethod
@@ -2471,6 +3599,8 @@ class InstantCountTrigger(HasActivateGroup, HasCount, HasItem, Trigger):
 
         comparison = InstantCountComparison(comparison_value)
 
+        instant_count_trigger.target_group_id = target_group_id
+
         instant_count_trigger.item_id = item_id
 
         instant_count_trigger.count = count
@@ -2501,11 +3631,62 @@ class InstantCountTrigger(HasActivateGroup, HasCount, HasItem, Trigger):
 
         writer.write_u8(value, order)
 
+    @classmethod
+    def from_robtop_mapping(cls: Type[ICT], mapping: Mapping[int, str]) -> ICT:
+        instant_count_trigger = super().from_robtop_mapping(mapping)
+
+        target_group_id = parse_get_or(int, DEFAULT_ID, mapping.get(TARGET_GROUP_ID))
+
+        item_id = parse_get_or(int, DEFAULT_ID, mapping.get(ITEM_ID))
+
+        count = parse_get_or(int, DEFAULT_COUNT, mapping.get(COUNT))
+
+        activate_group = parse_get_or(int_bool, DEFAULT_ACTIVATE_GROUP, mapping.get(ACTIVATE_GROUP))
+
+        comparison = parse_get_or(
+            partial_parse_enum(int, InstantCountComparison),
+            InstantCountComparison.DEFAULT,
+            mapping.get(COMPARISON),
+        )
+
+        instant_count_trigger.target_group_id = target_group_id
+
+        instant_count_trigger.item_id = item_id
+
+        instant_count_trigger.count = count
+
+        instant_count_trigger.activate_group = activate_group
+
+        instant_count_trigger.comparison = comparison
+
+        return instant_count_trigger
+
+    def to_robtop_mapping(self) -> Dict[int, str]:
+        mapping = super().to_robtop_mapping()
+
+        mapping[TARGET_GROUP_ID] = str(self.target_group_id)
+
+        mapping[ITEM_ID] = str(self.item_id)
+
+        mapping[COUNT] = str(self.count)
+
+        activate_group = self.is_activate_group()
+
+        if activate_group:
+            mapping[ACTIVATE_GROUP] = str(int(activate_group))
+
+        comparison = self.comparison
+
+        if comparison is not InstantCountComparison.DEFAULT:
+            mapping[COMPARISON] = str(comparison.value)
+
+        return mapping
+
 
 PT = TypeVar("PT", bound="PickupTrigger")
 
 
-@define()
+@define(on_setattr=mark_dirty_on_setattr)
 class PickupTrigger(HasCount, HasItem, Trigger):
     @classmethod
     def from_binary(
@@ -2539,16 +3720,45 @@ class PickupTrigger(HasCount, HasItem, Trigger):
 
         writer.write_i32(self.count, order)
 
+    @classmethod
+    def from_robtop_mapping(cls: Type[PT], mapping: Mapping[int, str]) -> PT:
+        pickup_trigger = super().from_robtop_mapping(mapping)
+
+        item_id = parse_get_or(int, DEFAULT_ID, mapping.get(ITEM_ID))
+
+        count = parse_get_or(int, DEFAULT_COUNT, mapping.get(COUNT))
+
+        pickup_trigger.item_id = item_id
+
+        pickup_trigger.count = count
+
+        return pickup_trigger
+
+    def to_robtop_mapping(self) -> Dict[int, str]:
+        mapping = super().to_robtop_mapping()
+
+        mapping[ITEM_ID] = str(self.item_id)
+
+        mapping[COUNT] = str(self.count)
+
+        return mapping
+
 
 DEFAULT_SPEED = 1.0
 DEFAULT_MAX_SPEED = 0.0
 DEFAULT_OFFSET = 0.0
 
 
+SPEED = 90
+FOLLOW_DELAY = 91
+OFFSET = 92
+MAX_SPEED = 105
+
+
 FPYT = TypeVar("FPYT", bound="FollowPlayerYTrigger")
 
 
-@define()
+@define(on_setattr=mark_dirty_on_setattr)
 class FollowPlayerYTrigger(HasDelay, HasTargetGroup, Trigger):
     speed: float = DEFAULT_SPEED
     max_speed: float = DEFAULT_MAX_SPEED
@@ -2598,11 +3808,49 @@ class FollowPlayerYTrigger(HasDelay, HasTargetGroup, Trigger):
         writer.write_f32(self.max_speed, order)
         writer.write_f32(self.offset, order)
 
+    @classmethod
+    def from_robtop_mapping(cls: Type[FPYT], mapping: Mapping[int, str]) -> FPYT:
+        follow_player_y_trigger = super().from_robtop_mapping(mapping)
+
+        target_group_id = parse_get_or(int, DEFAULT_ID, mapping.get(TARGET_GROUP_ID))
+
+        delay = parse_get_or(float, DEFAULT_DELAY, mapping.get(FOLLOW_DELAY))
+
+        speed = parse_get_or(float, DEFAULT_SPEED, mapping.get(SPEED))
+        max_speed = parse_get_or(float, DEFAULT_MAX_SPEED, mapping.get(MAX_SPEED))
+
+        offset = parse_get_or(float, DEFAULT_OFFSET, mapping.get(OFFSET))
+
+        follow_player_y_trigger.target_group_id = target_group_id
+
+        follow_player_y_trigger.delay = delay
+
+        follow_player_y_trigger.speed = speed
+        follow_player_y_trigger.max_speed = max_speed
+
+        follow_player_y_trigger.offset = offset
+
+        return follow_player_y_trigger
+
+    def to_robtop_mapping(self) -> Dict[int, str]:
+        mapping = super().to_robtop_mapping()
+
+        mapping[TARGET_GROUP_ID] = str(self.target_group_id)
+
+        mapping[FOLLOW_DELAY] = float_str(self.delay)
+
+        mapping[SPEED] = float_str(self.speed)
+        mapping[MAX_SPEED] = float_str(self.max_speed)
+
+        mapping[OFFSET] = float_str(self.offset)
+
+        return mapping
+
 
 ODT = TypeVar("ODT", bound="OnDeathTrigger")
 
 
-@define()
+@define(on_setattr=mark_dirty_on_setattr)
 class OnDeathTrigger(HasActivateGroup, HasTargetGroup, Trigger):
     @classmethod
     def from_binary(
@@ -2645,6 +3893,32 @@ class OnDeathTrigger(HasActivateGroup, HasTargetGroup, Trigger):
 
         writer.write_u8(value, order)
 
+    @classmethod
+    def from_robtop_mapping(cls: Type[ODT], mapping: Mapping[int, str]) -> ODT:
+        on_death_trigger = super().from_robtop_mapping(mapping)
+
+        target_group_id = parse_get_or(int, DEFAULT_ID, mapping.get(TARGET_GROUP_ID))
+
+        activate_group = parse_get_or(int_bool, DEFAULT_ACTIVATE_GROUP, mapping.get(ACTIVATE_GROUP))
+
+        on_death_trigger.target_group_id = target_group_id
+
+        on_death_trigger.activate_group = activate_group
+
+        return on_death_trigger
+
+    def to_robtop_mapping(self) -> Dict[int, str]:
+        mapping = super().to_robtop_mapping()
+
+        mapping[TARGET_GROUP_ID] = str(self.target_group_id)
+
+        activate_group = self.is_activate_group()
+
+        if activate_group:
+            mapping[ACTIVATE_GROUP] = str(int(activate_group))
+
+        return mapping
+
 
 TRIGGER_ON_EXIT_BIT = 0b10000000_00000000
 
@@ -2652,10 +3926,15 @@ TRIGGER_ON_EXIT_BIT = 0b10000000_00000000
 DEFAULT_TRIGGER_ON_EXIT = False
 
 
+BLOCK_A_ID = 80
+BLOCK_B_ID = 95
+TRIGGER_ON_EXIT = 93
+
+
 CBT = TypeVar("CBT", bound="CollisionTrigger")
 
 
-@define()
+@define(on_setattr=mark_dirty_on_setattr)
 class CollisionTrigger(HasActivateGroup, HasTargetGroup, Trigger):
     block_a_id: int = DEFAULT_ID
     block_b_id: int = DEFAULT_ID
@@ -2710,6 +3989,52 @@ class CollisionTrigger(HasActivateGroup, HasTargetGroup, Trigger):
 
         writer.write_u16(value, order)
 
+    @classmethod
+    def from_robtop_mapping(cls: Type[CBT], mapping: Mapping[int, str]) -> CBT:
+        collision_trigger = super().from_robtop_mapping(mapping)
+
+        block_a_id = parse_get_or(int, DEFAULT_ID, mapping.get(BLOCK_A_ID))
+        block_b_id = parse_get_or(int, DEFAULT_ID, mapping.get(BLOCK_B_ID))
+
+        target_group_id = parse_get_or(int, DEFAULT_ID, mapping.get(TARGET_GROUP_ID))
+
+        activate_group = parse_get_or(int_bool, DEFAULT_ACTIVATE_GROUP, mapping.get(ACTIVATE_GROUP))
+
+        trigger_on_exit = parse_get_or(
+            int_bool, DEFAULT_TRIGGER_ON_EXIT, mapping.get(TRIGGER_ON_EXIT)
+        )
+
+        collision_trigger.block_a_id = block_a_id
+        collision_trigger.block_b_id = block_b_id
+
+        collision_trigger.target_group_id = target_group_id
+
+        collision_trigger.activate_group = activate_group
+
+        collision_trigger.trigger_on_exit = trigger_on_exit
+
+        return collision_trigger
+
+    def to_robtop_mapping(self) -> Dict[int, str]:
+        mapping = super().to_robtop_mapping()
+
+        mapping[BLOCK_A_ID] = str(self.block_a_id)
+        mapping[BLOCK_B_ID] = str(self.block_b_id)
+
+        mapping[TARGET_GROUP_ID] = str(self.target_group_id)
+
+        activate_group = self.is_activate_group()
+
+        if activate_group:
+            mapping[ACTIVATE_GROUP] = str(int(activate_group))
+
+        trigger_on_exit = self.is_trigger_on_exit()
+
+        if trigger_on_exit:
+            mapping[TRIGGER_ON_EXIT] = str(int(trigger_on_exit))
+
+        return mapping
+
     def is_trigger_on_exit(self) -> bool:
         return self.trigger_on_exit
 
@@ -2801,9 +4126,9 @@ def object_from_binary(
 
 
 def object_from_bytes(
-    data: bytes, order: ByteOrder = ByteOrder.DEFAULT, version: int = VERSION
+    data: Buffer, order: ByteOrder = ByteOrder.DEFAULT, version: int = VERSION
 ) -> Object:
-    return object_from_binary(BytesIO(data), order, version)
+    return object_from_binary(BufferReader(data), order, version)  # type: ignore
 
 
 def object_to_binary(
@@ -2830,26 +4155,311 @@ def object_to_bytes(
     return binary.read()
 
 
+FromBinaryFunction = Callable[[BinaryIO, ByteOrder, int], Object]
+
+OBJECT_TYPE_VALUE_TO_FROM_BINARY: Dict[int, FromBinaryFunction] = {
+    object_type.value: type.from_binary for object_type, type in OBJECT_TYPE_TO_TYPE.items()
+}
+
+TYPE_TO_OBJECT_TYPE_VALUE = {
+    type: object_type.value for type, object_type in TYPE_TO_OBJECT_TYPE.items()
+}
+
+INVALID_OBJECT_TYPE = "invalid object type: {}"
+
+
+def objects_from_binary(
+    binary: BinaryIO,
+    count: Optional[int] = None,
+    order: ByteOrder = ByteOrder.DEFAULT,
+    version: int = VERSION,
+) -> List[Object]:
+    """Reads `count` objects from the `binary`, or all of the remaining objects
+    if `count` is [`None`][None].
+    """
+    table = OBJECT_TYPE_VALUE_TO_FROM_BINARY
+
+    reader = Reader(binary)
+
+    read_u8 = reader.read_u8
+
+    def read_object() -> Object:
+        object_type_value = read_u8(order)
+
+        from_binary = table.get(object_type_value)
+
+        if from_binary is None:
+            raise ValueError(INVALID_OBJECT_TYPE.format(object_type_value))
+
+        return from_binary(binary, order, version)
+
+    if count is not None:
+        return [read_object() for _ in range(count)]
+
+    start = binary.tell()
+    end = binary.seek(0, SEEK_END)
+
+    binary.seek(start)
+
+    objects: List[Object] = []
+
+    append = objects.append
+
+    while binary.tell() < end:
+        append(read_object())
+
+    return objects
+
+
+def objects_from_buffer(
+    buffer: Buffer,
+    count: Optional[int] = None,
+    order: ByteOrder = ByteOrder.DEFAULT,
+    version: int = VERSION,
+) -> List[Object]:
+    """Reads `count` objects from the `buffer` (or all of them if `count` is [`None`][None]).
+
+    The buffer is not copied, so it can be any buffer, including [`mmap`][mmap.mmap].
+    """
+    return objects_from_binary(BufferReader(buffer), count, order, version)  # type: ignore
+
+
+def objects_to_binary(
+    objects: Iterable[Object],
+    binary: BinaryIO,
+    order: ByteOrder = ByteOrder.DEFAULT,
+    version: int = VERSION,
+) -> None:
+    table = TYPE_TO_OBJECT_TYPE_VALUE
+
+    writer = Writer(binary)
+
+    write_u8 = writer.write_u8
+
+    for object in objects:
+        write_u8(table[type(object)], order)
+
+        object.to_binary(binary, order, version)
+
+
+def objects_to_buffer(
+    objects: Iterable[Object], order: ByteOrder = ByteOrder.DEFAULT, version: int = VERSION
+) -> bytes:
+    """Writes `objects` into the single buffer, which is then returned."""
+    binary = BytesIO()
+
+    objects_to_binary(objects, binary, order, version)
+
+    return binary.getvalue()
+
+
 TEXT_ID = MiscType.TEXT.id
 
 SECRET_COIN_ID = CoinType.SECRET.id
 
 TELEPORT_ID = PortalType.BLUE_TELEPORT.id
 
+ITEM_COUNTER_ID = MiscType.ITEM_COUNTER.id
+
+COLLISION_BLOCK_ID = MiscType.COLLISION_BLOCK.id
+
 
 OBJECT_ID_NOT_PRESENT = "object id is not present"
 
 
+TRIGGER_TYPE_TO_TYPE: Dict[TriggerType, Type[Trigger]] = {
+    TriggerType.BACKGROUND: ColorTrigger,
+    TriggerType.GROUND: ColorTrigger,
+    TriggerType.LINE: ColorTrigger,
+    TriggerType.OBJECT: ColorTrigger,
+    TriggerType.COLOR_1: ColorTrigger,
+    TriggerType.COLOR_2: ColorTrigger,
+    TriggerType.COLOR_3: ColorTrigger,
+    TriggerType.COLOR_4: ColorTrigger,
+    TriggerType.LINE_3D: ColorTrigger,
+    TriggerType.COLOR: ColorTrigger,
+    TriggerType.GROUND_2: ColorTrigger,
+    TriggerType.LINE_2: ColorTrigger,
+    TriggerType.MOVE: MoveTrigger,
+    TriggerType.PULSE: PulseTrigger,
+    TriggerType.ALPHA: AlphaTrigger,
+    TriggerType.TOGGLE: ToggleTrigger,
+    TriggerType.SPAWN: SpawnTrigger,
+    TriggerType.ROTATE: RotateTrigger,
+    TriggerType.FOLLOW: FollowTrigger,
+    TriggerType.SHAKE: ShakeTrigger,
+    TriggerType.ANIMATE: AnimateTrigger,
+    TriggerType.TOUCH: TouchTrigger,
+    TriggerType.COUNT: CountTrigger,
+    TriggerType.STOP: StopTrigger,
+    TriggerType.INSTANT_COUNT: InstantCountTrigger,
+    TriggerType.ON_DEATH: OnDeathTrigger,
+    TriggerType.FOLLOW_PLAYER_Y: FollowPlayerYTrigger,
+    TriggerType.COLLISION: CollisionTrigger,
+    TriggerType.PICKUP: PickupTrigger,
+}
+
+
 OBJECT_ID_TO_TYPE: Dict[int, Type[Object]] = {
     TEXT_ID: Text,
     SECRET_COIN_ID: SecretCoin,
     TELEPORT_ID: Teleport,
+    ITEM_COUNTER_ID: ItemCounter,
+    COLLISION_BLOCK_ID: CollisionBlock,
 }
 
 OBJECT_ID_TO_TYPE.update({orb.id: Orb for orb in OrbType})
+OBJECT_ID_TO_TYPE.update({pickup_item.id: PickupItem for pickup_item in PickupItemType})
+OBJECT_ID_TO_TYPE.update(
+    {trigger_type.id: type for trigger_type, type in TRIGGER_TYPE_TO_TYPE.items()}
+)
+
+
+ObjectParser = Tuple[str, Parse[Any]]
+ObjectParsers = Dict[str, ObjectParser]
+
+
+def into_object_parsers(parsers: Mapping[int, ObjectParser]) -> ObjectParsers:
+    return {str(key): parser for key, parser in parsers.items()}
+
+
+def parse_z_layer(string: str) -> ZLayer:
+    return ZLayer.from_value(int(string))
+
+
+OBJECT_PARSERS = into_object_parsers(
+    {
+        ID: ("id", int),
+        X: ("x", float),
+        Y: ("y", float),
+        H_FLIPPED: ("h_flipped", int_bool),
+        V_FLIPPED: ("v_flipped", int_bool),
+        ROTATION: ("rotation", float),
+        SCALE: ("scale", float),
+        DO_NOT_FADE: ("do_not_fade", int_bool),
+        DO_NOT_ENTER: ("do_not_enter", int_bool),
+        Z_LAYER: ("z_layer", parse_z_layer),
+        Z_ORDER: ("z_order", int),
+        BASE_EDITOR_LAYER: ("base_editor_layer", int),
+        ADDITIONAL_EDITOR_LAYER: ("additional_editor_layer", int),
+        BASE_COLOR_ID: ("base_color_id", int),
+        DETAIL_COLOR_ID: ("detail_color_id", int),
+        BASE_COLOR_HSV: ("base_color_hsv", HSV.from_robtop),
+        DETAIL_COLOR_HSV: ("detail_color_hsv", HSV.from_robtop),
+        GROUPS: ("groups", Groups.from_robtop),
+        GROUP_PARENT: ("group_parent", int_bool),
+        HIGH_DETAIL: ("high_detail", int_bool),
+        DISABLE_GLOW: ("disable_glow", int_bool),
+        SPECIAL_CHECKED: ("special_checked", int_bool),
+        LINK_ID: ("link_id", int),
+    }
+)
+
+
+def extend_object_parsers(parsers: Mapping[int, ObjectParser]) -> ObjectParsers:
+    extended = OBJECT_PARSERS.copy()
+
+    extended.update(into_object_parsers(parsers))
+
+    return extended
+
+
+TYPE_TO_OBJECT_PARSERS: Dict[Type[Object], ObjectParsers] = {
+    Object: OBJECT_PARSERS,
+    SecretCoin: extend_object_parsers({COIN_ID: ("coin_id", int)}),
+    Text: extend_object_parsers({CONTENT: ("content", decode_base64_string_url_safe)}),
+    Teleport: extend_object_parsers(
+        {PORTAL_OFFSET: ("portal_offset", float), SMOOTH: ("smooth", int_bool)}
+    ),
+    AnimatedObject: extend_object_parsers(
+        {
+            RANDOMIZE_START: ("randomize_start", int_bool),
+            ANIMATION_SPEED: ("animation_speed", float),
+        }
+    ),
+    CollisionBlock: extend_object_parsers(
+        {BLOCK_ID: ("block_id", int), DYNAMIC: ("dynamic", int_bool)}
+    ),
+    Orb: extend_object_parsers({ORB_MULTI_ACTIVATE: ("multi_activate", int_bool)}),
+    ItemCounter: extend_object_parsers({ITEM_ID: ("item_id", int)}),
+}
+
+
+def get_object_parsers(object_type: Type[Object]) -> Optional[ObjectParsers]:
+    return TYPE_TO_OBJECT_PARSERS.get(object_type)
+
+
+def parse_object(string: str, parsers: ObjectParsers) -> Dict[str, Any]:
+    """Parses the object `string` into keyword arguments in one pass, using `parsers`,
+    which map keys to attribute names and functions to parse values with.
+
+    Keys that are not present in `parsers` are ignored.
+    """
+    parts = iter(string.split(OBJECT_SEPARATOR))
+
+    arguments: Dict[str, Any] = {}
+
+    for key, value in zip(parts, parts):
+        parser = parsers.get(key)
+
+        if parser is not None:
+            name, parse = parser
+
+            arguments[name] = parse(value)
+
+    return arguments
+
+
+ID_PREFIX = str(ID) + OBJECT_SEPARATOR
+ID_PREFIX_LENGTH = len(ID_PREFIX)
+
+
+def find_object_id(string: str, start: int = 0, stop: Optional[int] = None) -> int:
+    """Finds the object id in the object `string[start:stop]` without parsing it entirely.
+
+    The id is almost always the first key, in which case only the id value is parsed.
+    """
+    if stop is None:
+        stop = len(string)
 
+    if string.startswith(ID_PREFIX, start, stop):
+        id_start = start + ID_PREFIX_LENGTH
 
-def object_from_robtop(string: str) -> Object:  # TODO: extend this function
+        id_stop = string.find(OBJECT_SEPARATOR, id_start, stop)
+
+        if id_stop < 0:
+            id_stop = stop
+
+        return int(string[id_start:id_stop])
+
+    object_id_string = split_object(string[start:stop]).get(ID)
+
+    if object_id_string is None:
+        raise ValueError(OBJECT_ID_NOT_PRESENT)
+
+    return int(object_id_string)
+
+
+def object_from_robtop(string: str) -> Object:
+    """Parses the object `string` into the object of the type determined by its id.
+
+    Types with precomputed parsers are parsed in one pass directly into arguments,
+    the rest (like triggers) go through their `from_robtop_mapping`.
+    """
+    object_type = OBJECT_ID_TO_TYPE.get(find_object_id(string), Object)
+
+    parsers = get_object_parsers(object_type)
+
+    if parsers is None:
+        return object_type.from_robtop_mapping(split_object(string))
+
+    return object_type(**parse_object(string, parsers))
+
+
+def object_from_robtop_reference(string: str) -> Object:
+    """The reference implementation of [`object_from_robtop`][gd.api.objects.object_from_robtop],
+    which goes through [`from_robtop_mapping`][gd.api.objects.Object.from_robtop_mapping].
+    """
     mapping = split_object(string)
 
     object_id_string = mapping.get(ID)
@@ -2864,5 +4474,23 @@ def object_from_robtop(string: str) -> Object:  # TODO: extend this function
     return object_type.from_robtop_mapping(mapping)
 
 
+def objects_from_robtop(strings: Iterable[str]) -> Iterator[Object]:
+    """Lazily parses objects from `strings`, skipping empty ones."""
+    for string in strings:
+        if string:
+            yield object_from_robtop(string)
+
+
 def object_to_robtop(object: Object) -> str:
     return object.to_robtop()
+
+
+def object_to_robtop_cached(object: Object) -> str:
+    return object.to_robtop_cached()
+
+
+try:
+    from _gd import parse_object  # type: ignore
+
+except ImportError:
+    pass
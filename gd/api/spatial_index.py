@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from math import floor, hypot, inf
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from attrs import define, field
+
+from gd.api.objects import GRID_UNITS, Object
+
+__all__ = ("SpatialIndex",)
+
+Cell = Tuple[int, int]
+Row = Dict[int, Object]
+Column = Dict[int, Row]
+
+CELL_SIZE_MUST_BE_POSITIVE = "`cell_size` must be positive"
+OBJECT_NOT_INDEXED = "object {!r} is not indexed"
+
+
+@define()
+class SpatialIndex:
+    """The uniform grid index of object positions.
+
+    The grid consists of square cells with the side of `cell_size` (one block by default).
+    Occupied columns are kept sorted, therefore range queries only visit cells that
+    intersect the range, taking `O(log n + k)` time, where `k` is the amount of objects
+    in these cells.
+
+    Objects are tracked by identity; the index has to be notified when objects move
+    (see [`move`][gd.api.spatial_index.SpatialIndex.move]).
+    """
+
+    cell_size: float = field(default=GRID_UNITS)
+
+    _columns: Dict[int, Column] = field(factory=dict, init=False, repr=False)
+    _column_keys: List[int] = field(factory=list, init=False, repr=False)
+    _cells: Dict[int, Cell] = field(factory=dict, init=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        if self.cell_size <= 0.0:
+            raise ValueError(CELL_SIZE_MUST_BE_POSITIVE)
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def __contains__(self, object: Object) -> bool:
+        return id(object) in self._cells
+
+    def clear(self) -> None:
+        self._columns.clear()
+        self._column_keys.clear()
+        self._cells.clear()
+
+    def cell_of(self, x: float, y: float) -> Cell:
+        cell_size = self.cell_size
+
+        return (floor(x / cell_size), floor(y / cell_size))
+
+    def add(self, object: Object) -> None:
+        if object in self:
+            return
+
+        self.insert(object, self.cell_of(object.x, object.y))
+
+    def add_from_iterable(self, objects: Iterable[Object]) -> None:
+        for object in objects:
+            self.add(object)
+
+    def insert(self, object: Object, cell: Cell) -> None:
+        column_key, row_key = cell
+
+        columns = self._columns
+
+        column = columns.get(column_key)
+
+        if column is None:
+            column = columns[column_key] = {}
+
+            insort(self._column_keys, column_key)
+
+        row = column.get(row_key)
+
+        if row is None:
+            row = column[row_key] = {}
+
+        object_id = id(object)
+
+        row[object_id] = object
+
+        self._cells[object_id] = cell
+
+    def remove(self, object: Object) -> None:
+        object_id = id(object)
+
+        cell = self._cells.pop(object_id, None)
+
+        if cell is None:
+            raise LookupError(OBJECT_NOT_INDEXED.format(object))
+
+        column_key, row_key = cell
+
+        columns = self._columns
+
+        column = columns[column_key]
+        row = column[row_key]
+
+        del row[object_id]
+
+        if not row:
+            del column[row_key]
+
+            if not column:
+                del columns[column_key]
+
+                column_keys = self._column_keys
+
+                del column_keys[bisect_left(column_keys, column_key)]
+
+    def discard(self, object: Object) -> None:
+        if object in self:
+            self.remove(object)
+
+    def move(self, object: Object) -> None:
+        """Updates the position of the `object`, which is expected to be indexed."""
+        cell = self.cell_of(object.x, object.y)
+
+        if self._cells.get(id(object)) == cell:
+            return
+
+        self.remove(object)
+        self.insert(object, cell)
+
+    def iter_columns(self, x_start: float, x_stop: float) -> Iterator[Column]:
+        cell_size = self.cell_size
+
+        column_keys = self._column_keys
+
+        start = bisect_left(column_keys, floor(x_start / cell_size))
+        stop = bisect_right(column_keys, floor(x_stop / cell_size))
+
+        columns = self._columns
+
+        for index in range(start, stop):
+            yield columns[column_keys[index]]
+
+    def query_x_range(self, x_start: float, x_stop: float) -> Iterator[Object]:
+        """Finds objects such that `x_start <= object.x <= x_stop`."""
+        for column in self.iter_columns(x_start, x_stop):
+            for row in column.values():
+                for object in row.values():
+                    if x_start <= object.x <= x_stop:
+                        yield object
+
+    def query_rectangle(
+        self, x_start: float, y_start: float, x_stop: float, y_stop: float
+    ) -> Iterator[Object]:
+        """Finds objects such that `x_start <= object.x <= x_stop`
+        and `y_start <= object.y <= y_stop`.
+        """
+        cell_size = self.cell_size
+
+        row_start = floor(y_start / cell_size)
+        row_stop = floor(y_stop / cell_size)
+
+        row_count = row_stop - row_start + 1
+
+        for column in self.iter_columns(x_start, x_stop):
+            if len(column) < row_count:  # iterate over whichever is smaller
+                rows: Iterable[Row] = (
+                    row for row_key, row in column.items() if row_start <= row_key <= row_stop
+                )
+
+            else:
+                rows = filter(None, map(column.get, range(row_start, row_stop + 1)))
+
+            for row in rows:
+                for object in row.values():
+                    if x_start <= object.x <= x_stop and y_start <= object.y <= y_stop:
+                        yield object
+
+    def gap(self, value: float, key: int) -> float:
+        """Computes the distance from `value` to the cell range with the given `key`."""
+        cell_size = self.cell_size
+
+        start = key * cell_size
+
+        if value < start:
+            return start - value
+
+        stop = start + cell_size
+
+        if value > stop:
+            return value - stop
+
+        return 0.0
+
+    def nearest(self, x: float, y: float, max_distance: Optional[float] = None) -> Optional[Object]:
+        """Finds the object nearest to `(x, y)`, optionally within `max_distance`.
+
+        Only occupied cells are visited: columns are walked outwards from the point
+        in the order of their distance, skipping cells that can not contain closer objects,
+        and stopping as soon as the next column is farther than the best candidate.
+        """
+        column_keys = self._column_keys
+
+        count = len(column_keys)
+
+        if not count:
+            return None
+
+        columns = self._columns
+
+        gap = self.gap
+
+        best: Optional[Object] = None
+        best_distance = inf if max_distance is None else max_distance
+
+        column_key, _ = self.cell_of(x, y)
+
+        right = bisect_left(column_keys, column_key)
+        left = right - 1
+
+        while left >= 0 or right < count:
+            left_gap = inf if left < 0 else gap(x, column_keys[left])
+            right_gap = inf if right >= count else gap(x, column_keys[right])
+
+            if left_gap < right_gap:
+                x_gap = left_gap
+                current_column_key = column_keys[left]
+                left -= 1
+
+            else:
+                x_gap = right_gap
+                current_column_key = column_keys[right]
+                right += 1
+
+            if x_gap > best_distance:
+                break
+
+            for row_key, row in columns[current_column_key].items():
+                if hypot(x_gap, gap(y, row_key)) > best_distance:
+                    continue
+
+                for object in row.values():
+                    distance = hypot(object.x - x, object.y - y)
+
+                    if distance <= best_distance:
+                        best = object
+                        best_distance = distance
+
+        return best
+
+    def max_x(self) -> Optional[float]:
+        column_keys = self._column_keys
+
+        if not column_keys:
+            return None
+
+        column = self._columns[column_keys[-1]]
+
+        return max(object.x for row in column.values() for object in row.values())
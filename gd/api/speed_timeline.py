@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from functools import partial
+from operator import attrgetter as get_attribute_factory
+from typing import Iterable, Type, TypeVar
+
+from attrs import define, field
+
+from gd.api.objects import Object
+from gd.enums import Speed, SpeedChangeType, SpeedMagic
+
+__all__ = ("SpeedTimeline",)
+
+SPEED_TO_MAGIC = {
+    Speed.SLOW: SpeedMagic.SLOW,
+    Speed.NORMAL: SpeedMagic.NORMAL,
+    Speed.FAST: SpeedMagic.FAST,
+    Speed.FASTER: SpeedMagic.FASTER,
+    Speed.FASTEST: SpeedMagic.FASTEST,
+}
+
+SPEED_CHANGE_TO_MAGIC = {
+    SpeedChangeType.SLOW: SpeedMagic.SLOW,
+    SpeedChangeType.NORMAL: SpeedMagic.NORMAL,
+    SpeedChangeType.FAST: SpeedMagic.FAST,
+    SpeedChangeType.FASTER: SpeedMagic.FASTER,
+    SpeedChangeType.FASTEST: SpeedMagic.FASTEST,
+}
+
+FLOAT_TYPE = "d"
+
+X = "x"
+
+get_x = get_attribute_factory(X)
+
+T = TypeVar("T", bound="SpeedTimeline")
+
+
+@define()
+class SpeedTimeline:
+    """The precomputed timeline of speed changes.
+
+    The timeline consists of points, each storing its `x` position, the time (in seconds)
+    it takes to reach it, and the speed magic that is in effect after it.
+    Conversions between positions and times use binary search over these points,
+    taking `O(log n)` time, where `n` is the amount of speed changes.
+    """
+
+    start_speed: Speed = field(default=Speed.DEFAULT)
+
+    xs: array[float] = field(factory=partial(array, FLOAT_TYPE), repr=False)
+    times: array[float] = field(factory=partial(array, FLOAT_TYPE), repr=False)
+    magics: array[float] = field(factory=partial(array, FLOAT_TYPE), repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        if not self.xs:
+            self.xs.append(0.0)
+            self.times.append(0.0)
+            self.magics.append(SPEED_TO_MAGIC[self.start_speed])
+
+    @classmethod
+    def from_speed_changes(
+        cls: Type[T], start_speed: Speed = Speed.DEFAULT, speed_changes: Iterable[Object] = ()
+    ) -> T:
+        """Builds the timeline from `speed_changes`, which do not need to be ordered."""
+        ordered = sorted(speed_changes, key=get_x)
+
+        magic = SPEED_TO_MAGIC[start_speed]
+
+        origin = 0.0
+
+        if ordered:
+            origin = min(origin, ordered[0].x)
+
+        last_x = origin
+        total = origin / magic
+
+        xs = array(FLOAT_TYPE, (last_x,))
+        times = array(FLOAT_TYPE, (total,))
+        magics = array(FLOAT_TYPE, (magic,))
+
+        for speed_change in ordered:
+            x = speed_change.x
+
+            total += (x - last_x) / magic
+
+            magic = SPEED_CHANGE_TO_MAGIC[SpeedChangeType(speed_change.id)]
+
+            last_x = x
+
+            xs.append(x)
+            times.append(total)
+            magics.append(magic)
+
+        return cls(start_speed, xs, times, magics)
+
+    def __len__(self) -> int:
+        return len(self.xs) - 1
+
+    def time_at(self, x: float) -> float:
+        """Computes the time (in seconds) to travel from `0` to `x`."""
+        index = max(bisect_right(self.xs, x) - 1, 0)
+
+        return self.times[index] + (x - self.xs[index]) / self.magics[index]
+
+    def x_at(self, time: float) -> float:
+        """Computes the position reached after `time` seconds."""
+        index = max(bisect_right(self.times, time) - 1, 0)
+
+        return self.xs[index] + (time - self.times[index]) * self.magics[index]
+
+    def times_at(self, xs: Iterable[float]) -> array[float]:
+        """Converts positions `xs` to times in bulk."""
+        points = self.xs
+        times = self.times
+        magics = self.magics
+
+        result = array(FLOAT_TYPE)
+
+        append = result.append
+
+        for x in xs:
+            index = max(bisect_right(points, x) - 1, 0)
+
+            append(times[index] + (x - points[index]) / magics[index])
+
+        return result
+
+    def xs_at(self, times: Iterable[float]) -> array[float]:
+        """Converts `times` to positions in bulk."""
+        xs = self.xs
+        points = self.times
+        magics = self.magics
+
+        result = array(FLOAT_TYPE)
+
+        append = result.append
+
+        for time in times:
+            index = max(bisect_right(points, time) - 1, 0)
+
+            append(xs[index] + (time - points[index]) * magics[index])
+
+        return result
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+from math import cos, radians, sin
+from typing import Iterable, List, Optional, Tuple, Type, TypeVar
+
+from attrs import define, field, frozen
+
+from gd.api.objects import MoveTrigger, Object, RotateTrigger
+from gd.typing import is_instance
+
+__all__ = ("Transform", "Selection")
+
+Point = Tuple[float, float]
+Bounds = Tuple[float, float, float, float]
+
+EMPTY_SELECTION = "the selection is empty"
+
+T = TypeVar("T", bound="Transform")
+
+
+@frozen()
+class Transform:
+    """Represents affine transforms that can be applied to objects, that is,
+    compositions of translations, rotations, uniform scaling and mirroring.
+
+    Points are mapped as `(x, y) -> (a * x + b * y + c, d * x + e * y + f)`;
+    rotations of objects are negated if the transform mirrors, and then increased by `angle`,
+    scales of objects are multiplied by `scale`.
+
+    Rotations are clockwise and measured in degrees, like in the editor.
+    """
+
+    a: float = 1.0
+    b: float = 0.0
+    c: float = 0.0
+    d: float = 0.0
+    e: float = 1.0
+    f: float = 0.0
+
+    angle: float = 0.0
+    scale: float = 1.0
+
+    h_flip: bool = False
+    v_flip: bool = False
+
+    @classmethod
+    def identity(cls: Type[T]) -> T:
+        return cls()
+
+    @classmethod
+    def translation(cls: Type[T], x: float = 0.0, y: float = 0.0) -> T:
+        return cls(c=x, f=y)
+
+    @classmethod
+    def rotation(cls: Type[T], angle: float, x: float = 0.0, y: float = 0.0) -> T:
+        """Creates the transform that rotates by `angle` (clockwise, in degrees)
+        around the `(x, y)` pivot.
+        """
+        angle_radians = radians(angle)
+
+        a = e = cos(angle_radians)
+        b = sin(angle_radians)
+        d = -b
+
+        return cls(a, b, x - a * x - b * y, d, e, y - d * x - e * y, angle=angle)
+
+    @classmethod
+    def scaling(cls: Type[T], scale: float, x: float = 0.0, y: float = 0.0) -> T:
+        """Creates the transform that scales by `scale` relative to the `(x, y)` pivot."""
+        return cls(a=scale, c=x - scale * x, e=scale, f=y - scale * y, scale=scale)
+
+    @classmethod
+    def h_mirror(cls: Type[T], x: float = 0.0) -> T:
+        """Creates the transform that mirrors horizontally, across the vertical line at `x`."""
+        return cls(a=-1.0, c=x + x, h_flip=True)
+
+    @classmethod
+    def v_mirror(cls: Type[T], y: float = 0.0) -> T:
+        """Creates the transform that mirrors vertically, across the horizontal line at `y`."""
+        return cls(e=-1.0, f=y + y, v_flip=True)
+
+    @property
+    def sign(self) -> float:
+        return -1.0 if self.h_flip ^ self.v_flip else 1.0
+
+    def is_translation(self) -> bool:
+        return (
+            self.a == 1.0
+            and self.b == 0.0
+            and self.d == 0.0
+            and self.e == 1.0
+            and not self.angle
+            and self.scale == 1.0
+            and not self.h_flip
+            and not self.v_flip
+        )
+
+    def then(self: T, other: Transform) -> T:
+        """Composes the transform with the `other` one, which is applied after this one."""
+        a, b, c, d, e, f = self.a, self.b, self.c, self.d, self.e, self.f
+
+        other_a, other_b, other_d, other_e = other.a, other.b, other.d, other.e
+
+        return type(self)(
+            other_a * a + other_b * d,
+            other_a * b + other_b * e,
+            other_a * c + other_b * f + other.c,
+            other_d * a + other_e * d,
+            other_d * b + other_e * e,
+            other_d * c + other_e * f + other.f,
+            angle=other.sign * self.angle + other.angle,
+            scale=self.scale * other.scale,
+            h_flip=self.h_flip ^ other.h_flip,
+            v_flip=self.v_flip ^ other.v_flip,
+        )
+
+    def apply_point(self, x: float, y: float) -> Point:
+        return (self.a * x + self.b * y + self.c, self.d * x + self.e * y + self.f)
+
+    def apply_vector(self, x: float, y: float) -> Point:
+        """Applies the linear part of the transform (ignoring the translation)."""
+        return (self.a * x + self.b * y, self.d * x + self.e * y)
+
+    def apply_rotation(self, rotation: float) -> float:
+        return self.sign * rotation + self.angle
+
+    def apply(self, object: Object) -> None:
+        self.apply_to_objects((object,))
+
+    def apply_to_objects(self, objects: Iterable[Object]) -> None:
+        """Applies the transform to `objects` in bulk.
+
+        Besides positions, rotations, scales and flips, offsets of move triggers
+        are transformed as vectors, and target rotations of rotate triggers are negated
+        if the transform mirrors.
+
+        Observers of the objects are notified of moves.
+        """
+        a, b, c, d, e, f = self.a, self.b, self.c, self.d, self.e, self.f
+
+        if self.is_translation():
+            for object in objects:
+                old_x = object.x
+                old_y = object.y
+
+                object.x = old_x + c
+                object.y = old_y + f
+
+                observer = object.observer
+
+                if observer is not None:
+                    observer.on_move(object, old_x, old_y)
+
+            return
+
+        sign = self.sign
+        angle = self.angle
+        scale = self.scale
+
+        h_flip = self.h_flip
+        v_flip = self.v_flip
+
+        for object in objects:
+            old_x = object.x
+            old_y = object.y
+
+            object.x = a * old_x + b * old_y + c
+            object.y = d * old_x + e * old_y + f
+
+            object.rotation = sign * object.rotation + angle
+
+            if scale != 1.0:
+                object.scale *= scale
+
+            if h_flip:
+                object.h_flipped = not object.h_flipped
+
+            if v_flip:
+                object.v_flipped = not object.v_flipped
+
+            if is_instance(object, MoveTrigger):
+                x_offset = object.x_offset
+                y_offset = object.y_offset
+
+                object.x_offset = a * x_offset + b * y_offset
+                object.y_offset = d * x_offset + e * y_offset
+
+            elif is_instance(object, RotateTrigger):
+                object.target_rotation *= sign
+
+            observer = object.observer
+
+            if observer is not None:
+                observer.on_move(object, old_x, old_y)
+
+
+S = TypeVar("S", bound="Selection")
+
+
+@define()
+class Selection:
+    """Represents selections of objects, which can be transformed in bulk.
+
+    Pivots default to the center of the bounding box of the selection.
+    """
+
+    objects: List[Object] = field(factory=list)
+
+    @classmethod
+    def from_objects(cls: Type[S], *objects: Object) -> S:
+        return cls(list(objects))
+
+    @classmethod
+    def from_object_iterable(cls: Type[S], objects: Iterable[Object]) -> S:
+        return cls(list(objects))
+
+    def __len__(self) -> int:
+        return len(self.objects)
+
+    def bounds(self) -> Bounds:
+        """Returns `(x_min, y_min, x_max, y_max)` of the objects."""
+        objects = self.objects
+
+        if not objects:
+            raise ValueError(EMPTY_SELECTION)
+
+        xs = [object.x for object in objects]
+        ys = [object.y for object in objects]
+
+        return (min(xs), min(ys), max(xs), max(ys))
+
+    def center(self) -> Point:
+        x_min, y_min, x_max, y_max = self.bounds()
+
+        return ((x_min + x_max) / 2.0, (y_min + y_max) / 2.0)
+
+    def pivot(self, x: Optional[float], y: Optional[float]) -> Point:
+        if x is None or y is None:
+            center_x, center_y = self.center()
+
+            if x is None:
+                x = center_x
+
+            if y is None:
+                y = center_y
+
+        return (x, y)
+
+    def apply(self: S, transform: Transform) -> S:
+        transform.apply_to_objects(self.objects)
+
+        return self
+
+    def move(self: S, x: float = 0.0, y: float = 0.0) -> S:
+        return self.apply(Transform.translation(x, y))
+
+    def rotate(self: S, angle: float, x: Optional[float] = None, y: Optional[float] = None) -> S:
+        return self.apply(Transform.rotation(angle, *self.pivot(x, y)))
+
+    def scale_by(self: S, scale: float, x: Optional[float] = None, y: Optional[float] = None) -> S:
+        return self.apply(Transform.scaling(scale, *self.pivot(x, y)))
+
+    def h_mirror(self: S, x: Optional[float] = None) -> S:
+        pivot_x, _ = self.pivot(x, 0.0)
+
+        return self.apply(Transform.h_mirror(pivot_x))
+
+    def v_mirror(self: S, y: Optional[float] = None) -> S:
+        _, pivot_y = self.pivot(0.0, y)
+
+        return self.apply(Transform.v_mirror(pivot_y))
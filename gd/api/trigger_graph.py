@@ -0,0 +1,395 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Set, Tuple, Type, TypeVar
+
+from attrs import define, field
+
+from gd.api.group_index import InvertedIndex
+from gd.api.objects import (
+    HasActivateGroup,
+    Object,
+    SpawnTrigger,
+    TouchTrigger,
+    Trigger,
+    has_target_group,
+    is_trigger,
+)
+from gd.enums import ToggleType
+from gd.typing import is_instance
+
+__all__ = (
+    "TriggerGraph",
+    "is_activating",
+    "is_spawning",
+    "is_enabling",
+    "strongly_connected_components",
+)
+
+TRIGGER_NOT_IN_GRAPH = "trigger {!r} is not in the graph"
+
+Edges = List[List[int]]
+Components = List[List[int]]
+
+
+def is_spawning(trigger: Trigger) -> bool:
+    """Checks whether the `trigger` spawns its target group, firing spawn-triggered triggers."""
+    if is_instance(trigger, TouchTrigger):
+        return trigger.toggle_type is ToggleType.SPAWN
+
+    return is_instance(trigger, SpawnTrigger)
+
+
+def is_enabling(trigger: Trigger) -> bool:
+    """Checks whether the `trigger` toggles its target group on,
+    enabling touch-triggered triggers to fire.
+    """
+    if is_instance(trigger, TouchTrigger):
+        return trigger.toggle_type is ToggleType.TOGGLE_ON
+
+    return is_instance(trigger, HasActivateGroup) and trigger.activate_group
+
+
+def is_activating(trigger: Trigger) -> bool:
+    """Checks whether the `trigger` activates (spawns or toggles on) its target group."""
+    return is_spawning(trigger) or is_enabling(trigger)
+
+
+def strongly_connected_components(edges: Edges) -> Tuple[List[int], Components]:
+    """Finds strongly connected components of the graph given by adjacency lists,
+    using the iterative version of Tarjan's algorithm.
+
+    Returns the component of each node and the list of components, where every component
+    comes after all components reachable from it.
+    """
+    count = len(edges)
+
+    indices = [-1] * count
+    lowlinks = [0] * count
+    on_stack = [False] * count
+
+    stack: List[int] = []
+
+    component_of = [-1] * count
+    components: Components = []
+
+    index = 0
+
+    for root in range(count):
+        if indices[root] >= 0:
+            continue
+
+        work = [(root, 0)]
+
+        while work:
+            node, position = work.pop()
+
+            if not position:
+                indices[node] = lowlinks[node] = index
+                index += 1
+
+                stack.append(node)
+                on_stack[node] = True
+
+            node_edges = edges[node]
+
+            descended = False
+
+            while position < len(node_edges):
+                successor = node_edges[position]
+                position += 1
+
+                if indices[successor] < 0:
+                    work.append((node, position))
+                    work.append((successor, 0))
+
+                    descended = True
+
+                    break
+
+                if on_stack[successor] and indices[successor] < lowlinks[node]:
+                    lowlinks[node] = indices[successor]
+
+            if descended:
+                continue
+
+            if lowlinks[node] == indices[node]:
+                component_index = len(components)
+                component: List[int] = []
+
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+
+                    component_of[member] = component_index
+                    component.append(member)
+
+                    if member == node:
+                        break
+
+                components.append(component)
+
+            if work:
+                parent, _ = work[-1]
+
+                if lowlinks[node] < lowlinks[parent]:
+                    lowlinks[parent] = lowlinks[node]
+
+    return (component_of, components)
+
+
+def singleton(value: int) -> Tuple[int]:
+    return (value,)
+
+
+def closure(
+    component: int,
+    component_edges: Edges,
+    memo: Dict[int, FrozenSet[int]],
+    direct: Callable[[int], Iterable[int]],
+) -> FrozenSet[int]:
+    """Computes the union of `direct(other)` over all components reachable from the `component`
+    (including itself), memoizing results of every visited component in `memo`.
+    """
+    result = memo.get(component)
+
+    if result is not None:
+        return result
+
+    stack = [(component, False)]
+
+    while stack:
+        current, expanded = stack.pop()
+
+        if current in memo:
+            continue
+
+        successors = component_edges[current]
+
+        if expanded:
+            values: Set[int] = set(direct(current))
+
+            for successor in successors:
+                values.update(memo[successor])
+
+            memo[current] = frozenset(values)
+
+        else:
+            stack.append((current, True))
+
+            stack.extend((successor, False) for successor in successors if successor not in memo)
+
+    return memo[component]
+
+
+G = TypeVar("G", bound="TriggerGraph")
+
+
+@define()
+class TriggerGraph:
+    """The dependency graph of triggers.
+
+    Triggers that spawn groups (spawn triggers and touch triggers in spawn mode) have edges
+    to spawn-triggered triggers in their target groups, while triggers that toggle groups on
+    (toggle, count, instant count, collision and on death triggers that activate groups,
+    as well as touch triggers in toggle on mode) have edges to touch-triggered triggers.
+    Triggers that toggle groups off do not activate anything.
+
+    The graph is built in one pass over objects, and is condensed into its strongly connected
+    components, so that cycles (like spawn loops) are found in linear time. Reachability and
+    affected objects are computed per component and memoized, therefore repeated queries
+    share the work done before.
+
+    The graph is a snapshot; it has to be rebuilt once the objects change.
+    """
+
+    triggers: List[Trigger] = field(factory=list, init=False)
+    groups: InvertedIndex = field(factory=InvertedIndex, init=False, repr=False)
+
+    _indices: Dict[int, int] = field(factory=dict, init=False, repr=False)
+    _objects: Dict[int, Object] = field(factory=dict, init=False, repr=False)
+    _spawn_triggered: Dict[int, List[int]] = field(factory=dict, init=False, repr=False)
+    _touch_triggered: Dict[int, List[int]] = field(factory=dict, init=False, repr=False)
+
+    _edges: Edges = field(factory=list, init=False, repr=False)
+
+    _component_of: List[int] = field(factory=list, init=False, repr=False)
+    _components: Components = field(factory=list, init=False, repr=False)
+    _component_edges: Edges = field(factory=list, init=False, repr=False)
+
+    _reachable: Dict[int, FrozenSet[int]] = field(factory=dict, init=False, repr=False)
+    _affected: Dict[int, FrozenSet[int]] = field(factory=dict, init=False, repr=False)
+
+    @classmethod
+    def from_objects(cls: Type[G], *objects: Object) -> G:
+        return cls.from_object_iterable(objects)
+
+    @classmethod
+    def from_object_iterable(cls: Type[G], objects: Iterable[Object]) -> G:
+        graph = cls()
+
+        graph.build(objects)
+
+        return graph
+
+    def __len__(self) -> int:
+        return len(self.triggers)
+
+    def __contains__(self, trigger: Trigger) -> bool:
+        return id(trigger) in self._indices
+
+    def build(self, objects: Iterable[Object]) -> None:
+        triggers = self.triggers
+        groups = self.groups
+
+        indices = self._indices
+        objects_by_id = self._objects
+        spawn_triggered = self._spawn_triggered
+        touch_triggered = self._touch_triggered
+
+        for object in objects:
+            object_id = id(object)
+
+            objects_by_id[object_id] = object
+
+            for group in object.groups:
+                groups.add(group, object)
+
+            if is_trigger(object):
+                index = indices[object_id] = len(triggers)
+
+                triggers.append(object)
+
+                if object.is_spawn_triggered():
+                    for group in object.groups:
+                        spawn_triggered.setdefault(group, []).append(index)
+
+                if object.is_touch_triggered():
+                    for group in object.groups:
+                        touch_triggered.setdefault(group, []).append(index)
+
+        empty: List[int] = []
+
+        edges = self._edges
+
+        for trigger in triggers:
+            if has_target_group(trigger):
+                if is_spawning(trigger):
+                    edges.append(spawn_triggered.get(trigger.target_group_id, empty))
+
+                elif is_enabling(trigger):
+                    edges.append(touch_triggered.get(trigger.target_group_id, empty))
+
+                else:
+                    edges.append(empty)
+
+            else:
+                edges.append(empty)
+
+        component_of, components = strongly_connected_components(edges)
+
+        self._component_of = component_of
+        self._components = components
+
+        component_edges = self._component_edges
+
+        for component_index, component in enumerate(components):
+            successors = {
+                component_of[successor] for member in component for successor in edges[member]
+            }
+
+            successors.discard(component_index)
+
+            component_edges.append(list(successors))
+
+    def index(self, trigger: Trigger) -> int:
+        index = self._indices.get(id(trigger))
+
+        if index is None:
+            raise LookupError(TRIGGER_NOT_IN_GRAPH.format(trigger))
+
+        return index
+
+    def iter_successors(self, trigger: Trigger) -> Iterator[Trigger]:
+        """Iterates over triggers that the `trigger` activates directly."""
+        triggers = self.triggers
+
+        for index in self._edges[self.index(trigger)]:
+            yield triggers[index]
+
+    def successors(self, trigger: Trigger) -> List[Trigger]:
+        return list(self.iter_successors(trigger))
+
+    def reachable_components(self, trigger: Trigger) -> FrozenSet[int]:
+        return closure(
+            self._component_of[self.index(trigger)],
+            self._component_edges,
+            self._reachable,
+            singleton,
+        )
+
+    def iter_reachable(self, trigger: Trigger) -> Iterator[Trigger]:
+        """Iterates over triggers reachable from the `trigger`, including the `trigger` itself."""
+        triggers = self.triggers
+        components = self._components
+
+        for component in self.reachable_components(trigger):
+            for index in components[component]:
+                yield triggers[index]
+
+    def reachable(self, trigger: Trigger) -> List[Trigger]:
+        return list(self.iter_reachable(trigger))
+
+    def is_reachable(self, source: Trigger, target: Trigger) -> bool:
+        """Checks whether the `target` can be activated (possibly indirectly) by the `source`."""
+        return self._component_of[self.index(target)] in self.reachable_components(source)
+
+    def is_in_cycle(self, trigger: Trigger) -> bool:
+        index = self.index(trigger)
+
+        return len(self._components[self._component_of[index]]) > 1 or index in self._edges[index]
+
+    def iter_cycles(self) -> Iterator[List[Trigger]]:
+        """Iterates over groups of triggers that activate each other in cycles."""
+        triggers = self.triggers
+        edges = self._edges
+
+        for component in self._components:
+            if len(component) > 1 or component[0] in edges[component[0]]:
+                yield [triggers[index] for index in component]
+
+    def cycles(self) -> List[List[Trigger]]:
+        return list(self.iter_cycles())
+
+    def has_cycles(self) -> bool:
+        return any(True for _ in self.iter_cycles())
+
+    def direct_affected(self, component: int) -> Iterator[int]:
+        triggers = self.triggers
+        groups = self.groups
+
+        for index in self._components[component]:
+            trigger = triggers[index]
+
+            if has_target_group(trigger):
+                for object in groups.iter(trigger.target_group_id):
+                    yield id(object)
+
+    def affected_ids(self, trigger: Trigger) -> FrozenSet[int]:
+        return closure(
+            self._component_of[self.index(trigger)],
+            self._component_edges,
+            self._affected,
+            self.direct_affected,
+        )
+
+    def iter_affected(self, trigger: Trigger) -> Iterator[Object]:
+        """Iterates over objects in target groups of all triggers reachable from the `trigger`,
+        that is, all objects the `trigger` ultimately affects, in no particular order.
+        """
+        objects = self._objects
+
+        for object_id in self.affected_ids(trigger):
+            yield objects[object_id]
+
+    def affected(self, trigger: Trigger) -> List[Object]:
+        return list(self.iter_affected(trigger))
@@ -1,18 +1,35 @@
 from __future__ import annotations
 
-from asyncio import AbstractEventLoop, all_tasks, gather, get_running_loop, run, wait
+from asyncio import (
+    AbstractEventLoop,
+    Future,
+    all_tasks,
+    ensure_future,
+    gather,
+    get_running_loop,
+    run,
+    shield,
+    wait,
+)
+from collections import deque
 from typing import (
     AsyncIterator,
     Awaitable,
     Callable,
+    Deque,
+    Dict,
+    Generic,
+    Hashable,
     Iterable,
     List,
+    Optional,
     Type,
     TypeVar,
     Union,
     overload,
 )
 
+from attrs import define, field
 from iters.async_utils import async_iter, async_list
 from typing_extensions import Literal, ParamSpec
 
@@ -28,10 +45,13 @@ __all__ = (
     "shutdown_loop",
     "awaiting",
     "run_iterables",
+    "stream_iterables",
+    "SingleFlight",
 )
 
 P = ParamSpec("P")
 T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
 
 E = TypeVar("E", bound=AnyException)
 
@@ -125,3 +145,131 @@ async def run_iterables(
         else:
             for item in result:  # type: ignore
                 yield item
+
+
+DEFAULT_CONCURRENCY = 5
+
+CONCURRENCY_MUST_BE_POSITIVE = "`concurrency` must be positive"
+
+
+async def stream_iterables(
+    iterables: AnyIterable[AnyIterable[T]],
+    *ignore: Type[AnyException],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    truncate: bool = False,
+    page_size: Optional[int] = None,
+) -> AsyncIterator[T]:
+    """Streams items of `iterables` (typically pages) as they arrive.
+
+    Unlike [`run_iterables`][gd.async_utils.run_iterables], at most `concurrency`
+    iterables are collected at once, and `iterables` are consumed lazily;
+    items are yielded in order as soon as their iterable is collected.
+
+    Just like in [`run_iterables`][gd.async_utils.run_iterables], iterables that fail
+    with one of the `ignore` errors are skipped. If `truncate` is true, streaming stops
+    instead, as well as when any iterable turns out to be empty, or has less than
+    `page_size` items (if given); this allows streaming from unbounded `iterables`.
+    """
+    if concurrency < 1:
+        raise ValueError(CONCURRENCY_MUST_BE_POSITIVE)
+
+    iterator = async_iter(iterables).__aiter__()
+
+    pending: Deque[Future[List[T]]] = deque()
+
+    exhausted = False
+
+    async def schedule() -> None:
+        nonlocal exhausted
+
+        while not exhausted and len(pending) < concurrency:
+            try:
+                iterable = await iterator.__anext__()
+
+            except StopAsyncIteration:
+                exhausted = True
+
+            else:
+                pending.append(ensure_future(async_list(async_iter(iterable))))
+
+    try:
+        await schedule()
+
+        while pending:
+            future = pending.popleft()
+
+            try:
+                result = await future
+
+            except ignore:
+                if truncate:
+                    break
+
+                await schedule()
+
+                continue
+
+            if truncate and not result:
+                break
+
+            short = truncate and page_size is not None and len(result) < page_size
+
+            if not short:
+                await schedule()  # keep fetching ahead while items are being consumed
+
+            for item in result:
+                yield item
+
+            if short:
+                break
+
+    finally:
+        for future in pending:
+            if future.done():
+                if not future.cancelled():
+                    future.exception()  # mark the exception as retrieved
+
+            else:
+                future.cancel()
+
+
+@define()
+class SingleFlight(Generic[K, T]):
+    """Deduplicates concurrent calls sharing the same key.
+
+    While the call for some key is in flight, subsequent calls with that key
+    wait for the same future instead of starting their own, receiving
+    either the same result or the same exception.
+
+    The shared call is shielded, so cancelling any of the waiters (including the first one)
+    does not cancel the call for the others.
+    """
+
+    _futures: Dict[K, Future[T]] = field(factory=dict, init=False, repr=False)
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+    def is_in_flight(self, key: K) -> bool:
+        return key in self._futures
+
+    async def run(self, key: K, function: Nullary[Awaitable[T]]) -> T:
+        futures = self._futures
+
+        future = futures.get(key)
+
+        if future is None:
+            future = ensure_future(function())
+
+            futures[key] = future
+
+            def discard(done: Future[T]) -> None:
+                if futures.get(key) is done:
+                    del futures[key]
+
+                if not done.cancelled():
+                    done.exception()  # mark the exception as retrieved
+
+            future.add_done_callback(discard)
+
+        return await shield(future)
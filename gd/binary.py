@@ -1,19 +1,32 @@
 from abc import abstractmethod
-from io import BytesIO
-from typing import Any, Optional, Type, TypeVar
+from io import SEEK_CUR, SEEK_END, SEEK_SET, BytesIO
+from mmap import mmap
+from struct import Struct
+from typing import Any, Optional, Tuple, Type, TypeVar, Union
 
+from attrs import define, field
 from typing_extensions import Protocol, TypeGuard, runtime_checkable
 
 from gd.enums import ByteOrder
 from gd.typing import is_instance
 
 __all__ = (
-    "BinaryReader", "BinaryWriter", "Binary", "FromBinary", "ToBinary", "is_from_binary", "is_to_binary"
+    "BinaryReader",
+    "BinaryWriter",
+    "BufferReader",
+    "Binary",
+    "FromBinary",
+    "ToBinary",
+    "is_from_binary",
+    "is_to_binary",
 )
 
 HEADER = b"GD"
 VERSION = 1
 
+RANDOM_ACCESS_VERSION = 2
+"""The first version of the format that allows random access to objects."""
+
 B = TypeVar("B", bound="FromBinary")
 
 
@@ -29,6 +42,73 @@ class BinaryWriter(Protocol):
         ...
 
 
+Buffer = Union[bytes, bytearray, memoryview, mmap]
+
+BYTE_FORMAT = "B"
+
+INVALID_WHENCE = "invalid whence: {}"
+
+
+def into_view(buffer: Buffer) -> memoryview:
+    return memoryview(buffer).cast(BYTE_FORMAT)
+
+
+@define()
+class BufferReader:
+    """The reader over any buffer (including [`mmap`][mmap.mmap]) that does not copy it.
+
+    Only the data that is actually read gets copied.
+    """
+
+    view: memoryview = field(converter=into_view, repr=False)
+    position: int = field(default=0)
+
+    def read(self, size: int = -1) -> bytes:
+        view = self.view
+
+        position = self.position
+
+        if size < 0:
+            end = len(view)
+
+        else:
+            end = min(position + size, len(view))
+
+        self.position = end
+
+        return view[position:end].tobytes()
+
+    def unpack(self, struct: Struct) -> Tuple[Any, ...]:
+        """Unpacks the `struct` at the current position, advancing it."""
+        position = self.position
+
+        values = struct.unpack_from(self.view, position)
+
+        self.position = position + struct.size
+
+        return values
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        if whence == SEEK_SET:
+            position = offset
+
+        elif whence == SEEK_CUR:
+            position = self.position + offset
+
+        elif whence == SEEK_END:
+            position = len(self.view) + offset
+
+        else:
+            raise ValueError(INVALID_WHENCE.format(whence))
+
+        self.position = max(position, 0)
+
+        return self.position
+
+    def tell(self) -> int:
+        return self.position
+
+
 @runtime_checkable
 class FromBinary(Protocol):
     @classmethod
@@ -43,9 +123,13 @@ class FromBinary(Protocol):
 
     @classmethod
     def from_bytes(
-        cls: Type[B], data: bytes, order: ByteOrder = ByteOrder.DEFAULT, version: int = VERSION
+        cls: Type[B], data: Buffer, order: ByteOrder = ByteOrder.DEFAULT, version: int = VERSION
     ) -> B:
-        return cls.from_binary(BytesIO(data), order, version)
+        """Reads the value from `data`, which can be any buffer, including [`mmap`][mmap.mmap].
+
+        The buffer is not copied as a whole.
+        """
+        return cls.from_binary(BufferReader(data), order, version)
 
 
 def is_from_binary(item: Any) -> TypeGuard[FromBinary]:
@@ -1,40 +1,21 @@
-from struct import pack, unpack
-from typing import Generic, TypeVar
-
-from attrs import frozen
-
-from gd.binary import BinaryReader, BinaryWriter
-from gd.binary_constants import (
-    BOOL,
-    BOOL_SIZE,
-    F32,
-    F32_SIZE,
-    F64,
-    F64_SIZE,
-    I8,
-    I8_SIZE,
-    I16,
-    I16_SIZE,
-    I32,
-    I32_SIZE,
-    I64,
-    I64_SIZE,
-    U8,
-    U8_SIZE,
-    U16,
-    U16_SIZE,
-    U32,
-    U32_SIZE,
-    U64,
-    U64_SIZE,
-)
+from functools import lru_cache
+from struct import Struct, pack, unpack
+from typing import Any, Dict, Generic, Tuple, TypeVar
+
+from attrs import field, frozen
+
+from gd.binary import BinaryReader, BinaryWriter, BufferReader
+from gd.binary_constants import BOOL, F32, F64, I8, I16, I32, I64, U8, U16, U32, U64
 from gd.enums import ByteOrder
-from gd.typing import Binary
+from gd.typing import Binary, is_instance
 
 __all__ = (
     # reader, writer
     "Reader",
     "Writer",
+    # codecs
+    "Codec",
+    "get_array_codec",
     # from ints
     "from_i8",
     "from_u8",
@@ -142,6 +123,61 @@ to_f64 = create_to_float(F64)
 
 to_bool = create_to_bool(BOOL)
 
+
+@frozen()
+class Codec:
+    """The precompiled [`Struct`][struct.Struct] codec of the fixed-size `format`,
+    created once for every byte order.
+    """
+
+    format: str = field()
+
+    _structs: Dict[ByteOrder, Struct] = field(init=False, repr=False, eq=False)
+
+    @_structs.default
+    def default_structs(self) -> Dict[ByteOrder, Struct]:
+        format = self.format
+
+        return {order: Struct(order.value + format) for order in ByteOrder}
+
+    @property
+    def size(self) -> int:
+        return self.get(ByteOrder.DEFAULT).size
+
+    def get(self, order: ByteOrder = ByteOrder.DEFAULT) -> Struct:
+        return self._structs[order]
+
+    def pack(self, *values: Any, order: ByteOrder = ByteOrder.DEFAULT) -> bytes:
+        return self.get(order).pack(*values)
+
+    def unpack(self, data: bytes, order: ByteOrder = ByteOrder.DEFAULT) -> Tuple[Any, ...]:
+        return self.get(order).unpack(data)
+
+
+ARRAY_CODEC_CACHE_SIZE = 1024
+
+
+@lru_cache(ARRAY_CODEC_CACHE_SIZE)
+def get_array_codec(format: str, length: int) -> Codec:
+    """Returns the codec of `length` values of the `format`."""
+    return Codec(str(length) + format)
+
+
+I8_CODEC = Codec(I8)
+U8_CODEC = Codec(U8)
+I16_CODEC = Codec(I16)
+U16_CODEC = Codec(U16)
+I32_CODEC = Codec(I32)
+U32_CODEC = Codec(U32)
+I64_CODEC = Codec(I64)
+U64_CODEC = Codec(U64)
+
+F32_CODEC = Codec(F32)
+F64_CODEC = Codec(F64)
+
+BOOL_CODEC = Codec(BOOL)
+
+
 R = TypeVar("R", bound=BinaryReader)
 W = TypeVar("W", bound=BinaryWriter)
 
@@ -151,37 +187,74 @@ class Reader(Generic[R]):
     reader: R
 
     def read_i8(self, order: ByteOrder = ByteOrder.DEFAULT) -> int:
-        return from_i8(self.read(I8_SIZE), order)
+        (value,) = self.unpack(I8_CODEC, order)
+
+        return value  # type: ignore
 
     def read_u8(self, order: ByteOrder = ByteOrder.DEFAULT) -> int:
-        return from_u8(self.read(U8_SIZE), order)
+        (value,) = self.unpack(U8_CODEC, order)
+
+        return value  # type: ignore
 
     def read_i16(self, order: ByteOrder = ByteOrder.DEFAULT) -> int:
-        return from_i16(self.read(I16_SIZE), order)
+        (value,) = self.unpack(I16_CODEC, order)
+
+        return value  # type: ignore
 
     def read_u16(self, order: ByteOrder = ByteOrder.DEFAULT) -> int:
-        return from_u16(self.read(U16_SIZE), order)
+        (value,) = self.unpack(U16_CODEC, order)
+
+        return value  # type: ignore
 
     def read_i32(self, order: ByteOrder = ByteOrder.DEFAULT) -> int:
-        return from_i32(self.read(I32_SIZE), order)
+        (value,) = self.unpack(I32_CODEC, order)
+
+        return value  # type: ignore
 
     def read_u32(self, order: ByteOrder = ByteOrder.DEFAULT) -> int:
-        return from_u32(self.read(U32_SIZE), order)
+        (value,) = self.unpack(U32_CODEC, order)
+
+        return value  # type: ignore
 
     def read_i64(self, order: ByteOrder = ByteOrder.DEFAULT) -> int:
-        return from_i64(self.read(I64_SIZE), order)
+        (value,) = self.unpack(I64_CODEC, order)
+
+        return value  # type: ignore
 
     def read_u64(self, order: ByteOrder = ByteOrder.DEFAULT) -> int:
-        return from_u64(self.read(U64_SIZE), order)
+        (value,) = self.unpack(U64_CODEC, order)
+
+        return value  # type: ignore
 
     def read_f32(self, order: ByteOrder = ByteOrder.DEFAULT) -> float:
-        return from_f32(self.read(F32_SIZE), order)
+        (value,) = self.unpack(F32_CODEC, order)
+
+        return value  # type: ignore
 
     def read_f64(self, order: ByteOrder = ByteOrder.DEFAULT) -> float:
-        return from_f64(self.read(F64_SIZE), order)
+        (value,) = self.unpack(F64_CODEC, order)
+
+        return value  # type: ignore
 
     def read_bool(self, order: ByteOrder = ByteOrder.DEFAULT) -> bool:
-        return from_bool(self.read(BOOL_SIZE), order)
+        (value,) = self.unpack(BOOL_CODEC, order)
+
+        return value  # type: ignore
+
+    def unpack(self, codec: Codec, order: ByteOrder = ByteOrder.DEFAULT) -> Tuple[Any, ...]:
+        """Reads the values of the `codec`.
+
+        If the underlying reader is the [`BufferReader`][gd.binary.BufferReader],
+        values are unpacked directly from its buffer, without intermediate copies.
+        """
+        struct = codec.get(order)
+
+        reader = self.reader
+
+        if is_instance(reader, BufferReader):
+            return reader.unpack(struct)
+
+        return struct.unpack(reader.read(struct.size))
 
     def read(self, size: int) -> bytes:
         return self.reader.read(size)
@@ -192,37 +265,40 @@ class Writer(Generic[W]):
     writer: W
 
     def write_i8(self, value: int, order: ByteOrder = ByteOrder.DEFAULT) -> None:
-        self.write(to_i8(value, order))
+        self.pack(I8_CODEC, value, order=order)
 
     def write_u8(self, value: int, order: ByteOrder = ByteOrder.DEFAULT) -> None:
-        self.write(to_u8(value, order))
+        self.pack(U8_CODEC, value, order=order)
 
     def write_i16(self, value: int, order: ByteOrder = ByteOrder.DEFAULT) -> None:
-        self.write(to_i16(value, order))
+        self.pack(I16_CODEC, value, order=order)
 
     def write_u16(self, value: int, order: ByteOrder = ByteOrder.DEFAULT) -> None:
-        self.write(to_u16(value, order))
+        self.pack(U16_CODEC, value, order=order)
 
     def write_i32(self, value: int, order: ByteOrder = ByteOrder.DEFAULT) -> None:
-        self.write(to_i32(value, order))
+        self.pack(I32_CODEC, value, order=order)
 
     def write_u32(self, value: int, order: ByteOrder = ByteOrder.DEFAULT) -> None:
-        self.write(to_u32(value, order))
+        self.pack(U32_CODEC, value, order=order)
 
     def write_i64(self, value: int, order: ByteOrder = ByteOrder.DEFAULT) -> None:
-        self.write(to_i64(value, order))
+        self.pack(I64_CODEC, value, order=order)
 
     def write_u64(self, value: int, order: ByteOrder = ByteOrder.DEFAULT) -> None:
-        self.write(to_u64(value, order))
+        self.pack(U64_CODEC, value, order=order)
 
     def write_f32(self, value: float, order: ByteOrder = ByteOrder.DEFAULT) -> None:
-        self.write(to_f32(value, order))
+        self.pack(F32_CODEC, value, order=order)
 
     def write_f64(self, value: float, order: ByteOrder = ByteOrder.DEFAULT) -> None:
-        self.write(to_f64(value, order))
+        self.pack(F64_CODEC, value, order=order)
 
     def write_bool(self, value: bool, order: ByteOrder = ByteOrder.DEFAULT) -> None:
-        self.write(to_bool(value, order))
+        self.pack(BOOL_CODEC, value, order=order)
+
+    def pack(self, codec: Codec, *values: Any, order: ByteOrder = ByteOrder.DEFAULT) -> None:
+        self.write(codec.pack(*values, order=order))
 
     def write(self, data: bytes) -> None:
         self.writer.write(data)
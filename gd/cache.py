@@ -0,0 +1,433 @@
+from __future__ import annotations
+
+from abc import abstractmethod
+from collections import OrderedDict
+from hashlib import sha256
+from pathlib import Path
+from sqlite3 import Connection
+from sqlite3 import connect as sqlite_connect
+from threading import Lock
+from time import time as clock
+from typing import AbstractSet, Any, Mapping, Optional, Tuple
+
+from attrs import define, field, frozen
+from typing_extensions import Protocol, runtime_checkable
+
+from gd.async_utils import run_blocking
+from gd.encoding import UTF_8
+from gd.typing import Nullary, Parameters, is_instance, is_string
+
+__all__ = (
+    "CacheBackend",
+    "MemoryCacheBackend",
+    "SQLiteCacheBackend",
+    "CacheStatistics",
+    "ResponseCache",
+    "create_key",
+)
+
+Clock = Nullary[float]
+
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024  # 64 MiB
+
+Entry = Tuple[str, float, int]  # value, expires at, size
+
+
+def size_of(value: str) -> int:
+    return len(value.encode(UTF_8))
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """Represents storages that can be used by [`ResponseCache`][gd.cache.ResponseCache].
+
+    Backends are expected to be safe to use from multiple tasks; some of them may also
+    be shared between processes (see [`SQLiteCacheBackend`][gd.cache.SQLiteCacheBackend]).
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Fetches the non-expired value by `key`, returning `None` if it is not present."""
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl: float) -> None:
+        """Stores the `value` by `key`, expiring in `ttl` seconds."""
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    @abstractmethod
+    def size(self) -> int:
+        """Returns the total size of the values stored (in bytes)."""
+        ...
+
+    @abstractmethod
+    def length(self) -> int:
+        """Returns the amount of entries stored."""
+        ...
+
+
+@define()
+class MemoryCacheBackend(CacheBackend):
+    """The in-memory LRU cache backend, bounded by `max_size` bytes."""
+
+    max_size: int = field(default=DEFAULT_MAX_SIZE)
+
+    clock: Clock = field(default=clock, repr=False)
+
+    _entries: OrderedDict[str, Entry] = field(factory=OrderedDict, init=False, repr=False)
+    _size: int = field(default=0, init=False, repr=False)
+
+    def get(self, key: str) -> Optional[str]:
+        entries = self._entries
+
+        entry = entries.get(key)
+
+        if entry is None:
+            return None
+
+        value, expires_at, _ = entry
+
+        if expires_at < self.clock():
+            self.delete(key)
+
+            return None
+
+        entries.move_to_end(key)
+
+        return value
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        size = size_of(value)
+
+        if size > self.max_size:
+            return
+
+        self.delete(key)
+
+        self._entries[key] = (value, self.clock() + ttl, size)
+        self._size += size
+
+        self.evict()
+
+    def evict(self) -> None:
+        entries = self._entries
+
+        while self._size > self.max_size:
+            _, (_, _, size) = entries.popitem(last=False)  # least recently used
+
+            self._size -= size
+
+    def delete(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+
+        if entry is not None:
+            _, _, size = entry
+
+            self._size -= size
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+    def size(self) -> int:
+        return self._size
+
+    def length(self) -> int:
+        return len(self._entries)
+
+
+CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL
+)
+"""
+
+CREATE_INDEX = "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+
+ENABLE_WAL = "PRAGMA journal_mode = WAL"
+
+SELECT_ENTRY = "SELECT value, expires_at FROM responses WHERE key = ?"
+UPDATE_ACCESSED_AT = "UPDATE responses SET accessed_at = ? WHERE key = ?"
+INSERT_ENTRY = """
+INSERT OR REPLACE INTO responses (key, value, expires_at, accessed_at, size)
+VALUES (?, ?, ?, ?, ?)
+"""
+DELETE_ENTRY = "DELETE FROM responses WHERE key = ?"
+DELETE_EXPIRED = "DELETE FROM responses WHERE expires_at < ?"
+DELETE_ALL = "DELETE FROM responses"
+SELECT_SIZE = "SELECT COALESCE(SUM(size), 0) FROM responses"
+SELECT_LENGTH = "SELECT COUNT(*) FROM responses"
+SELECT_OLDEST = "SELECT key, size FROM responses ORDER BY accessed_at"
+
+DEFAULT_TIMEOUT = 30.0
+
+
+@define()
+class SQLiteCacheBackend(CacheBackend):
+    """The cache backend that stores responses in the SQLite database at `path`.
+
+    The database can be shared by several processes, and is bounded by `max_size` bytes,
+    evicting least recently used entries first.
+    """
+
+    path: Path = field(converter=Path)
+    max_size: int = field(default=DEFAULT_MAX_SIZE)
+    timeout: float = field(default=DEFAULT_TIMEOUT)
+
+    clock: Clock = field(default=clock, repr=False)
+
+    _connection: Optional[Connection] = field(default=None, init=False, repr=False)
+    _lock: Lock = field(factory=Lock, init=False, repr=False)
+
+    @property
+    def connection(self) -> Connection:
+        connection = self._connection
+
+        if connection is None:
+            connection = sqlite_connect(
+                str(self.path), timeout=self.timeout, check_same_thread=False
+            )
+
+            connection.execute(ENABLE_WAL)
+            connection.execute(CREATE_TABLE)
+            connection.execute(CREATE_INDEX)
+            connection.commit()
+
+            self._connection = connection
+
+        return connection
+
+    def close(self) -> None:
+        connection = self._connection
+
+        if connection is not None:
+            connection.close()
+
+            self._connection = None
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            connection = self.connection
+
+            row = connection.execute(SELECT_ENTRY, (key,)).fetchone()
+
+            if row is None:
+                return None
+
+            value, expires_at = row
+
+            now = self.clock()
+
+            if expires_at < now:
+                connection.execute(DELETE_ENTRY, (key,))
+
+            else:
+                connection.execute(UPDATE_ACCESSED_AT, (now, key))
+
+            connection.commit()
+
+            if expires_at < now:
+                return None
+
+            return value  # type: ignore
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        size = size_of(value)
+
+        if size > self.max_size:
+            return
+
+        with self._lock:
+            connection = self.connection
+
+            now = self.clock()
+
+            connection.execute(INSERT_ENTRY, (key, value, now + ttl, now, size))
+
+            self.evict(connection, now)
+
+            connection.commit()
+
+    def evict(self, connection: Connection, now: float) -> None:
+        connection.execute(DELETE_EXPIRED, (now,))
+
+        (size,) = connection.execute(SELECT_SIZE).fetchone()
+
+        if size <= self.max_size:
+            return
+
+        keys = []
+
+        for key, entry_size in connection.execute(SELECT_OLDEST).fetchall():
+            keys.append((key,))
+
+            size -= entry_size
+
+            if size <= self.max_size:
+                break
+
+        connection.executemany(DELETE_ENTRY, keys)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            connection = self.connection
+
+            connection.execute(DELETE_ENTRY, (key,))
+            connection.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            connection = self.connection
+
+            connection.execute(DELETE_ALL)
+            connection.commit()
+
+    def size(self) -> int:
+        with self._lock:
+            (size,) = self.connection.execute(SELECT_SIZE).fetchone()
+
+        return size  # type: ignore
+
+    def length(self) -> int:
+        with self._lock:
+            (length,) = self.connection.execute(SELECT_LENGTH).fetchone()
+
+        return length  # type: ignore
+
+
+@frozen()
+class CacheStatistics:
+    hits: int = field()
+    """The amount of requests served from the cache."""
+    misses: int = field()
+    """The amount of requests that were not found in the cache."""
+    size: int = field()
+    """The total size of cached responses (in bytes)."""
+    length: int = field()
+    """The amount of cached responses."""
+
+    @property
+    def ratio(self) -> float:
+        total = self.hits + self.misses
+
+        return self.hits / total if total else 0.0
+
+
+VOLATILE_KEYS = frozenset(("udid", "uuid", "rs", "chk"))
+
+KEY_SEPARATOR = "\0"
+KEY_VALUE = "{}={}"
+
+
+def create_key(
+    base: str,
+    route: str,
+    payload: Optional[Parameters],
+    volatile_keys: AbstractSet[str] = VOLATILE_KEYS,
+) -> str:
+    """Creates the key for the request to the `route` of `base` with the `payload` given.
+
+    Parameters present in `volatile_keys` are ignored.
+    """
+    parts = [base, route]
+
+    if payload is not None:
+        parts.extend(
+            KEY_VALUE.format(name, value)
+            for name, value in sorted(payload.items())
+            if name not in volatile_keys
+        )
+
+    return sha256(KEY_SEPARATOR.join(parts).encode(UTF_8)).hexdigest()
+
+
+@define()
+class ResponseCache:
+    """The opt-in cache of responses for read-only routes.
+
+    Responses are keyed by the base URL, the route and the normalized payload;
+    randomly generated parameters (like `udid` or `chk`) are excluded from the key.
+
+    Only routes present in `ttls` (mapping of routes to time-to-live in seconds) are cached.
+
+    If the backend is `blocking` (which is the default for
+    [`SQLiteCacheBackend`][gd.cache.SQLiteCacheBackend]), asynchronous operations
+    are run in the executor, so that the event loop is not blocked by I/O.
+    """
+
+    backend: CacheBackend = field(factory=MemoryCacheBackend)
+    ttls: Mapping[str, float] = field(factory=dict)
+
+    volatile_keys: AbstractSet[str] = field(default=VOLATILE_KEYS, repr=False)
+
+    blocking: bool = field(repr=False)
+
+    _hits: int = field(default=0, init=False, repr=False)
+    _misses: int = field(default=0, init=False, repr=False)
+
+    @blocking.default
+    def default_blocking(self) -> bool:
+        return is_instance(self.backend, SQLiteCacheBackend)
+
+    def get_ttl(self, route: str) -> Optional[float]:
+        return self.ttls.get(route)
+
+    def is_cached(self, route: str) -> bool:
+        return self.get_ttl(route) is not None
+
+    def create_key(self, base: str, route: str, payload: Optional[Parameters]) -> str:
+        return create_key(base, route, payload, self.volatile_keys)
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.backend.get(key)
+
+        if value is None:
+            self._misses += 1
+
+        else:
+            self._hits += 1
+
+        return value
+
+    async def get_async(self, key: str) -> Optional[str]:
+        if self.blocking:
+            return await run_blocking(self.get, key)
+
+        return self.get(key)
+
+    def set(self, key: str, route: str, value: Any) -> None:
+        ttl = self.get_ttl(route)
+
+        if ttl is None or not is_string(value):
+            return
+
+        self.backend.set(key, value, ttl)
+
+    async def set_async(self, key: str, route: str, value: Any) -> None:
+        if self.blocking:
+            await run_blocking(self.set, key, route, value)
+
+        else:
+            self.set(key, route, value)
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def statistics(self) -> CacheStatistics:
+        backend = self.backend
+
+        return CacheStatistics(
+            hits=self._hits, misses=self._misses, size=backend.size(), length=backend.length()
+        )
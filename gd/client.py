@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from builtins import setattr as set_attribute
 from datetime import timedelta
+from itertools import count as count_from
 from types import TracebackType as Traceback
 from typing import (
     Any,
@@ -11,6 +12,7 @@ from typing import (
     Generic,
     Iterable,
     Iterator,
+    List,
     Optional,
     Tuple,
     Type,
@@ -21,13 +23,13 @@ from typing import (
 
 from attrs import define, field, frozen
 from iters.async_iters import wrap_async_iter
-from typing_extensions import ParamSpec
+from typing_extensions import ParamSpec, Protocol
 from yarl import URL
 
 from gd.api.database import Database
 from gd.api.recording import Recording
 from gd.artist import Artist
-from gd.async_utils import awaiting, run, run_iterables
+from gd.async_utils import DEFAULT_CONCURRENCY, awaiting, gather_iterable, run, stream_iterables
 from gd.comments import Comment, LevelComment, UserComment
 from gd.constants import (
     COMMENT_PAGE_SIZE,
@@ -54,6 +56,7 @@ from gd.constants import (
     DEFAULT_USE_CLIENT,
     DEFAULT_VERSION,
     EMPTY,
+    SEARCH_MANY_LIMIT,
     UNNAMED,
 )
 from gd.credentials import Credentials
@@ -97,10 +100,19 @@ from gd.events.listeners import (
 from gd.filters import Filters
 from gd.friend_request import FriendRequest
 from gd.http import HTTPClient
+from gd.iter_utils import chunks
 from gd.level import Level
 from gd.level_packs import Gauntlet, MapPack
 from gd.message import Message
-from gd.models import LevelModel, SearchLevelsResponseModel
+from gd.models import (
+    FriendRequestsResponseModel,
+    LevelCommentsResponseModel,
+    LevelModel,
+    MessagesResponseModel,
+    PageModel,
+    SearchLevelsResponseModel,
+    UserCommentsResponseModel,
+)
 from gd.password import Password
 from gd.relationship import Relationship
 from gd.rewards import Chest, Quest
@@ -113,6 +125,7 @@ from gd.typing import (
     IntString,
     MaybeIterable,
     Predicate,
+    Unary,
     URLString,
 )
 from gd.user import User
@@ -150,6 +163,68 @@ def by_id(id: int) -> Predicate[Comment]:
     return predicate
 
 
+class HasPage(Protocol):
+    page: PageModel
+
+
+M = TypeVar("M", bound=HasPage)
+
+
+async def paginate(
+    request: Unary[int, Awaitable[M]],
+    convert: Unary[M, Iterable[T]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> AsyncIterator[T]:
+    """Fetches all pages, using the [`PageModel`][gd.models.PageModel] of the first one
+    to compute the exact amount of remaining pages, which are then fetched concurrently.
+
+    If the total is unknown, pages are fetched until an empty or a short page is found.
+
+    Fetching stops early only if some page is empty or missing
+    (that is, [`NothingFound`][gd.errors.NothingFound] is raised); any other error
+    is propagated, since requests are already retried by the HTTP client.
+    """
+    try:
+        response_model = await request(DEFAULT_PAGE)
+
+    except NothingFound:
+        return
+
+    for item in convert(response_model):
+        yield item
+
+    page_model = response_model.page
+
+    page_count = page_model.page_count()
+
+    pages: Iterable[int]
+
+    page_size: Optional[int]
+
+    if page_count is None:
+        pages = count_from(DEFAULT_PAGE + 1)
+
+        page_size = page_model.size or None
+
+    else:
+        pages = range(DEFAULT_PAGE + 1, page_count)
+
+        page_size = None  # the last page is expected to be short
+
+    async def items_on_page(page: int) -> AsyncIterator[T]:
+        for item in convert(await request(page)):
+            yield item
+
+    async for item in stream_iterables(
+        map(items_on_page, pages),
+        NothingFound,
+        concurrency=concurrency,
+        truncate=True,
+        page_size=page_size,
+    ):
+        yield item
+
+
 CONTROLLER_ALREADY_CREATED = "controller was already created"
 NO_DATABASE = "no database to save"
 
@@ -500,6 +575,37 @@ class Client:
             self
         )
 
+    async def get_users(
+        self,
+        account_ids: Iterable[int],
+        simple: bool = DEFAULT_SIMPLE,
+        friend_state: bool = DEFAULT_FRIEND_STATE,
+    ) -> List[Optional[User]]:
+        """Fetches users by `account_ids` concurrently.
+
+        The protocol does not allow fetching several profiles in one request,
+        therefore requests are sent concurrently and are governed by the
+        [`RateLimiter`][gd.rate_limiter.RateLimiter] of the HTTP client.
+
+        Arguments:
+            account_ids: The account IDs of the users to fetch.
+            simple: Whether to fetch simple information only.
+            friend_state: Whether to fetch friend state.
+
+        Returns:
+            The list of [`User`][gd.user.User] objects in the order of `account_ids`,
+                with `None` in place of users that could not be found.
+        """
+
+        async def get_user(account_id: int) -> Optional[User]:
+            try:
+                return await self.get_user(account_id, simple=simple, friend_state=friend_state)
+
+            except MissingAccess:
+                return None
+
+        return await gather_iterable(map(get_user, account_ids))
+
     async def search_user(
         self,
         query: IntString,
@@ -546,7 +652,7 @@ class Client:
         query: IntString,
         pages: Iterable[int] = DEFAULT_PAGES,
     ) -> AsyncIterator[User]:
-        return run_iterables(
+        return stream_iterables(
             (self.search_users_on_page(query=query, page=page).unwrap() for page in pages),
             ClientError,
         )
@@ -632,6 +738,10 @@ class Client:
 
             yield (model, creator, song)
 
+    def levels_from_model(self, response_model: SearchLevelsResponseModel) -> Iterator[Level]:
+        for model, creator, song in self.level_models_from_model(response_model):
+            yield Level.from_model(model, creator, song).attach_client(self)
+
     async def get_daily(self, use_client: bool = DEFAULT_USE_CLIENT) -> Level:
         return await self.get_timely(TimelyType.DAILY, use_client=use_client)
 
@@ -680,6 +790,46 @@ class Client:
 
         return level
 
+    async def get_levels(
+        self, level_ids: Iterable[int], chunk_size: int = SEARCH_MANY_LIMIT
+    ) -> List[Optional[Level]]:
+        """Fetches levels by `level_ids` in batches.
+
+        Level IDs are split into chunks of `chunk_size` (up to `100`), each fetched
+        in one request using the [`SEARCH_MANY`][gd.enums.SearchStrategy.SEARCH_MANY] strategy.
+        Chunks are requested concurrently and are governed by the
+        [`RateLimiter`][gd.rate_limiter.RateLimiter] of the HTTP client.
+
+        Note:
+            Levels fetched this way do not contain the level data.
+
+        Arguments:
+            level_ids: The IDs of the levels to fetch.
+            chunk_size: The amount of levels to fetch per request.
+
+        Returns:
+            The list of [`Level`][gd.level.Level] objects in the order of `level_ids`,
+                with `None` in place of levels that could not be found.
+        """
+        level_ids = list(level_ids)
+
+        unique_level_ids = list(dict.fromkeys(level_ids))
+
+        filters = Filters.search_many()
+
+        async def search_levels(chunk: List[int]) -> List[Level]:
+            return [
+                level async for level in self.search_levels_on_page(query=chunk, filters=filters)
+            ]
+
+        results = await gather_iterable(
+            map(search_levels, chunks(unique_level_ids, min(chunk_size, SEARCH_MANY_LIMIT)))
+        )
+
+        id_to_level = {level.id: level for result in results for level in result}
+
+        return [id_to_level.get(level_id) for level_id in level_ids]
+
     @wrap_async_iter
     async def search_levels_on_page(
         self,
@@ -710,19 +860,36 @@ class Client:
         except NothingFound:
             return
 
-        for model, creator, song in self.level_models_from_model(response_model):
-            yield Level.from_model(model, creator, song).attach_client(self)
+        for level in self.levels_from_model(response_model):
+            yield level
 
     @wrap_async_iter
     def search_levels(
         self,
         query: Optional[Union[int, str]] = None,
-        pages: Iterable[int] = DEFAULT_PAGES,
+        pages: Optional[Iterable[int]] = DEFAULT_PAGES,
         filters: Optional[Filters] = None,
         user: Optional[User] = None,
         gauntlet: Optional[int] = None,
     ) -> AsyncIterator[Level]:
-        return run_iterables(
+        if pages is None:
+            user_id = None if user is None else user.id
+
+            def search_levels_on_page(page: int) -> Awaitable[SearchLevelsResponseModel]:
+                return self.session.search_levels_on_page(
+                    query=query,
+                    page=page,
+                    filters=filters,
+                    user_id=user_id,
+                    gauntlet=gauntlet,
+                    client_account_id=self.account_id,
+                    client_user_id=self.id,
+                    encoded_password=self.encoded_password,
+                )
+
+            return paginate(search_levels_on_page, self.levels_from_model)
+
+        return stream_iterables(
             (
                 self.search_levels_on_page(
                     query=query,
@@ -949,6 +1116,10 @@ class Client:
         except NothingFound:
             return
 
+        for message in self.messages_from_model(response_model):
+            yield message
+
+    def messages_from_model(self, response_model: MessagesResponseModel) -> Iterator[Message]:
         for model in response_model.messages:
             yield Message.from_model(model).attach_client(self)
 
@@ -957,9 +1128,21 @@ class Client:
     def get_messages(
         self,
         type: MessageType = MessageType.DEFAULT,
-        pages: Iterable[int] = DEFAULT_PAGES,
+        pages: Optional[Iterable[int]] = DEFAULT_PAGES,
     ) -> AsyncIterator[Message]:
-        return run_iterables(
+        if pages is None:
+
+            def get_messages_on_page(page: int) -> Awaitable[MessagesResponseModel]:
+                return self.session.get_messages_on_page(
+                    type=type,
+                    page=page,
+                    account_id=self.account_id,
+                    encoded_password=self.encoded_password,
+                )
+
+            return paginate(get_messages_on_page, self.messages_from_model)
+
+        return stream_iterables(
             (self.get_messages_on_page(type=type, page=page).unwrap() for page in pages),
             ClientError,
         )
@@ -1027,6 +1210,12 @@ class Client:
         except NothingFound:
             return
 
+        for friend_request in self.friend_requests_from_model(response_model, type):
+            yield friend_request
+
+    def friend_requests_from_model(
+        self, response_model: FriendRequestsResponseModel, type: FriendRequestType
+    ) -> Iterator[FriendRequest]:
         for model in response_model.friend_requests:
             yield FriendRequest.from_model(model, type).attach_client(self)
 
@@ -1035,9 +1224,26 @@ class Client:
     def get_friend_requests(
         self,
         type: FriendRequestType = FriendRequestType.DEFAULT,
-        pages: Iterable[int] = DEFAULT_PAGES,
+        pages: Optional[Iterable[int]] = DEFAULT_PAGES,
     ) -> AsyncIterator[FriendRequest]:
-        return run_iterables(
+        if pages is None:
+
+            def get_friend_requests_on_page(page: int) -> Awaitable[FriendRequestsResponseModel]:
+                return self.session.get_friend_requests_on_page(
+                    type=type,
+                    page=page,
+                    account_id=self.account_id,
+                    encoded_password=self.encoded_password,
+                )
+
+            def friend_requests_from_model(
+                response_model: FriendRequestsResponseModel,
+            ) -> Iterator[FriendRequest]:
+                return self.friend_requests_from_model(response_model, type)
+
+            return paginate(get_friend_requests_on_page, friend_requests_from_model)
+
+        return stream_iterables(
             (self.get_friend_requests_on_page(type=type, page=page).unwrap() for page in pages),
             ClientError,
         )
@@ -1162,6 +1368,12 @@ class Client:
             page=page,
         )
 
+        for comment in self.user_comments_from_model(response_model, user):
+            yield comment
+
+    def user_comments_from_model(
+        self, response_model: UserCommentsResponseModel, user: User
+    ) -> Iterator[UserComment]:
         for model in response_model.comments:
             yield UserComment.from_model(model, user).attach_client(self)
 
@@ -1169,9 +1381,21 @@ class Client:
     def get_user_comments(
         self,
         user: User,
-        pages: Iterable[int] = DEFAULT_PAGES,
+        pages: Optional[Iterable[int]] = DEFAULT_PAGES,
     ) -> AsyncIterator[UserComment]:
-        return run_iterables(
+        if pages is None:
+
+            def get_user_comments_on_page(page: int) -> Awaitable[UserCommentsResponseModel]:
+                return self.session.get_user_comments_on_page(account_id=user.account_id, page=page)
+
+            def user_comments_from_model(
+                response_model: UserCommentsResponseModel,
+            ) -> Iterator[UserComment]:
+                return self.user_comments_from_model(response_model, user)
+
+            return paginate(get_user_comments_on_page, user_comments_from_model)
+
+        return stream_iterables(
             (self.get_user_comments_on_page(user=user, page=page).unwrap() for page in pages),
             ClientError,
         )
@@ -1195,18 +1419,40 @@ class Client:
         except NothingFound:
             return
 
+        for comment in self.level_comments_from_model(response_model):
+            yield comment
+
+    def level_comments_from_model(
+        self, response_model: LevelCommentsResponseModel, level: Optional[Level] = None
+    ) -> Iterator[LevelComment]:
         for model in response_model.comments:
-            yield LevelComment.from_model(model).attach_client(self)
+            comment = LevelComment.from_model(model).attach_client(self)
+
+            if level is not None:
+                comment.level = level
+
+            yield comment
 
     @wrap_async_iter
     def get_user_level_comments(
         self,
         user: User,
         count: int = COMMENT_PAGE_SIZE,
-        pages: Iterable[int] = DEFAULT_PAGES,
+        pages: Optional[Iterable[int]] = DEFAULT_PAGES,
         strategy: CommentStrategy = CommentStrategy.DEFAULT,
     ) -> AsyncIterator[LevelComment]:
-        return run_iterables(
+        if pages is None:
+
+            def get_user_level_comments_on_page(
+                page: int,
+            ) -> Awaitable[LevelCommentsResponseModel]:
+                return self.session.get_user_level_comments_on_page(
+                    user_id=user.id, count=count, page=page, strategy=strategy
+                )
+
+            return paginate(get_user_level_comments_on_page, self.level_comments_from_model)
+
+        return stream_iterables(
             (
                 self.get_user_level_comments_on_page(user=user, count=count, page=page).unwrap()
                 for page in pages
@@ -1233,11 +1479,7 @@ class Client:
         except NothingFound:
             return
 
-        for model in response_model.comments:
-            comment = LevelComment.from_model(model).attach_client(self)
-
-            comment.level = level
-
+        for comment in self.level_comments_from_model(response_model, level):
             yield comment
 
     @wrap_async_iter
@@ -1245,10 +1487,24 @@ class Client:
         self,
         level: Level,
         count: int = COMMENT_PAGE_SIZE,
-        pages: Iterable[int] = DEFAULT_PAGES,
+        pages: Optional[Iterable[int]] = DEFAULT_PAGES,
         strategy: CommentStrategy = CommentStrategy.DEFAULT,
     ) -> AsyncIterator[LevelComment]:
-        return run_iterables(
+        if pages is None:
+
+            def get_level_comments_on_page(page: int) -> Awaitable[LevelCommentsResponseModel]:
+                return self.session.get_level_comments_on_page(
+                    level_id=level.id, count=count, page=page, strategy=strategy
+                )
+
+            def level_comments_from_model(
+                response_model: LevelCommentsResponseModel,
+            ) -> Iterator[LevelComment]:
+                return self.level_comments_from_model(response_model, level)
+
+            return paginate(get_level_comments_on_page, level_comments_from_model)
+
+        return stream_iterables(
             (
                 self.get_level_comments_on_page(
                     level=level, count=count, page=page, strategy=strategy
@@ -1274,7 +1530,7 @@ class Client:
 
     @wrap_async_iter
     def get_map_packs(self, pages: Iterable[int] = DEFAULT_PAGES) -> AsyncIterator[MapPack]:
-        return run_iterables(
+        return stream_iterables(
             (self.get_map_packs_on_page(page=page).unwrap() for page in pages),
             ClientError,
         )
@@ -1324,7 +1580,7 @@ class Client:
 
     @wrap_async_iter
     def get_featured_artists(self, pages: Iterable[int] = DEFAULT_PAGES) -> AsyncIterator[Artist]:
-        return run_iterables(
+        return stream_iterables(
             (self.get_featured_artists_on_page(page=page).unwrap() for page in pages),
             ClientError,
         )
@@ -1352,7 +1608,7 @@ class Client:
     def search_newgrounds_songs(
         self, query: str, pages: Iterable[int] = DEFAULT_PAGES
     ) -> AsyncIterator[Song]:
-        return run_iterables(
+        return stream_iterables(
             (self.search_newgrounds_songs_on_page(query=query, page=page) for page in pages),
             ClientError,
         )
@@ -1370,7 +1626,7 @@ class Client:
     def search_newgrounds_users(
         self, query: str, pages: Iterable[int] = DEFAULT_PAGES
     ) -> AsyncIterator[Artist]:
-        return run_iterables(
+        return stream_iterables(
             (self.search_newgrounds_users_on_page(query=query, page=page) for page in pages),
             ClientError,
         )
@@ -1388,7 +1644,7 @@ class Client:
     def get_newgrounds_artist_songs(
         self, name: str, pages: Iterable[int] = DEFAULT_PAGES
     ) -> AsyncIterator[Song]:
-        return run_iterables(
+        return stream_iterables(
             (
                 self.get_newgrounds_artist_songs_on_page(name=name, page=page).unwrap()
                 for page in pages
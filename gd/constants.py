@@ -120,6 +120,8 @@ ZERO_PAGE = range(1)
 
 COMMENT_PAGE_SIZE = 20
 
+SEARCH_MANY_LIMIT = 100
+
 DEFAULT_LOAD_AFTER_POST = True
 
 DEFAULT_GET_DATA = True
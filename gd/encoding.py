@@ -2,22 +2,26 @@ from base64 import b64decode as standard_decode_base64
 from base64 import b64encode as standard_encode_base64
 from base64 import urlsafe_b64decode as standard_decode_base64_url_safe
 from base64 import urlsafe_b64encode as standard_encode_base64_url_safe
+from binascii import a2b_base64, b2a_base64
+from codecs import getincrementaldecoder as get_incremental_decoder
+from functools import lru_cache
 from gzip import decompress as gzip_decompress
 from hashlib import sha1 as standard_sha1
 from itertools import cycle
 from random import choices
 from random import randrange as random_range
 from string import ascii_letters, digits
-from typing import AnyStr, Iterable
+from typing import AnyStr, Iterable, Iterator, Union
 from zlib import MAX_WBITS
 from zlib import compressobj as create_compressor
 from zlib import decompressobj as create_decompressor
 from zlib import error as ZLibError
 
-from gd.constants import DEFAULT_ENCODING, DEFAULT_ERRORS
+from gd.constants import DEFAULT_ENCODING, DEFAULT_ERRORS, EMPTY_BYTES
 from gd.enums import Key, Salt, SimpleKey
 from gd.platform import DARWIN
 from gd.string_utils import concat_empty
+from gd.typing import is_instance
 
 __all__ = (
     "AES_KEY",
@@ -35,6 +39,7 @@ __all__ = (
     "decode_base64_string_url_safe",
     "encode_base64_string_url_safe",
     "xor",
+    "xor_in_place",
     "cyclic_xor",
     "xor_string",
     "cyclic_xor_string",
@@ -61,10 +66,13 @@ __all__ = (
     "unzip_level",
     "zip_level_string",
     "unzip_level_string",
+    "iter_unzip_level",
+    "iter_unzip_level_string",
     "generate_level_seed",
     "generate_leaderboard_seed",
     "compress",
     "decompress",
+    "iter_decompress",
     "fix_song_encoding",
 )
 
@@ -74,6 +82,16 @@ Z_NONE_HEADER = 0x00
 Z_GZIP_HEADER = 0x10
 Z_AUTO_HEADER = 0x20
 
+Z_RAW_WBITS = -MAX_WBITS
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+ZLIB_METHOD_MASK = 0x0F
+ZLIB_DEFLATE = 0x08
+ZLIB_CHECK = 31
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
 # AES
 
 try:
@@ -159,8 +177,40 @@ def encode_base64_string_url_safe(
     return encode_base64_url_safe(string.encode(encoding, errors)).decode(encoding, errors)
 
 
+BYTE_COUNT = 256
+
+BASE64_STANDARD = b"+/"
+BASE64_URL_SAFE = b"-_"
+
+URL_SAFE_CHARACTERS = tuple(bytes((character,)) for character in BASE64_URL_SAFE)
+
+NO_KEY = 0
+
+
+@lru_cache()
+def create_xor_table(key: int) -> bytes:
+    return bytes(byte ^ key for byte in range(BYTE_COUNT))
+
+
+@lru_cache()
+def create_decode_table(key: int) -> bytes:
+    # `xor` each byte with the `key` and map URL-safe base64 characters to standard ones
+    table = bytearray(create_xor_table(key))
+
+    for url_safe, standard in zip(BASE64_URL_SAFE, BASE64_STANDARD):
+        for byte, value in enumerate(table):
+            if value == url_safe:
+                table[byte] = standard
+
+    return bytes(table)
+
+
 def xor(data: bytes, key: int) -> bytes:
-    return bytes(byte ^ key for byte in data)
+    return bytes(data).translate(create_xor_table(key))
+
+
+def xor_in_place(data: bytearray, key: int) -> None:
+    data[:] = data.translate(create_xor_table(key))
 
 
 def cyclic_xor(data: bytes, key: bytes) -> bytes:
@@ -187,18 +237,88 @@ def cyclic_xor_string(
     return result.decode(encoding, errors)
 
 
-def decode_save(data: bytes, apply_xor: bool = True) -> bytes:
+def pad_base64(data: BytesLike) -> BytesLike:
+    """Pads the base64 `data`, copying it if needed; `data` itself is never modified."""
+    required = len(data) % BASE64_PAD
+
+    if required:
+        if required == BASE64_INVALID_TO_PAD:
+            return memoryview(data)[:LAST]
+
+        return bytes(data) + BASE64_PADDING * (BASE64_PAD - required)
+
+    return data
+
+
+def pad_base64_in_place(data: bytearray) -> bytearray:
+    """Pads the base64 `data` in place; used on buffers owned by the decoding pipeline."""
+    required = len(data) % BASE64_PAD
+
+    if required:
+        if required == BASE64_INVALID_TO_PAD:
+            del data[LAST:]
+
+        else:
+            data.extend(BASE64_PADDING * (BASE64_PAD - required))
+
+    return data
+
+
+def decode_save(data: BytesLike, apply_xor: bool = True) -> bytes:
+    """Decodes the save (or level) `data`.
+
+    This function fuses several steps together, copying the data as little as possible:
+
+    - `xor` with the save key (if `apply_xor` is true) and normalization of the URL-safe
+      base64 alphabet are done in one translation pass (skipped entirely if not needed);
+    - base64 is decoded directly from the buffer;
+    - the compression header (gzip, zlib or raw deflate) is detected once
+      instead of trying to decompress several times.
+
+    `data` can be any bytes-like object, including [`bytearray`][bytearray]
+    and [`memoryview`][memoryview].
+    """
+    return decompress_once(decode_save_base64(data, apply_xor))
+
+
+def decode_save_base64(data: BytesLike, apply_xor: bool = True) -> bytes:
+    buffer: Union[bytes, bytearray]
+
+    if is_instance(data, memoryview):
+        buffer = bytearray(data)
+
+        owned = True
+
+    else:
+        buffer = data
+
+        owned = False
+
     if apply_xor:
-        data = xor(data, SAVE_KEY)
+        buffer = buffer.translate(create_decode_table(SAVE_KEY))
+
+        owned = True
+
+    elif has_url_safe(buffer):
+        buffer = buffer.translate(create_decode_table(NO_KEY))
 
-    return decompress(decode_base64(data))
+        owned = True
 
+    if owned and is_instance(buffer, bytearray):
+        return a2b_base64(pad_base64_in_place(buffer))
 
-def encode_save(data: bytes, apply_xor: bool = True) -> bytes:
-    data = encode_base64(compress(data))
+    return a2b_base64(pad_base64(buffer))
+
+
+def has_url_safe(data: Union[bytes, bytearray]) -> bool:
+    return any(character in data for character in URL_SAFE_CHARACTERS)
+
+
+def encode_save(data: BytesLike, apply_xor: bool = True) -> bytes:
+    data = b2a_base64(compress(data), newline=False)
 
     if apply_xor:
-        data = xor(data, SAVE_KEY)
+        data = data.translate(create_xor_table(SAVE_KEY))
 
     return data
 
@@ -363,6 +483,41 @@ def unzip_level_string(
     return decode_save_string(data, apply_xor=False, encoding=encoding, errors=errors)
 
 
+DEFAULT_CHUNK_SIZE = 64 * 1024  # 64 KiB
+
+
+def iter_unzip_level(data: BytesLike, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Incrementally decodes the level `data`, yielding decompressed chunks.
+
+    Only the compressed data is decoded at once; decompressed chunks are at most
+    `chunk_size` bytes long, so the whole level is never held in memory.
+    """
+    return iter_decompress(decode_save_base64(data, apply_xor=False), chunk_size)
+
+
+def iter_unzip_level_string(
+    data: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = DEFAULT_ENCODING,
+    errors: str = DEFAULT_ERRORS,
+) -> Iterator[str]:
+    """Same as [`iter_unzip_level`][gd.encoding.iter_unzip_level], except the chunks
+    are incrementally decoded to strings.
+    """
+    decoder = get_incremental_decoder(encoding)(errors)
+
+    for chunk in iter_unzip_level(data.encode(encoding, errors), chunk_size):
+        string = decoder.decode(chunk)
+
+        if string:
+            yield string
+
+    string = decoder.decode(EMPTY_BYTES, final=True)
+
+    if string:
+        yield string
+
+
 DEFAULT_COUNT = 50
 
 
@@ -396,7 +551,7 @@ def generate_leaderboard_seed(
     )
 
 
-def compress(data: bytes) -> bytes:
+def compress(data: BytesLike) -> bytes:
     compressor = create_compressor(wbits=MAX_WBITS | Z_GZIP_HEADER)
 
     return compressor.compress(data) + compressor.flush()
@@ -425,6 +580,70 @@ def decompress(data: bytes) -> bytes:
     raise ValueError(FAILED_TO_DECOMPRESS)
 
 
+def detect_wbits(data: BytesLike) -> int:
+    """Detects the `wbits` value to decompress `data` with from its header."""
+    header = bytes(memoryview(data)[:2])
+
+    if header == GZIP_MAGIC:
+        return MAX_WBITS | Z_GZIP_HEADER
+
+    if len(header) == 2:
+        method, flags = header
+
+        if method & ZLIB_METHOD_MASK == ZLIB_DEFLATE and ((method << 8) | flags) % ZLIB_CHECK == 0:
+            return MAX_WBITS | Z_NONE_HEADER
+
+    return Z_RAW_WBITS
+
+
+def decompress_once(data: BytesLike) -> bytes:
+    """Decompresses `data`, detecting its format from the header only once.
+
+    Unlike [`decompress`][gd.encoding.decompress], raw deflate streams are also supported.
+    """
+    try:
+        decompressor = create_decompressor(wbits=detect_wbits(data))
+
+        result = decompressor.decompress(data)
+        tail = decompressor.flush()
+
+    except ZLibError:
+        raise ValueError(FAILED_TO_DECOMPRESS) from None
+
+    if tail:
+        result += tail
+
+    return result
+
+
+def iter_decompress(data: BytesLike, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Incrementally decompresses `data`, yielding chunks of at most `chunk_size` bytes
+    (except possibly the last one).
+
+    The format is detected the same way as in [`decompress_once`][gd.encoding.decompress_once].
+    """
+    decompressor = create_decompressor(wbits=detect_wbits(data))
+
+    buffer = data
+
+    try:
+        while buffer and not decompressor.eof:
+            chunk = decompressor.decompress(buffer, chunk_size)
+
+            if chunk:
+                yield chunk
+
+            buffer = decompressor.unconsumed_tail
+
+        tail = decompressor.flush()
+
+    except ZLibError:
+        raise ValueError(FAILED_TO_DECOMPRESS) from None
+
+    if tail:
+        yield tail
+
+
 LEGACY = "cp1252"
 UTF_8 = "utf-8"
 
@@ -442,3 +661,9 @@ try:
 
 except ImportError:
     pass
+
+try:
+    from _gd import xor_in_place  # type: ignore
+
+except ImportError:
+    pass
@@ -50,6 +50,7 @@ __all__ = (
     "InstantCountComparison",
     "OrbType",
     "PadType",
+    "PickupItemType",
     "PickupItemMode",
     "GameMode",
     "LevelType",
@@ -837,6 +838,22 @@ class MiscType(Enum):
     """An enumeration of IDs of miscellaneous objects."""
 
     TEXT = 914
+    ITEM_COUNTER = 1615
+    COLLISION_BLOCK = 1816
+
+    @property
+    def id(self) -> int:
+        return self.value  # type: ignore
+
+
+class PickupItemType(Enum):
+    """An enumeration of IDs of pickup items."""
+
+    KEY = 1275
+    HEART = 1587
+    POTION = 1589
+    SKULL = 1598
+    SMALL_COIN = 1614
 
     @property
     def id(self) -> int:
@@ -1044,6 +1061,10 @@ class TriggerType(Enum):
     COLLISION = 1815
     PICKUP = 1817
 
+    @property
+    def id(self) -> int:
+        return self.value  # type: ignore
+
 
 class ZLayer(Enum):
     """An enumeration of Z layers."""
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from asyncio import Lock, get_running_loop, new_event_loop, set_event_loop, sleep
+from asyncio import get_running_loop, new_event_loop, set_event_loop, sleep
 from atexit import register as register_at_exit
 from builtins import getattr as get_attribute
 from builtins import setattr as set_attribute
@@ -12,12 +12,14 @@ from random import randrange as get_random_range
 from types import TracebackType as Traceback
 from typing import (
     Any,
+    Awaitable,
     BinaryIO,
     ClassVar,
     Generic,
     Mapping,
     Optional,
     Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -25,14 +27,15 @@ from typing import (
 )
 from uuid import uuid4 as generate_uuid
 
-from aiohttp import BasicAuth, ClientError, ClientSession, ClientTimeout
+from aiohttp import BasicAuth, ClientError, ClientSession, ClientTimeout, TCPConnector
 from attrs import define, evolve, field, frozen
 from tqdm import tqdm as progess  # type: ignore
 from typing_extensions import Literal
 from yarl import URL
 
 from gd.api.recording import Recording
-from gd.async_utils import run_blocking, shutdown_loop
+from gd.async_utils import SingleFlight, run_blocking, shutdown_loop
+from gd.cache import CacheBackend, MemoryCacheBackend, ResponseCache, create_key
 from gd.constants import (
     DEFAULT_CHEST_COUNT,
     DEFAULT_COINS,
@@ -107,6 +110,8 @@ from gd.models_constants import OBJECTS_SEPARATOR
 from gd.models_utils import concat_extra_string
 from gd.password import Password
 from gd.progress import Progress
+from gd.rate_limiter import RateLimiter
+from gd.retries import RetryPolicy
 from gd.string_utils import concat_comma, password_str, tick
 from gd.text_utils import snake_to_camel
 from gd.timer import create_timer
@@ -123,13 +128,14 @@ from gd.typing import (
     Parameters,
     URLString,
     is_bytes,
+    is_instance,
     is_iterable,
     is_string,
 )
 from gd.version import python_version_info, version_info
 from gd.versions import CURRENT_BINARY_VERSION, CURRENT_GAME_VERSION, GameVersion, Version
 
-__all__ = ("Route", "HTTPClient")
+__all__ = ("Route", "HTTPClient", "ConnectorOptions", "ConnectionPoolStatistics")
 
 DATABASE = "database"
 ROOT = "/"
@@ -143,6 +149,7 @@ NEWGROUNDS_SEARCH = "https://newgrounds.com/search/conduct/{}"
 
 ACCEPT_ENCODING = "Accept-Encoding"
 USER_AGENT = "User-Agent"
+RETRY_AFTER = "Retry-After"
 
 FORWARDED_FOR = "X-Forwarded-For"
 REQUESTED_WITH = "X-Requested-With"
@@ -206,6 +213,43 @@ GET_SONG = "getGJSongInfo.php"
 
 VALID_ERRORS = (OSError, ClientError)
 
+SECOND = 1.0
+MINUTE = 60.0 * SECOND
+HOUR = 60.0 * MINUTE
+
+CACHE_TTLS = {
+    GET_SONG: HOUR,
+    GET_USER: MINUTE,
+    GET_LEVEL: 5.0 * MINUTE,
+    GET_LEVELS: MINUTE,
+    GET_GAUNTLETS: HOUR,
+    GET_MAP_PACKS: HOUR,
+    GET_FEATURED_ARTISTS: HOUR,
+}
+
+COALESCE_ROUTES = frozenset(
+    (
+        GET_ACCOUNT_URL,
+        GET_USERS,
+        GET_USER,
+        GET_RELATIONSHIPS,
+        GET_LEADERBOARD,
+        GET_LEVELS,
+        GET_TIMELY,
+        GET_LEVEL,
+        GET_LEVEL_LEADERBOARD,
+        GET_MESSAGES,
+        GET_FRIEND_REQUESTS,
+        GET_USER_LEVEL_COMMENTS,
+        GET_USER_COMMENTS,
+        GET_LEVEL_COMMENTS,
+        GET_GAUNTLETS,
+        GET_MAP_PACKS,
+        GET_FEATURED_ARTISTS,
+        GET_SONG,
+    )
+)
+
 HEAD = "HEAD"
 GET = "GET"
 
@@ -373,10 +417,10 @@ DEFAULT_WITH_BAR = False
 
 DEFAULT_CLOSE = True
 
-DEFUALT_RETRIES = 2
-
 DEFAULT_READ = True
 
+DEFAULT_COALESCE = True
+
 UDID_PREFIX = "S"
 UDID_START = 100_000
 UDID_STOP = 100_000_000
@@ -385,6 +429,89 @@ EXTRA_STRING_COUNT = 55
 
 LOOP = "_loop"  # NOTE: keep in sync with the upstream library
 
+CONNECTIONS = "_conns"  # NOTE: keep in sync with the upstream library
+ACQUIRED = "_acquired"  # NOTE: keep in sync with the upstream library
+
+DEFAULT_LIMIT = 100
+DEFAULT_LIMIT_PER_HOST = 0
+DEFAULT_TTL_DNS_CACHE = 10
+DEFAULT_USE_DNS_CACHE = True
+DEFAULT_KEEPALIVE_TIMEOUT = 15.0
+DEFAULT_FORCE_CLOSE = False
+DEFAULT_ENABLE_CLEANUP_CLOSED = False
+
+
+@frozen()
+class ConnectorOptions:
+    """Represents options of the connection pool used by [`HTTPClient`][gd.http.HTTPClient].
+
+    `limit` and `limit_per_host` set to `0` mean *no limit*.
+    """
+
+    limit: int = field(default=DEFAULT_LIMIT)
+    limit_per_host: int = field(default=DEFAULT_LIMIT_PER_HOST)
+    use_dns_cache: bool = field(default=DEFAULT_USE_DNS_CACHE)
+    ttl_dns_cache: Optional[int] = field(default=DEFAULT_TTL_DNS_CACHE)
+    keepalive_timeout: float = field(default=DEFAULT_KEEPALIVE_TIMEOUT)
+    force_close: bool = field(default=DEFAULT_FORCE_CLOSE)
+    enable_cleanup_closed: bool = field(default=DEFAULT_ENABLE_CLEANUP_CLOSED)
+
+    def create_connector(self) -> TCPConnector:
+        keepalive_timeout: Optional[float]
+
+        if self.force_close:  # `aiohttp` does not allow to set both
+            keepalive_timeout = None
+
+        else:
+            keepalive_timeout = self.keepalive_timeout
+
+        return TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            use_dns_cache=self.use_dns_cache,
+            ttl_dns_cache=self.ttl_dns_cache,
+            keepalive_timeout=keepalive_timeout,  # type: ignore
+            force_close=self.force_close,
+            enable_cleanup_closed=self.enable_cleanup_closed,
+        )
+
+
+@frozen()
+class ConnectionPoolStatistics:
+    open: int = field()
+    """The amount of open connections (both idle and acquired)."""
+    idle: int = field()
+    """The amount of idle connections that can be reused."""
+    acquired: int = field()
+    """The amount of connections currently used by requests."""
+    limit: int = field()
+    """The total limit of connections (`0` means *no limit*)."""
+    limit_per_host: int = field()
+    """The per-host limit of connections (`0` means *no limit*)."""
+
+    @classmethod
+    def empty(cls, options: ConnectorOptions) -> ConnectionPoolStatistics:
+        return cls(
+            open=0, idle=0, acquired=0, limit=options.limit, limit_per_host=options.limit_per_host
+        )
+
+    @classmethod
+    def from_connector(cls, connector: TCPConnector) -> ConnectionPoolStatistics:
+        connections = get_attribute(connector, CONNECTIONS, {})
+        acquired_connections = get_attribute(connector, ACQUIRED, ())
+
+        idle = sum(map(len, connections.values()))
+        acquired = len(acquired_connections)
+
+        return cls(
+            open=idle + acquired,
+            idle=idle,
+            acquired=acquired,
+            limit=connector.limit,
+            limit_per_host=connector.limit_per_host,
+        )
+
+
 UNIT = "b"
 UNIT_SCALE = True
 
@@ -522,8 +649,16 @@ class HTTPClient:
     gd_world: bool = field(default=DEFAULT_GD_WORLD)
     forwarded_for: Optional[str] = field(default=None, repr=False)
     send_user_agent: bool = field(default=DEFAULT_SEND_USER_AGENT, repr=False)
+    rate_limiter: RateLimiter = field(factory=RateLimiter, repr=False)
+    retry_policy: RetryPolicy = field(factory=RetryPolicy, repr=False)
+    connector_options: ConnectorOptions = field(factory=ConnectorOptions, repr=False)
+    cache: Optional[ResponseCache] = field(default=None, repr=False)
+    coalesce: bool = field(default=DEFAULT_COALESCE, repr=False)
 
     _session: Optional[ClientSession] = field(default=None, repr=False, init=False)
+    _single_flight: SingleFlight[Tuple[ResponseType, str], ResponseData] = field(
+        factory=SingleFlight, repr=False, init=False
+    )
 
     def __attrs_post_init__(self) -> None:
         add_client(self)
@@ -546,23 +681,79 @@ class HTTPClient:
             self._session = None
 
     async def create_session(self) -> ClientSession:
-        return ClientSession(skip_auto_headers=self.SKIP_HEADERS)
+        return ClientSession(
+            connector=self.connector_options.create_connector(),
+            skip_auto_headers=self.SKIP_HEADERS,
+        )
 
     async def ensure_session(self) -> None:
         session = self._session
 
-        if self._session is None:
-            self._session = session = await self.create_session()
+        if session is None or session.closed:
+            self._session = await self.create_session()
+
+            return
 
         loop = get_running_loop()
 
         optional_loop = get_attribute(session, LOOP, None)
 
-        if optional_loop is not loop:
+        if optional_loop is not loop:  # sessions are bound to the loop they were created in
             await self.close()
 
             self._session = await self.create_session()
 
+    def enable_cache(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttls: Optional[Mapping[str, float]] = None,
+    ) -> ResponseCache:
+        """Enables caching of responses for read-only routes.
+
+        Arguments:
+            backend: The [`CacheBackend`][gd.cache.CacheBackend] to use.
+                If not given, [`MemoryCacheBackend`][gd.cache.MemoryCacheBackend] is used.
+            ttls: The mapping of routes to time-to-live (in seconds) that
+                updates the default one.
+
+        Returns:
+            The [`ResponseCache`][gd.cache.ResponseCache] created.
+        """
+        if backend is None:
+            backend = MemoryCacheBackend()
+
+        cache_ttls = dict(CACHE_TTLS)
+
+        if ttls is not None:
+            cache_ttls.update(ttls)
+
+        self.cache = cache = ResponseCache(backend, cache_ttls)
+
+        return cache
+
+    def disable_cache(self) -> None:
+        self.cache = None
+
+    def pool_statistics(self) -> ConnectionPoolStatistics:
+        """Returns the statistics of the connection pool.
+
+        The pool is shared by every [`Client`][gd.client.Client] that uses this HTTP client.
+
+        Returns:
+            The [`ConnectionPoolStatistics`][gd.http.ConnectionPoolStatistics] of the pool.
+        """
+        session = self._session
+
+        if session is None or session.closed:
+            return ConnectionPoolStatistics.empty(self.connector_options)
+
+        connector = session.connector
+
+        if connector is None or not is_instance(connector, TCPConnector):
+            return ConnectionPoolStatistics.empty(self.connector_options)
+
+        return ConnectionPoolStatistics.from_connector(connector)
+
     async def download(
         self,
         file: BinaryIO,
@@ -657,7 +848,8 @@ class HTTPClient:
         error_codes: Optional[ErrorCodes] = ...,
         headers: Optional[Headers] = ...,
         base: Optional[URLString] = ...,
-        retries: int = ...,
+        retries: Optional[int] = ...,
+        cacheable: bool = ...,
     ) -> str:
         ...
 
@@ -671,7 +863,8 @@ class HTTPClient:
         error_codes: Optional[ErrorCodes] = ...,
         headers: Optional[Headers] = ...,
         base: Optional[URLString] = ...,
-        retries: int = ...,
+        retries: Optional[int] = ...,
+        cacheable: bool = ...,
     ) -> bytes:
         ...
 
@@ -685,7 +878,8 @@ class HTTPClient:
         error_codes: Optional[ErrorCodes] = ...,
         headers: Optional[Headers] = ...,
         base: Optional[URLString] = ...,
-        retries: int = ...,
+        retries: Optional[int] = ...,
+        cacheable: bool = ...,
     ) -> JSONType:
         ...
 
@@ -698,21 +892,59 @@ class HTTPClient:
         error_codes: Optional[ErrorCodes] = None,
         headers: Optional[Headers] = None,
         base: Optional[URLString] = None,
-        retries: int = DEFUALT_RETRIES,
+        retries: Optional[int] = None,
+        cacheable: bool = True,
     ) -> ResponseData:
         url = URL(self.url if base is None else base)
 
-        return await self.request(
-            method=route.method,
-            url=url / route.route.strip(SLASH),
-            type=type,
-            data=data,
-            parameters=parameters,
-            error_codes=error_codes,
-            headers=headers,
-            retries=retries,
+        path = route.route.strip(SLASH)
+
+        cache = self.cache
+
+        use_cache = (
+            cacheable and cache is not None and type is ResponseType.TEXT and cache.is_cached(path)
         )
 
+        coalesce = self.coalesce and path in COALESCE_ROUTES
+
+        def request() -> Awaitable[ResponseData]:
+            return self.request(  # type: ignore
+                method=route.method,
+                url=url / path,
+                type=type,
+                data=data,
+                parameters=parameters,
+                error_codes=error_codes,
+                headers=headers,
+                retries=retries,
+            )
+
+        if not use_cache and not coalesce:
+            return await request()
+
+        if cache is None:
+            key = create_key(str(url), path, data)
+
+        else:
+            key = cache.create_key(str(url), path, data)
+
+        if use_cache:
+            cached = await cache.get_async(key)  # type: ignore
+
+            if cached is not None:
+                return cached
+
+        if coalesce:
+            response = await self._single_flight.run((type, key), request)
+
+        else:
+            response = await request()
+
+        if use_cache:
+            await cache.set_async(key, path, response)  # type: ignore
+
+        return response
+
     @overload
     async def request(
         self,
@@ -724,7 +956,7 @@ class HTTPClient:
         parameters: Optional[Parameters] = ...,
         error_codes: Optional[ErrorCodes] = ...,
         headers: Optional[Headers] = ...,
-        retries: int = ...,
+        retries: Optional[int] = ...,
     ) -> str:
         ...
 
@@ -739,7 +971,7 @@ class HTTPClient:
         parameters: Optional[Parameters] = ...,
         error_codes: Optional[ErrorCodes] = ...,
         headers: Optional[Headers] = ...,
-        retries: int = ...,
+        retries: Optional[int] = ...,
     ) -> bytes:
         ...
 
@@ -754,7 +986,7 @@ class HTTPClient:
         parameters: Optional[Parameters] = ...,
         error_codes: Optional[ErrorCodes] = ...,
         headers: Optional[Headers] = ...,
-        retries: int = ...,
+        retries: Optional[int] = ...,
     ) -> JSONType:
         ...
 
@@ -769,7 +1001,7 @@ class HTTPClient:
         parameters: Optional[Parameters] = ...,
         error_codes: Optional[ErrorCodes] = ...,
         headers: Optional[Headers] = ...,
-        retries: int = ...,
+        retries: Optional[int] = ...,
     ) -> None:
         ...
 
@@ -783,10 +1015,15 @@ class HTTPClient:
         parameters: Optional[Parameters] = None,
         error_codes: Optional[ErrorCodes] = None,
         headers: Optional[Headers] = None,
-        retries: int = DEFUALT_RETRIES,
+        retries: Optional[int] = None,
     ) -> Optional[ResponseData]:
         await self.ensure_session()
 
+        retry_policy = self.retry_policy
+
+        if retries is None:
+            retries = retry_policy.retries
+
         if retries < 0:
             attempts = -1
 
@@ -807,14 +1044,23 @@ class HTTPClient:
         if forwarded_for:
             headers.setdefault(FORWARDED_FOR, forwarded_for)
 
-        lock = Lock()
         error: Optional[AnyException] = None
 
         utf_8 = UTF_8
 
+        rate_limiter = self.rate_limiter
+
+        route = URL(url).path
+
+        backoff = retry_policy.create_backoff()
+
+        started_at = retry_policy.clock()
+
         while attempts:
+            retry_after: Optional[str] = None
+
             try:
-                async with lock, self._session.request(  # type: ignore
+                async with rate_limiter.limit(route), self._session.request(  # type: ignore
                     url=url,
                     method=method,
                     data=data,
@@ -858,6 +1104,11 @@ class HTTPClient:
 
                         error = HTTPStatusError(status, reason)
 
+                        if not retry_policy.should_retry_status(status):
+                            raise error
+
+                        retry_after = response.headers.get(RETRY_AFTER)
+
             except VALID_ERRORS as valid_error:
                 error = HTTPErrorWithOrigin(valid_error)
 
@@ -866,6 +1117,14 @@ class HTTPClient:
 
             attempts -= 1
 
+            if attempts:
+                delay = retry_policy.compute_delay(backoff, retry_after)
+
+                if not retry_policy.can_wait(started_at, delay):
+                    break
+
+                await sleep(delay)
+
         if error:
             raise error
 
@@ -1415,7 +1674,10 @@ class HTTPClient:
                 to_camel=True,
             )
 
-        response = await self.request_route(route, data=payload, error_codes=error_codes)
+        # negative IDs refer to timely levels (daily, weekly, ...) that change over time
+        response = await self.request_route(
+            route, data=payload, error_codes=error_codes, cacheable=level_id >= 0
+        )
 
         return response
 
@@ -1,8 +1,8 @@
-from typing import Any, Dict, Hashable, Mapping, Sized, Tuple, TypeVar, overload
+from typing import Any, Dict, Hashable, Iterator, Mapping, Sequence, Sized, Tuple, TypeVar, overload
 
 from typing_extensions import TypeVarTuple, Unpack
 
-__all__ = ("contains_only_item", "mapping_merge", "tuple_args")
+__all__ = ("chunks", "contains_only_item", "mapping_merge", "tuple_args")
 
 Q = TypeVar("Q", bound=Hashable)
 T = TypeVar("T")
@@ -41,3 +41,11 @@ ONE = 1
 
 def contains_only_item(sized: Sized) -> bool:
     return len(sized) == ONE
+
+
+S = TypeVar("S", bound=Sequence[Any])
+
+
+def chunks(sequence: S, size: int) -> Iterator[S]:
+    for index in range(0, len(sequence), size):
+        yield sequence[index : index + size]  # type: ignore
@@ -400,6 +400,26 @@ class PageModel(Model):
     def can_be_in(cls, string: str) -> bool:
         return PAGE_SEPARATOR in string
 
+    @property
+    def size(self) -> int:
+        """The amount of items per page."""
+        return self.stop
+
+    def page_count(self) -> Optional[int]:
+        """Computes the total amount of pages, if possible.
+
+        Returns:
+            The total amount of pages, or `None` if either the total or
+                the page size is unknown.
+        """
+        total = self.total
+        size = self.size
+
+        if total is None or size <= 0:
+            return None
+
+        return -(-total // size)  # ceiling division
+
     def to_robtop(self) -> str:
         total = self.total
         start = self.start
@@ -1,5 +1,5 @@
 from functools import partial
-from typing import Iterable, Mapping, Optional, Type, TypeVar
+from typing import Iterable, Iterator, List, Mapping, Optional, Type, TypeVar
 
 from iters.iters import iter
 
@@ -56,6 +56,7 @@ from gd.models_constants import (
     USER_COMMENTS_RESPONSE_COMMENTS_SEPARATOR,
     USER_COMMENTS_RESPONSE_SEPARATOR,
 )
+from gd.string_utils import concat_empty
 from gd.typing import Parse
 
 
@@ -120,6 +121,33 @@ def split_iterable(
     return iterable
 
 
+def split_iterable_chunks(separator: str, chunks: Iterable[str]) -> Iterator[str]:
+    """Splits the string given by its `chunks` by `separator`, without concatenating it first.
+
+    This is equivalent to `concat_empty(chunks).split(separator)`, except parts are yielded
+    as soon as they are complete.
+    """
+    pending: List[str] = []
+
+    for chunk in chunks:
+        first, *parts = chunk.split(separator)
+
+        pending.append(first)
+
+        if not parts:
+            continue
+
+        yield concat_empty(pending)
+
+        last = parts.pop()
+
+        yield from parts
+
+        pending = [last]
+
+    yield concat_empty(pending)
+
+
 def split_string_mapping(separator: str, string: str) -> Mapping[str, str]:
     return {index: value for index, value in iter(string.split(separator)).pairs().unwrap()}
 
@@ -241,6 +269,7 @@ split_color_channels = partial(split_iterable, COLOR_CHANNELS_SEPARATOR)
 concat_color_channels = partial(concat_iterable, COLOR_CHANNELS_SEPARATOR)
 
 split_objects = partial(split_iterable, OBJECTS_SEPARATOR)
+split_objects_chunks = partial(split_iterable_chunks, OBJECTS_SEPARATOR)
 concat_objects = partial(concat_iterable, OBJECTS_SEPARATOR)
 
 split_object = partial(split_mapping, OBJECT_SEPARATOR)
@@ -0,0 +1,351 @@
+from __future__ import annotations
+
+from asyncio import AbstractEventLoop, Lock, Semaphore, get_running_loop, sleep
+from time import monotonic as clock
+from types import TracebackType as Traceback
+from typing import Dict, Generic, Optional, Type, TypeVar, overload
+
+from attrs import define, field, frozen
+
+from gd.typing import AnyException, Nullary
+
+__all__ = ("TokenBucket", "RateLimiter", "RateLimiterStatistics")
+
+Clock = Nullary[float]
+
+DEFAULT_TOKENS = 1.0
+
+RATE_MUST_BE_POSITIVE = "`rate` must be positive"
+CAPACITY_MUST_BE_POSITIVE = "`capacity` must be positive"
+BURST_TOO_SMALL = "`{}` must be at least {}"
+
+BURST = "burst"
+ROUTE_BURST = "route_burst"
+
+
+@define()
+class TokenBucket:
+    """An implementation of the *token bucket* algorithm.
+
+    The bucket holds up to `capacity` tokens and is refilled at `rate` tokens per second.
+    Acquiring tokens from an empty bucket waits until enough tokens are refilled,
+    which smooths bursts out instead of rejecting them. Waiters are served in FIFO order.
+    """
+
+    rate: float = field()
+    capacity: float = field()
+
+    _clock: Clock = field(default=clock, repr=False)
+
+    _tokens: float = field(init=False, repr=False)
+    _updated_at: float = field(init=False, repr=False)
+
+    _lock: Optional[Lock] = field(default=None, init=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        if self.rate <= 0.0:
+            raise ValueError(RATE_MUST_BE_POSITIVE)
+
+        if self.capacity <= 0.0:
+            raise ValueError(CAPACITY_MUST_BE_POSITIVE)
+
+    @_tokens.default
+    def default_tokens(self) -> float:
+        return self.capacity
+
+    @_updated_at.default
+    def default_updated_at(self) -> float:
+        return self._clock()
+
+    @property
+    def tokens(self) -> float:
+        self.refill()
+
+        return self._tokens
+
+    def reset(self) -> None:
+        self._tokens = self.capacity
+        self._updated_at = self._clock()
+        self._lock = None
+
+    def refill(self) -> None:
+        now = self._clock()
+
+        elapsed = now - self._updated_at
+
+        self._updated_at = now
+
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+
+    def try_acquire(self, tokens: float = DEFAULT_TOKENS) -> float:
+        """Attempts to acquire `tokens` without waiting.
+
+        Returns:
+            `0.0` if the tokens were acquired, otherwise the delay (in seconds)
+                after which enough tokens are going to be available.
+        """
+        self.refill()
+
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+
+            return 0.0
+
+        return (tokens - self._tokens) / self.rate
+
+    async def acquire(self, tokens: float = DEFAULT_TOKENS) -> float:
+        """Acquires `tokens`, waiting for them to be refilled if needed.
+
+        Returns:
+            The total time waited (in seconds).
+        """
+        lock = self._lock
+
+        if lock is None:
+            self._lock = lock = Lock()
+
+        waited = 0.0
+
+        async with lock:
+            while True:
+                delay = self.try_acquire(tokens)
+
+                if not delay:
+                    return waited
+
+                await sleep(delay)
+
+                waited += delay
+
+
+@frozen()
+class RateLimiterStatistics:
+    queued: int = field()
+    """The amount of requests waiting for the limiter."""
+    in_flight: int = field()
+    """The amount of requests currently being processed."""
+    peak_queued: int = field()
+    """The highest amount of requests that were waiting at once."""
+    peak_in_flight: int = field()
+    """The highest amount of requests that were processed at once."""
+    total: int = field()
+    """The total amount of requests that passed through the limiter."""
+    waited: float = field()
+    """The total time spent waiting on token buckets (in seconds)."""
+
+
+T = TypeVar("T")
+
+
+def switch_none(value: Optional[T], default: T) -> T:
+    return default if value is None else value
+
+
+def default_capacity(rate: float) -> float:
+    # buckets must be able to hold at least one token, otherwise nothing can be acquired
+    return max(rate, DEFAULT_TOKENS)
+
+
+def check_burst(name: str, burst: Optional[float]) -> None:
+    if burst is not None and burst < DEFAULT_TOKENS:
+        raise ValueError(BURST_TOO_SMALL.format(name, DEFAULT_TOKENS))
+
+
+R = TypeVar("R", bound="RateLimiter")
+
+
+@define()
+class RateLimiter:
+    """The client-side governor for outgoing requests.
+
+    Combines the *global* token bucket (`rate` requests per second with `burst` capacity),
+    the *per-route* token buckets (`route_rate` and `route_burst`) and the limit
+    on the amount of requests in flight (`concurrency`).
+
+    Any of the limits can be set to `None` to disable it; by default, everything is disabled.
+
+    ```python
+    http = HTTPClient(rate_limiter=RateLimiter(rate=5.0, burst=10.0, concurrency=8))
+    ```
+    """
+
+    rate: Optional[float] = field(default=None)
+    burst: Optional[float] = field(default=None)
+
+    route_rate: Optional[float] = field(default=None)
+    route_burst: Optional[float] = field(default=None)
+
+    concurrency: Optional[int] = field(default=None)
+
+    _global_bucket: Optional[TokenBucket] = field(default=None, init=False, repr=False)
+    _route_buckets: Dict[str, TokenBucket] = field(factory=dict, init=False, repr=False)
+
+    _semaphore: Optional[Semaphore] = field(default=None, init=False, repr=False)
+    _loop: Optional[AbstractEventLoop] = field(default=None, init=False, repr=False)
+
+    _queued: int = field(default=0, init=False, repr=False)
+    _in_flight: int = field(default=0, init=False, repr=False)
+    _peak_queued: int = field(default=0, init=False, repr=False)
+    _peak_in_flight: int = field(default=0, init=False, repr=False)
+    _total: int = field(default=0, init=False, repr=False)
+    _waited: float = field(default=0.0, init=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        check_burst(BURST, self.burst)
+        check_burst(ROUTE_BURST, self.route_burst)
+
+        rate = self.rate
+
+        if rate is not None:
+            self._global_bucket = TokenBucket(rate, switch_none(self.burst, default_capacity(rate)))
+
+    def is_enabled(self) -> bool:
+        return not (self.rate is None and self.route_rate is None and self.concurrency is None)
+
+    @property
+    def queued(self) -> int:
+        return self._queued
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def statistics(self) -> RateLimiterStatistics:
+        return RateLimiterStatistics(
+            queued=self._queued,
+            in_flight=self._in_flight,
+            peak_queued=self._peak_queued,
+            peak_in_flight=self._peak_in_flight,
+            total=self._total,
+            waited=self._waited,
+        )
+
+    def ensure_loop(self) -> None:
+        loop = get_running_loop()
+
+        if self._loop is not loop:  # primitives can not be shared between loops
+            self._loop = loop
+
+            concurrency = self.concurrency
+
+            self._semaphore = None if concurrency is None else Semaphore(concurrency)
+
+            global_bucket = self._global_bucket
+
+            if global_bucket is not None:
+                global_bucket.reset()
+
+            self._route_buckets.clear()
+
+    def get_route_bucket(self, route: str) -> Optional[TokenBucket]:
+        route_rate = self.route_rate
+
+        if route_rate is None:
+            return None
+
+        route_buckets = self._route_buckets
+
+        bucket = route_buckets.get(route)
+
+        if bucket is None:
+            bucket = TokenBucket(
+                route_rate, switch_none(self.route_burst, default_capacity(route_rate))
+            )
+
+            route_buckets[route] = bucket
+
+        return bucket
+
+    async def acquire(self, route: str) -> None:
+        if not self.is_enabled():
+            return
+
+        self.ensure_loop()
+
+        self._queued += 1
+        self._peak_queued = max(self._peak_queued, self._queued)
+
+        waited = 0.0
+
+        try:
+            semaphore = self._semaphore
+
+            if semaphore is not None:
+                await semaphore.acquire()
+
+            try:
+                global_bucket = self._global_bucket
+
+                if global_bucket is not None:
+                    waited += await global_bucket.acquire()
+
+                route_bucket = self.get_route_bucket(route)
+
+                if route_bucket is not None:
+                    waited += await route_bucket.acquire()
+
+            except BaseException:
+                if semaphore is not None:
+                    semaphore.release()
+
+                raise
+
+        finally:
+            self._queued -= 1
+
+        self._waited += waited
+
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+        self._total += 1
+
+    def release(self) -> None:
+        if not self.is_enabled():
+            return
+
+        self._in_flight -= 1
+
+        semaphore = self._semaphore
+
+        if semaphore is not None:
+            semaphore.release()
+
+    def limit(self: R, route: str) -> RateLimiterContextManager[R]:
+        """Returns the asynchronous context manager that holds the limiter for the `route`.
+
+        ```python
+        async with rate_limiter.limit(route):
+            ...  # perform the request
+        ```
+        """
+        return RateLimiterContextManager(self, route)
+
+
+E = TypeVar("E", bound=AnyException)
+
+
+@frozen()
+class RateLimiterContextManager(Generic[R]):
+    rate_limiter: R = field()
+    route: str = field()
+
+    async def __aenter__(self) -> R:
+        rate_limiter = self.rate_limiter
+
+        await rate_limiter.acquire(self.route)
+
+        return rate_limiter
+
+    @overload
+    async def __aexit__(self, error_type: None, error: None, traceback: None) -> None:
+        ...
+
+    @overload
+    async def __aexit__(self, error_type: Type[E], error: E, traceback: Traceback) -> None:
+        ...
+
+    async def __aexit__(
+        self, error_type: Optional[Type[E]], error: Optional[E], traceback: Optional[Traceback]
+    ) -> None:
+        self.rate_limiter.release()
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime as parse_date_time
+from time import monotonic as clock
+from typing import AbstractSet, Optional
+
+from attrs import field, frozen
+
+from gd.tasks import ExponentialBackoff
+from gd.typing import Nullary
+
+__all__ = ("RetryPolicy", "parse_retry_after")
+
+Clock = Nullary[float]
+
+DEFAULT_RETRIES = 2
+
+DEFAULT_MULTIPLY = 0.5
+DEFAULT_BASE = 2.0
+DEFAULT_LIMIT = 6
+
+DEFAULT_MAX_ELAPSED = 60.0
+
+DEFAULT_RESPECT_RETRY_AFTER = True
+DEFAULT_MAX_RETRY_AFTER = 60.0
+
+REQUEST_TIMEOUT = 408
+TOO_MANY_REQUESTS = 429
+INTERNAL_SERVER_ERROR = 500
+BAD_GATEWAY = 502
+SERVICE_UNAVAILABLE = 503
+GATEWAY_TIMEOUT = 504
+
+DEFAULT_RETRY_STATUSES = frozenset(
+    (
+        REQUEST_TIMEOUT,
+        TOO_MANY_REQUESTS,
+        INTERNAL_SERVER_ERROR,
+        BAD_GATEWAY,
+        SERVICE_UNAVAILABLE,
+        GATEWAY_TIMEOUT,
+    )
+)
+
+
+def parse_retry_after(string: str) -> Optional[float]:
+    """Parses the value of the `Retry-After` header.
+
+    The value can either be the amount of seconds to wait, or the HTTP date to wait until.
+
+    Returns:
+        The delay (in seconds), or `None` if the value could not be parsed.
+    """
+    string = string.strip()
+
+    try:
+        return max(float(string), 0.0)
+
+    except ValueError:
+        pass
+
+    try:
+        date_time = parse_date_time(string)
+
+    except (TypeError, ValueError):
+        return None
+
+    if date_time.tzinfo is None:
+        date_time = date_time.replace(tzinfo=timezone.utc)
+
+    return max((date_time - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+@frozen()
+class RetryPolicy:
+    """Describes how [`HTTPClient`][gd.http.HTTPClient] retries failed requests.
+
+    Delays between attempts are computed using the exponential backoff with *full jitter*
+    (see [`ExponentialBackoff`][gd.tasks.ExponentialBackoff]), and the `Retry-After` header
+    is respected if the server provides it.
+
+    Retrying stops once `retries` are exhausted or the next attempt would start
+    after `max_elapsed` seconds since the first one (unless it is `None`).
+    Negative `retries` mean retrying indefinitely (still bounded by `max_elapsed`).
+    """
+
+    retries: int = field(default=DEFAULT_RETRIES)
+
+    multiply: float = field(default=DEFAULT_MULTIPLY)
+    base: float = field(default=DEFAULT_BASE)
+    limit: int = field(default=DEFAULT_LIMIT)
+
+    max_elapsed: Optional[float] = field(default=DEFAULT_MAX_ELAPSED)
+
+    respect_retry_after: bool = field(default=DEFAULT_RESPECT_RETRY_AFTER)
+    max_retry_after: float = field(default=DEFAULT_MAX_RETRY_AFTER)
+
+    retry_statuses: AbstractSet[int] = field(default=DEFAULT_RETRY_STATUSES)
+
+    clock: Clock = field(default=clock, repr=False)
+
+    def should_retry_status(self, status: int) -> bool:
+        return status in self.retry_statuses
+
+    def create_backoff(self) -> ExponentialBackoff:
+        return ExponentialBackoff(
+            multiply=self.multiply, base=self.base, limit=self.limit, clock=self.clock
+        )
+
+    def compute_delay(self, backoff: ExponentialBackoff, retry_after: Optional[str]) -> float:
+        delay = backoff.delay()
+
+        if self.respect_retry_after and retry_after is not None:
+            retry_after_delay = parse_retry_after(retry_after)
+
+            if retry_after_delay is not None:
+                delay = max(delay, min(retry_after_delay, self.max_retry_after))
+
+        return delay
+
+    def can_wait(self, started_at: float, delay: float) -> bool:
+        max_elapsed = self.max_elapsed
+
+        if max_elapsed is None:
+            return True
+
+        return self.clock() - started_at + delay <= max_elapsed
@@ -12,6 +12,8 @@ F = TypeVar("F", bound="FromRobTop")
 
 @runtime_checkable
 class FromRobTop(Protocol):
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def from_robtop(cls: Type[F], string: str) -> F:
@@ -28,6 +30,8 @@ def is_from_robtop(item: Any) -> TypeGuard[FromRobTop]:
 
 @runtime_checkable
 class ToRobTop(Protocol):
+    __slots__ = ()
+
     @abstractmethod
     def to_robtop(self) -> str:
         ...
@@ -39,4 +43,4 @@ def is_to_robtop(item: Any) -> TypeGuard[ToRobTop]:
 
 @runtime_checkable
 class RobTop(FromRobTop, ToRobTop, Protocol):
-    pass
+    __slots__ = ()
@@ -0,0 +1,96 @@
+from random import choice, randrange, uniform
+from timeit import repeat
+
+import click
+from entrypoint import entrypoint
+
+from gd.encoding import (
+    SAVE_KEY,
+    compress,
+    decode_base64,
+    decode_save,
+    decompress,
+    encode_base64,
+    encode_save,
+)
+
+SIZE = 16 * 1024 * 1024  # 16 MiB
+REPEAT = 5
+NUMBER = 1
+ROUNDING = 3
+
+IDS = (1, 8, 36, 84, 141, 200, 201, 914, 1329)
+GROUPS = 999
+
+OBJECT_SEPARATOR = ";"
+
+LEGACY = "legacy {}: {}s"
+FUSED = "fused {}: {}s ({}x faster)"
+
+DECODE = "decode"
+ENCODE = "encode"
+
+
+def generate_object_string() -> str:
+    groups = ".".join(str(randrange(1, GROUPS)) for _ in range(randrange(4)))
+
+    string = f"1,{choice(IDS)},2,{uniform(0.0, 100_000.0)},3,{randrange(1000)},21,{randrange(10)}"
+
+    if groups:
+        string += f",57,{groups}"
+
+    return string
+
+
+def generate_level_data(size: int) -> bytes:
+    strings = []
+    length = 0
+
+    while length < size:
+        string = generate_object_string()
+
+        strings.append(string)
+
+        length += len(string) + len(OBJECT_SEPARATOR)
+
+    return OBJECT_SEPARATOR.join(strings).encode()
+
+
+def legacy_xor(data: bytes, key: int) -> bytes:
+    return bytes(byte ^ key for byte in data)
+
+
+def legacy_decode_save(data: bytes) -> bytes:
+    return decompress(decode_base64(legacy_xor(data, SAVE_KEY)))
+
+
+def legacy_encode_save(data: bytes) -> bytes:
+    return legacy_xor(encode_base64(compress(data)), SAVE_KEY)
+
+
+def best_of(function, *args) -> float:  # type: ignore
+    return min(repeat(lambda: function(*args), repeat=REPEAT, number=NUMBER))
+
+
+def compare(name: str, legacy: float, fused: float) -> None:
+    click.echo(LEGACY.format(name, round(legacy, ROUNDING)))
+    click.echo(FUSED.format(name, round(fused, ROUNDING), round(legacy / fused, ROUNDING)))
+
+
+@entrypoint(__name__)
+@click.option("--size", "-s", default=SIZE)
+@click.command()
+def main(size: int) -> None:
+    # serialized objects compress like actual saves do, unlike repeated or purely random data
+    data = generate_level_data(size)
+
+    encoded = encode_save(data)
+
+    if legacy_encode_save(data) != encoded or legacy_decode_save(encoded) != data:
+        raise RuntimeError("pipelines disagree")
+
+    if decode_save(encoded) != data:
+        raise RuntimeError("pipelines disagree")
+
+    compare(ENCODE, best_of(legacy_encode_save, data), best_of(encode_save, data))
+    compare(DECODE, best_of(legacy_decode_save, encoded), best_of(decode_save, encoded))
@@ -0,0 +1,56 @@
+from random import choice, randrange, uniform
+from timeit import repeat
+from typing import List
+
+import click
+from entrypoint import entrypoint
+
+from gd.api.objects import object_from_robtop, object_from_robtop_reference
+
+COUNT = 200_000
+REPEAT = 5
+NUMBER = 1
+ROUNDING = 3
+
+IDS = (1, 8, 36, 84, 141, 200, 201, 914, 1329)
+GROUPS = 999
+
+REFERENCE = "reference: {}s"
+FAST = "fast: {}s ({}x faster)"
+
+
+def generate_object_string() -> str:
+    groups = ".".join(str(randrange(1, GROUPS)) for _ in range(randrange(4)))
+
+    string = f"1,{choice(IDS)},2,{uniform(0.0, 100_000.0)},3,{randrange(1000)},21,{randrange(10)}"
+
+    if groups:
+        string += f",57,{groups}"
+
+    return string
+
+
+def parse_all(strings: List[str], parse) -> None:  # type: ignore
+    for string in strings:
+        parse(string)
+
+
+@entrypoint(__name__)
+@click.option("--count", "-c", default=COUNT)
+@click.command()
+def main(count: int) -> None:
+    strings = [generate_object_string() for _ in range(count)]
+
+    for string in strings:
+        if object_from_robtop(string) != object_from_robtop_reference(string):
+            raise RuntimeError("parsers disagree")
+
+    reference = min(
+        repeat(
+            lambda: parse_all(strings, object_from_robtop_reference), repeat=REPEAT, number=NUMBER
+        )
+    )
+    fast = min(repeat(lambda: parse_all(strings, object_from_robtop), repeat=REPEAT, number=NUMBER))
+
+    click.echo(REFERENCE.format(round(reference, ROUNDING)))
+    click.echo(FAST.format(round(fast, ROUNDING), round(reference / fast, ROUNDING)))
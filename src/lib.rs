@@ -1,6 +1,6 @@
-use pyo3::PyResult;
+use pyo3::{IntoPy, PyAny, PyObject, PyResult};
 use pyo3::marker::Python;
-use pyo3::types::{PyBytes, PyModule};
+use pyo3::types::{PyByteArray, PyBytes, PyDict, PyFloat, PyLong, PyModule, PyString};
 use pyo3::{pyfunction as py_function, pymodule as py_module, wrap_pyfunction as wrap_py_function};
 
 pub mod utils;
@@ -22,10 +22,62 @@ fn xor<'p>(python: Python<'p>, mut data: Vec<u8>, key: u8) -> PyResult<&'p PyByt
 }
 
 
+#[py_function(text_signature = "(data: bytearray, key: int)")]
+fn xor_in_place(data: &PyByteArray, key: u8) -> PyResult<()> {
+    // SAFETY: the GIL is held and no Python code runs while the buffer is borrowed
+    utils::xor_in_place(unsafe { data.as_bytes_mut() }, key);
+
+    Ok(())
+}
+
+
+const OBJECT_SEPARATOR: char = ',';
+
+
+#[py_function(text_signature = "(string: str, parsers: dict)")]
+fn parse_object<'p>(python: Python<'p>, string: &str, parsers: &PyDict) -> PyResult<&'p PyDict> {
+    let int_type = python.get_type::<PyLong>();
+    let float_type = python.get_type::<PyFloat>();
+
+    let arguments = PyDict::new(python);
+
+    let mut parts = string.split(OBJECT_SEPARATOR);
+
+    while let (Some(key), Some(value)) = (parts.next(), parts.next()) {
+        let parser = match parsers.get_item(key) {
+            Some(parser) => parser,
+            None => continue,
+        };
+
+        let (name, parse): (&PyString, &PyAny) = parser.extract()?;
+
+        // parse integers and floats natively, deferring to python if that fails
+        let native: Option<PyObject> = if parse.is(int_type) {
+            value.parse::<i64>().ok().map(|integer| integer.into_py(python))
+        } else if parse.is(float_type) {
+            value.parse::<f64>().ok().map(|float| float.into_py(python))
+        } else {
+            None
+        };
+
+        let parsed = match native {
+            Some(parsed) => parsed,
+            None => parse.call1((value,))?.into(),
+        };
+
+        arguments.set_item(name, parsed)?;
+    }
+
+    Ok(arguments)
+}
+
+
 #[py_module]
 fn _gd(_python: Python, module: &PyModule) -> PyResult<()> {
     module.add_function(wrap_py_function!(cyclic_xor, module)?)?;
     module.add_function(wrap_py_function!(xor, module)?)?;
+    module.add_function(wrap_py_function!(xor_in_place, module)?)?;
+    module.add_function(wrap_py_function!(parse_object, module)?)?;
 
     Ok(())
 }
@@ -0,0 +1,12 @@
+from attrs import define, field
+
+
+@define()
+class FakeClock:
+    now: float = field(default=0.0)
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, delta: float) -> None:
+        self.now += delta
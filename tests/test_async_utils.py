@@ -0,0 +1,60 @@
+from itertools import count
+from typing import AsyncIterator, List
+
+import pytest
+
+from gd.async_utils import stream_iterables
+
+
+class PageError(Exception):
+    pass
+
+
+async def page(index: int, size: int = 3) -> AsyncIterator[int]:
+    if index == 2:
+        raise PageError()
+
+    for item in range(size):
+        yield index * size + item
+
+
+async def collect(iterator: AsyncIterator[int]) -> List[int]:
+    return [item async for item in iterator]
+
+
+@pytest.mark.asyncio
+async def test_stream_iterables_skips_failed() -> None:
+    items = await collect(stream_iterables(map(page, range(4)), PageError, concurrency=2))
+
+    assert items == [0, 1, 2, 3, 4, 5, 9, 10, 11]
+
+
+@pytest.mark.asyncio
+async def test_stream_iterables_propagates() -> None:
+    with pytest.raises(PageError):
+        await collect(stream_iterables(map(page, range(4))))
+
+
+@pytest.mark.asyncio
+async def test_stream_iterables_truncate() -> None:
+    items = await collect(stream_iterables(map(page, count()), PageError, truncate=True))
+
+    assert items == [0, 1, 2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_stream_iterables_short_page() -> None:
+    def sized_page(index: int) -> AsyncIterator[int]:
+        return page(index, 3 if index < 1 else 2)
+
+    items = await collect(
+        stream_iterables(map(sized_page, count()), truncate=True, page_size=3, concurrency=4)
+    )
+
+    assert items == [0, 1, 2, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_stream_iterables_concurrency() -> None:
+    with pytest.raises(ValueError):
+        await collect(stream_iterables((), concurrency=0))
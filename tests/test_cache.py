@@ -0,0 +1,131 @@
+from pathlib import Path
+
+import pytest
+
+from gd.cache import MemoryCacheBackend, ResponseCache, SQLiteCacheBackend, create_key
+from tests.clock import FakeClock
+
+BASE = "http://www.boomlings.com/database/"
+ROUTE = "/getGJLevels21.php"
+OTHER_ROUTE = "/getGJUsers20.php"
+
+
+def test_memory_backend_ttl() -> None:
+    clock = FakeClock()
+
+    backend = MemoryCacheBackend(clock=clock)
+
+    backend.set("key", "value", 10.0)
+
+    assert backend.get("key") == "value"
+
+    clock.advance(11.0)
+
+    assert backend.get("key") is None
+    assert not backend.length()
+    assert not backend.size()
+
+
+def test_memory_backend_lru() -> None:
+    backend = MemoryCacheBackend(max_size=10)
+
+    backend.set("a", "aaaa", 60.0)
+    backend.set("b", "bbbb", 60.0)
+
+    assert backend.get("a") == "aaaa"  # now "b" is the least recently used
+
+    backend.set("c", "cccc", 60.0)
+
+    assert backend.get("b") is None
+    assert backend.get("a") == "aaaa"
+    assert backend.get("c") == "cccc"
+
+    assert backend.size() == 8
+
+    backend.set("d", "d" * 11, 60.0)  # too large to be stored
+
+    assert backend.get("d") is None
+    assert backend.length() == 2
+
+
+def test_sqlite_backend(tmp_path: Path) -> None:
+    clock = FakeClock()
+
+    backend = SQLiteCacheBackend(tmp_path / "cache.db", max_size=10, clock=clock)
+
+    try:
+        backend.set("a", "aaaa", 60.0)
+
+        clock.advance(1.0)
+
+        backend.set("b", "bbbb", 60.0)
+
+        clock.advance(1.0)
+
+        assert backend.get("a") == "aaaa"
+
+        clock.advance(1.0)
+
+        backend.set("c", "cccc", 60.0)
+
+        assert backend.get("b") is None
+        assert backend.get("a") == "aaaa"
+        assert backend.length() == 2
+        assert backend.size() == 8
+
+        clock.advance(120.0)
+
+        assert backend.get("a") is None
+
+        backend.clear()
+
+        assert not backend.length()
+
+    finally:
+        backend.close()
+
+
+def test_create_key() -> None:
+    payload = {"str": "", "page": 0, "udid": "random", "chk": "random"}
+
+    key = create_key(BASE, ROUTE, payload)
+
+    assert key == create_key(BASE, ROUTE, {"page": 0, "str": "", "udid": "other"})
+
+    assert key != create_key(BASE, ROUTE, {"page": 1, "str": ""})
+    assert key != create_key(BASE, OTHER_ROUTE, payload)
+
+
+def test_response_cache_blocking(tmp_path: Path) -> None:
+    assert not ResponseCache().blocking
+
+    backend = SQLiteCacheBackend(tmp_path / "cache.db")
+
+    assert ResponseCache(backend).blocking
+    assert not ResponseCache(backend, blocking=False).blocking
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("blocking", (False, True))
+async def test_response_cache(blocking: bool) -> None:
+    cache = ResponseCache(ttls={ROUTE: 60.0}, blocking=blocking)
+
+    key = cache.create_key(BASE, ROUTE, None)
+    other_key = cache.create_key(BASE, OTHER_ROUTE, None)
+
+    assert cache.is_cached(ROUTE)
+    assert not cache.is_cached(OTHER_ROUTE)
+
+    assert await cache.get_async(key) is None
+
+    await cache.set_async(key, ROUTE, "response")
+    await cache.set_async(other_key, OTHER_ROUTE, "response")
+
+    assert await cache.get_async(key) == "response"
+    assert await cache.get_async(other_key) is None
+
+    statistics = cache.statistics()
+
+    assert statistics.hits == 1
+    assert statistics.misses == 2
+    assert statistics.length == 1
@@ -0,0 +1,41 @@
+from typing import List
+
+import pytest
+
+from gd.api.convert import convert_level, convert_levels
+from gd.api.editor import Editor
+from gd.api.header import Header
+from gd.api.objects import Object
+from gd.encoding import zip_level
+
+COUNT = 10
+WORKERS = 2
+
+
+def create_editor(count: int) -> Editor:
+    return Editor(Header(), [Object(id=1, x=float(x)) for x in range(count)])
+
+
+def create_levels() -> List[bytes]:
+    return [zip_level(create_editor(count).to_robtop().encode()) for count in range(COUNT)]
+
+
+def test_convert_level() -> None:
+    editor = create_editor(COUNT)
+
+    data = zip_level(editor.to_robtop().encode())
+
+    assert Editor.from_bytes(convert_level(data)).objects == editor.objects
+
+
+def test_convert_levels_keeps_order() -> None:
+    levels = create_levels()
+
+    expected = [convert_level(level) for level in levels]
+
+    assert list(convert_levels(levels, workers=WORKERS, in_flight=3)) == expected
+
+
+def test_convert_levels_in_flight_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        list(convert_levels(create_levels(), workers=WORKERS, in_flight=0))
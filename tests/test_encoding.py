@@ -0,0 +1,106 @@
+from gzip import compress as gzip_compress
+from typing import Callable
+from zlib import compress as zlib_compress
+from zlib import compressobj as create_compressor
+
+import pytest
+
+from gd.encoding import (
+    decode_save,
+    decompress_once,
+    encode_base64_url_safe,
+    encode_save,
+    iter_decompress,
+    iter_unzip_level,
+    iter_unzip_level_string,
+    pad_base64,
+    unzip_level,
+    unzip_level_string,
+    zip_level,
+    zip_level_string,
+)
+
+DATA = b"1,1,2,15,3,45;" * 10000
+STRING = "kA13,0;1,1,2,15,3,45;" * 1000
+
+RAW_WBITS = -15
+
+
+def compress_raw(data: bytes) -> bytes:
+    compressor = create_compressor(wbits=RAW_WBITS)
+
+    return compressor.compress(data) + compressor.flush()
+
+
+def test_pad_base64_does_not_mutate() -> None:
+    for length in (1, 2, 3, 5, 6, 7):
+        data = bytearray(b"A" * length)
+        copied = bytes(data)
+
+        padded = pad_base64(data)
+
+        assert data == copied
+        assert len(padded) % 4 == 0
+
+
+def test_unzip_level_does_not_mutate() -> None:
+    zipped = bytearray(zip_level(DATA).rstrip(b"="))
+    copied = bytes(zipped)
+
+    assert unzip_level(zipped) == DATA
+
+    assert zipped == copied
+
+
+@pytest.mark.parametrize("type", (bytes, bytearray, memoryview))
+def test_zip_level_round_trip(type: type) -> None:
+    assert unzip_level(type(zip_level(DATA))) == DATA
+
+
+def test_zip_level_string_round_trip() -> None:
+    assert unzip_level_string(zip_level_string(STRING)) == STRING
+
+
+def test_unzip_level_url_safe() -> None:
+    zipped = encode_base64_url_safe(gzip_compress(DATA))
+
+    assert unzip_level(zipped) == DATA
+
+
+def test_save_round_trip() -> None:
+    assert decode_save(encode_save(DATA)) == DATA
+    assert decode_save(bytearray(encode_save(DATA))) == DATA
+
+
+@pytest.mark.parametrize("compress", (gzip_compress, zlib_compress, compress_raw))
+def test_decompress_once(compress: Callable[[bytes], bytes]) -> None:
+    assert decompress_once(compress(DATA)) == DATA
+
+
+def test_decompress_once_invalid() -> None:
+    with pytest.raises(ValueError):
+        decompress_once(b"\x1f\x8bnot really gzip")
+
+
+@pytest.mark.parametrize("chunk_size", (1, 1000, 1 << 20))
+def test_iter_decompress(chunk_size: int) -> None:
+    chunks = list(iter_decompress(gzip_compress(DATA), chunk_size))
+
+    assert all(len(chunk) <= chunk_size for chunk in chunks)
+
+    assert b"".join(chunks) == DATA
+
+
+@pytest.mark.parametrize("chunk_size", (1, 1000, 1 << 20))
+def test_iter_unzip_level(chunk_size: int) -> None:
+    zipped = zip_level(DATA)
+
+    assert b"".join(iter_unzip_level(zipped, chunk_size)) == unzip_level(zipped)
+
+
+def test_iter_unzip_level_string() -> None:
+    string = "жпг" * 1000  # multi-byte characters get split between chunks
+
+    zipped = zip_level_string(string)
+
+    assert "".join(iter_unzip_level_string(zipped, chunk_size=7)) == unzip_level_string(zipped)
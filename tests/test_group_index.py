@@ -0,0 +1,77 @@
+from random import Random
+from typing import List
+
+from gd.api.editor import Editor
+from gd.api.header import Header
+from gd.api.objects import Groups, MoveTrigger, Object
+
+SEED = 42
+
+
+def random_objects(random: Random, count: int) -> List[Object]:
+    return [
+        Object(
+            id=1,
+            x=random.uniform(-300.0, 3000.0),
+            y=random.uniform(-300.0, 600.0),
+            groups=Groups(random.sample(range(1, 10), random.randrange(3))),
+        )
+        for _ in range(count)
+    ]
+
+
+def test_group_index() -> None:
+    objects = random_objects(Random(SEED), 200)
+
+    editor = Editor(Header(), objects)
+
+    expected = {id(object) for object in objects if 3 in object.groups}
+
+    editor.enable_group_index()
+
+    assert {id(object) for object in editor.iter_objects_in_group(3)} == expected
+
+    object = Object(id=1)
+
+    editor.add_objects(object)
+
+    object.add_groups(3)
+
+    assert object in list(editor.iter_objects_in_group(3))
+
+    object.remove_groups(3)
+
+    assert object not in list(editor.iter_objects_in_group(3))
+
+    editor.remove_objects(*editor.iter_objects_in_group(3))
+
+    assert not list(editor.iter_objects_in_group(3))
+
+
+def test_group_index_set_attributes() -> None:
+    trigger = MoveTrigger(id=901, target_group_id=2)
+    object = Object(id=1, groups=Groups({2}))
+
+    editor = Editor(Header(), [trigger, object])
+
+    editor.enable_group_index()
+
+    assert editor.free_group == 1
+
+    trigger.target_group_id = 1
+
+    assert list(editor.iter_objects_targeting(1)) == [trigger]
+    assert not list(editor.iter_objects_targeting(2))
+
+    assert editor.free_group == 3
+
+    object.groups = Groups({3})
+
+    assert list(editor.iter_objects_in_group(3)) == [object]
+    assert not list(editor.iter_objects_in_group(2))
+
+    object.base_color_id = 7
+    object.detail_color_id = 8
+
+    assert list(editor.iter_objects_with_color_id(7)) == [object]
+    assert list(editor.iter_objects_with_color_id(8)) == [object]
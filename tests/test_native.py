@@ -0,0 +1,76 @@
+from itertools import cycle
+from random import Random
+
+import pytest
+
+from gd.api.objects import (
+    OBJECT_ID_TO_TYPE,
+    Object,
+    find_object_id,
+    get_object_parsers,
+    object_from_robtop_reference,
+)
+from tests.test_objects import random_object_string
+
+native = pytest.importorskip("_gd._gd")
+
+SEED = 13
+SIZE = 1000
+
+KEYS = (0, 1, 11, 255)
+CYCLIC_KEY = b"26364"
+
+
+def reference_xor(data: bytes, key: int) -> bytes:
+    return bytes(byte ^ key for byte in data)
+
+
+def reference_cyclic_xor(data: bytes, key: bytes) -> bytes:
+    return bytes(byte ^ key_byte for byte, key_byte in zip(data, cycle(key)))
+
+
+def random_data() -> bytes:
+    random = Random(SEED)
+
+    return bytes(random.randrange(256) for _ in range(SIZE))
+
+
+@pytest.mark.parametrize("key", KEYS)
+def test_xor_matches_reference(key: int) -> None:
+    data = random_data()
+
+    assert native.xor(data, key) == reference_xor(data, key)
+
+
+@pytest.mark.parametrize("key", KEYS)
+def test_xor_in_place_matches_reference(key: int) -> None:
+    data = random_data()
+    buffer = bytearray(data)
+
+    native.xor_in_place(buffer, key)
+
+    assert buffer == reference_xor(data, key)
+
+
+def test_cyclic_xor_matches_reference() -> None:
+    data = random_data()
+
+    assert native.cyclic_xor(data, CYCLIC_KEY) == reference_cyclic_xor(data, CYCLIC_KEY)
+
+
+def test_parse_object_matches_reference() -> None:
+    random = Random(SEED)
+
+    for _ in range(1000):
+        string = random_object_string(random)
+
+        object_type = OBJECT_ID_TO_TYPE.get(find_object_id(string), Object)
+
+        parsers = get_object_parsers(object_type)
+
+        if parsers is None:
+            continue
+
+        object = object_type(**native.parse_object(string, parsers))
+
+        assert object == object_from_robtop_reference(string)
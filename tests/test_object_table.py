@@ -0,0 +1,69 @@
+from random import Random
+from typing import List
+
+import pytest
+
+from gd.api.object_table import ObjectTable
+from gd.api.objects import Groups, MoveTrigger, Object, RotateTrigger
+from gd.api.transform import Transform
+
+SEED = 42
+
+
+def random_objects(random: Random, count: int) -> List[Object]:
+    return [
+        Object(
+            id=1,
+            x=random.uniform(-300.0, 3000.0),
+            y=random.uniform(-300.0, 600.0),
+            groups=Groups(random.sample(range(1, 10), random.randrange(3))),
+        )
+        for _ in range(count)
+    ]
+
+
+def test_object_table_round_trip() -> None:
+    objects = random_objects(Random(SEED), 100)
+
+    objects.append(MoveTrigger(id=901, target_group_id=3, x_offset=30.0, y_offset=-15.0))
+    objects.append(RotateTrigger(id=1346, target_group_id=4, target_rotation=90.0))
+
+    table = ObjectTable.from_object_iterable(objects)
+
+    assert len(table) == len(objects)
+    assert table.to_objects() == objects
+
+    assert table[-1] == objects[-1]
+    assert list(table[10:20]) == objects[10:20]
+
+    assert list(table.iter_indices_in_group(3)) == [
+        index for index, object in enumerate(objects) if 3 in object.groups
+    ]
+
+    assert list(table.iter_indices_with_ids(901, 1346)) == [len(objects) - 2, len(objects) - 1]
+
+
+@pytest.mark.parametrize(
+    "transform",
+    (
+        Transform.translation(30.0, -15.0),
+        Transform.rotation(90.0, 15.0, 15.0),
+        Transform.h_mirror(150.0).then(Transform.scaling(2.0)),
+    ),
+)
+def test_object_table_apply_transform(transform: Transform) -> None:
+    objects = random_objects(Random(SEED), 20)
+
+    objects.append(MoveTrigger(id=901, target_group_id=3, x_offset=30.0, y_offset=-15.0))
+    objects.append(RotateTrigger(id=1346, target_group_id=4, target_rotation=90.0))
+
+    table = ObjectTable.from_object_iterable(objects)
+    partial = ObjectTable.from_object_iterable(objects)
+
+    transform.apply_to_objects(objects)
+
+    table.apply_transform(transform)
+    partial.apply_transform(transform, range(len(objects)))
+
+    assert table.to_objects() == objects
+    assert partial.to_objects() == objects
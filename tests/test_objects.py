@@ -0,0 +1,358 @@
+import copy
+from enum import Enum
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from random import Random
+from typing import Any, Dict, Iterator, Type
+
+import pytest
+from attrs import Factory, fields
+
+from gd.api.editor import Editor, LazyBinaryEditor, LazyEditor
+from gd.api.header import Header
+from gd.api.hsv import HSV
+from gd.api.objects import (
+    OBJECT_ID_TO_TYPE,
+    TRIGGER_TYPE_TO_TYPE,
+    TYPE_TO_OBJECT_TYPE,
+    AlphaTrigger,
+    CollisionTrigger,
+    Groups,
+    MoveTrigger,
+    Object,
+    PickupItem,
+    SecretCoin,
+    SpawnTrigger,
+    ToggleTrigger,
+    TouchTrigger,
+    Trigger,
+    object_from_robtop,
+    object_from_robtop_reference,
+    object_to_robtop_cached,
+    objects_from_buffer,
+    objects_to_buffer,
+)
+from gd.binary import RANDOM_ACCESS_VERSION, VERSION
+from gd.binary_utils import U16_CODEC, get_array_codec
+from gd.color import Color
+from gd.enums import (
+    ByteOrder,
+    Easing,
+    PickupItemMode,
+    PulseMode,
+    TargetType,
+    ToggleType,
+    TriggerType,
+)
+
+SEED = 13
+
+IDS = (1, 3, 8, 12, 36, 84, 141, 200, 201, 747, 914, 1329)
+
+OPTIONAL_PARTS = (
+    ("2", "150.5"),
+    ("3", "75"),
+    ("4", "1"),
+    ("5", "0"),
+    ("6", "45.5"),
+    ("12", "2"),
+    ("21", "4"),
+    ("22", "9"),
+    ("24", "3"),
+    ("25", "7"),
+    ("32", "1.5"),
+    ("43", "10a0.5a1a1a0"),
+    ("57", "3.1.2"),
+    ("108", "3"),
+)
+
+
+def random_object_string(random: Random) -> str:
+    parts = [("1", str(random.choice(IDS)))]
+
+    parts.extend(part for part in OPTIONAL_PARTS if random.random() < 0.5)
+
+    return ",".join(key + "," + value for key, value in parts)
+
+
+def test_object_from_robtop_matches_reference() -> None:
+    random = Random(SEED)
+
+    for _ in range(1000):
+        string = random_object_string(random)
+
+        object = object_from_robtop(string)
+        reference = object_from_robtop_reference(string)
+
+        assert type(object) is type(reference)
+        assert object == reference
+
+
+SAMPLES = (
+    Object(id=1, x=15.0, y=45.0, rotation=90.0, groups=Groups((1, 2))),
+    SecretCoin(id=142, coin_id=2),
+    AlphaTrigger(id=1007, target_group_id=3, duration=1.5, opacity=0.25, spawn_triggered=True),
+    MoveTrigger(
+        id=901,
+        target_group_id=4,
+        duration=2.0,
+        easing=Easing.BOUNCE_IN,
+        easing_rate=1.5,
+        x_offset=30.0,
+        y_offset=-60.0,
+        target_type=TargetType.Y,
+    ),
+    SpawnTrigger(id=1268, target_group_id=2, delay=0.75),
+    ToggleTrigger(id=1049, target_group_id=7, activate_group=True),
+    TouchTrigger(id=1595, target_group_id=3, toggle_type=ToggleType.TOGGLE_OFF),
+    CollisionTrigger(id=1815, block_a_id=1, block_b_id=2, target_group_id=3, activate_group=True),
+    PickupItem(id=1275, target_group_id=3, item_id=4, mode=PickupItemMode.TOGGLE_TRIGGER),
+)
+
+
+def test_lazy_editor() -> None:
+    editor = Editor(Header(), list(SAMPLES))
+
+    string = editor.to_robtop()
+
+    lazy_editor = LazyEditor.from_robtop(string)
+
+    assert len(lazy_editor) == len(SAMPLES)
+
+    assert lazy_editor[2] == SAMPLES[2]
+    assert not lazy_editor.is_parsed(3)
+
+    assert lazy_editor.to_robtop() == string
+    assert lazy_editor.to_editor().objects == list(SAMPLES)
+
+
+# the binary format of collision triggers does not store target groups
+BINARY_SAMPLES = [
+    object
+    for object in SAMPLES
+    if type(object) in TYPE_TO_OBJECT_TYPE and type(object) is not CollisionTrigger
+]
+
+
+@pytest.mark.parametrize("version", (VERSION, RANDOM_ACCESS_VERSION))
+def test_editor_binary_round_trip(version: int) -> None:
+    editor = Editor(Header(), list(BINARY_SAMPLES))
+
+    assert Editor.from_bytes(editor.to_bytes(version=version), version=version) == editor
+
+
+def test_lazy_binary_editor() -> None:
+    editor = Editor(Header(), list(BINARY_SAMPLES))
+
+    data = editor.to_bytes(version=RANDOM_ACCESS_VERSION)
+
+    with LazyBinaryEditor.from_bytes(data, version=RANDOM_ACCESS_VERSION) as lazy_editor:
+        assert not lazy_editor.is_read(1)
+
+        assert lazy_editor[1] == BINARY_SAMPLES[1]
+        assert lazy_editor.is_read(1)
+
+        assert list(lazy_editor[1:3]) == BINARY_SAMPLES[1:3]
+        assert lazy_editor.to_editor().objects == BINARY_SAMPLES
+
+    with LazyBinaryEditor.from_bytes(data, version=RANDOM_ACCESS_VERSION) as lazy_editor:
+        pass
+
+    with pytest.raises(ValueError):  # the view is released
+        lazy_editor.read(0)
+
+
+def test_lazy_binary_editor_mmap(tmp_path: Path) -> None:
+    path = tmp_path / "level.gdb"
+
+    path.write_bytes(Editor(Header(), list(BINARY_SAMPLES)).to_bytes(version=RANDOM_ACCESS_VERSION))
+
+    with path.open("rb") as file, mmap(file.fileno(), 0, access=ACCESS_READ) as buffer:
+        with LazyBinaryEditor.from_bytes(buffer, version=RANDOM_ACCESS_VERSION) as editor:
+            assert list(editor) == BINARY_SAMPLES
+
+
+def test_codecs() -> None:
+    for order in ByteOrder:
+        assert U16_CODEC.unpack(U16_CODEC.pack(513, order=order), order=order) == (513,)
+
+    codec = get_array_codec(U16_CODEC.format, 3)
+
+    assert codec is get_array_codec(U16_CODEC.format, 3)
+
+    assert codec.size == 3 * U16_CODEC.size
+    assert codec.unpack(codec.pack(1, 2, 3)) == (1, 2, 3)
+
+
+@pytest.mark.parametrize("version", (VERSION, RANDOM_ACCESS_VERSION))
+@pytest.mark.parametrize("order", (ByteOrder.LITTLE, ByteOrder.BIG))
+def test_objects_binary_round_trip(version: int, order: ByteOrder) -> None:
+    buffer = objects_to_buffer(BINARY_SAMPLES, order, version)
+
+    assert objects_from_buffer(buffer, order=order, version=version) == BINARY_SAMPLES
+
+
+def test_dirty_tracking() -> None:
+    object = Object(id=1, x=15.0)
+
+    assert object.is_dirty()
+
+    string = object_to_robtop_cached(object)
+
+    assert not object.is_dirty()
+    assert object_to_robtop_cached(object) is string
+
+    object.x = 45.0
+
+    assert object.is_dirty()
+    assert object_to_robtop_cached(object) == object.to_robtop()
+
+    object.add_groups(1)
+
+    assert object.is_dirty()
+
+
+def test_editor_robtop_cache() -> None:
+    objects = [Object(id=1, x=float(x)) for x in range(10)]
+
+    editor = Editor(Header(), objects)
+
+    editor.enable_robtop_cache()
+
+    string = editor.to_robtop()
+
+    assert not any(object.is_dirty() for object in objects)
+
+    objects[3].y = 30.0
+
+    assert objects[3].is_dirty()
+
+    assert editor.to_robtop() != string
+    assert Editor.from_robtop(editor.to_robtop()).objects == objects
+
+
+@pytest.mark.parametrize("object", SAMPLES)
+def test_object_from_robtop_dispatch(object: Object) -> None:
+    string = object.to_robtop()
+
+    result = object_from_robtop(string)
+
+    assert type(result) is type(object)
+    assert result == object
+
+    assert object_from_robtop_reference(string) == object
+
+
+def test_object_id_table() -> None:
+    for object_id, object_type in OBJECT_ID_TO_TYPE.items():
+        assert type(object_from_robtop(Object(id=object_id).to_robtop())) is object_type
+
+
+OBJECT_NAMES = {field.name for field in fields(Object)}
+
+ALTERED_INT = 3
+ALTERED_FLOAT = 1.5
+ALTERED_COLOR = Color(0x123456)
+ALTERED_HSV = HSV(h=30, s=0.5, v=1.5, s_checked=True, v_checked=True)
+
+# some attributes are only stored along with others
+DEPENDENCIES: Dict[str, Dict[str, Any]] = {
+    "easing_rate": {"easing": Easing.EASE_IN},
+    "copied_color_hsv": {"copied_color_id": ALTERED_INT},
+    "hsv": {"mode": PulseMode.HSV},
+}
+
+
+def iter_values(default: Any) -> Iterator[Any]:
+    if isinstance(default, bool):
+        yield not default
+
+    elif isinstance(default, Enum):
+        yield from type(default)
+
+    elif isinstance(default, int):
+        yield default + ALTERED_INT
+
+    elif isinstance(default, float):
+        yield default + ALTERED_FLOAT
+
+    elif isinstance(default, Color):
+        yield ALTERED_COLOR
+
+    elif isinstance(default, HSV):
+        yield ALTERED_HSV
+
+
+def iter_variants(trigger_class: Type[Trigger]) -> Iterator[Dict[str, Any]]:
+    """Yields keyword arguments that change one attribute of `trigger_class` at a time."""
+    for field in fields(trigger_class):
+        name = field.name
+
+        if name in OBJECT_NAMES or not field.init:
+            continue
+
+        default = field.default
+
+        if isinstance(default, Factory):
+            default = default.factory()  # type: ignore
+
+        dependencies = DEPENDENCIES.get(name, {})
+
+        for value in iter_values(default):
+            yield {**dependencies, name: value}
+
+
+@pytest.mark.parametrize(("trigger_type", "trigger_class"), TRIGGER_TYPE_TO_TYPE.items())
+def test_trigger_robtop_round_trip(trigger_type: TriggerType, trigger_class: Type[Trigger]) -> None:
+    for arguments in iter_variants(trigger_class):
+        trigger = trigger_class(id=trigger_type.id, **arguments)
+
+        assert object_from_robtop(trigger.to_robtop()) == trigger, arguments
+
+
+def test_move_trigger_unknown_target_mode() -> None:
+    string = MoveTrigger(id=901, target_type=TargetType.X).to_robtop().replace("101,1", "101,7")
+
+    assert object_from_robtop(string).target_type is TargetType.BOTH
+
+
+def test_groups() -> None:
+    groups = Groups((5, 1, 3, 3))
+
+    assert list(groups) == [1, 3, 5]
+    assert 3 in groups
+    assert 4 not in groups
+    assert "3" not in groups
+
+    groups.add(4)
+    groups.discard(1)
+
+    assert list(groups) == [3, 4, 5]
+
+    assert groups == {3, 4, 5}
+
+    assert Groups.from_robtop(groups.to_robtop()) == groups
+
+    with pytest.raises(KeyError):
+        groups.remove(1)
+
+
+def test_groups_are_compact() -> None:
+    assert not hasattr(Groups(), "__dict__")
+
+
+def test_groups_copy() -> None:
+    groups = Groups((1, 2))
+
+    for copied in (groups.copy(), copy.copy(groups), copy.deepcopy(groups)):
+        copied.add(3)
+
+        assert copied == {1, 2, 3}
+        assert groups == {1, 2}
+
+    empty = Groups()
+    other = Groups()
+
+    empty.add(1)
+
+    assert not other
@@ -0,0 +1,86 @@
+from typing import AbstractSet, AsyncIterator, List, Optional
+
+import pytest
+from attrs import define, field
+
+from gd.client import paginate
+from gd.errors import ClientError, NothingFound
+from gd.models import PageModel
+
+PAGE_SIZE = 3
+TOTAL = 10
+
+NAME = "page"
+
+
+@define()
+class Response:
+    items: List[int] = field()
+    page: PageModel = field()
+
+
+@define()
+class Server:
+    total: Optional[int] = field(default=TOTAL)
+    length: int = field(default=TOTAL)
+
+    failing: AbstractSet[int] = field(factory=frozenset)
+    missing: AbstractSet[int] = field(factory=frozenset)
+
+    async def request(self, page: int) -> Response:
+        if page in self.failing:
+            raise ClientError()
+
+        start = page * PAGE_SIZE
+
+        if page in self.missing or start >= self.length:
+            raise NothingFound(NAME)
+
+        items = list(range(start, min(start + PAGE_SIZE, self.length)))
+
+        return Response(items, PageModel(self.total, start, PAGE_SIZE))
+
+
+def get_items(response: Response) -> List[int]:
+    return response.items
+
+
+async def collect(iterator: AsyncIterator[int]) -> List[int]:
+    return [item async for item in iterator]
+
+
+@pytest.mark.asyncio
+async def test_paginate_known_total() -> None:
+    server = Server()
+
+    assert await collect(paginate(server.request, get_items)) == list(range(TOTAL))
+
+
+@pytest.mark.asyncio
+async def test_paginate_unknown_total() -> None:
+    server = Server(total=None)
+
+    assert await collect(paginate(server.request, get_items)) == list(range(TOTAL))
+
+
+@pytest.mark.asyncio
+async def test_paginate_propagates_errors() -> None:
+    for total in (TOTAL, None):
+        server = Server(total=total, failing={2})
+
+        with pytest.raises(ClientError):
+            await collect(paginate(server.request, get_items))
+
+
+@pytest.mark.asyncio
+async def test_paginate_stops_on_missing_page() -> None:
+    server = Server(missing={2})
+
+    assert await collect(paginate(server.request, get_items)) == list(range(2 * PAGE_SIZE))
+
+
+@pytest.mark.asyncio
+async def test_paginate_nothing_found() -> None:
+    server = Server(length=0)
+
+    assert not await collect(paginate(server.request, get_items))
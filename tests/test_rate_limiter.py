@@ -0,0 +1,75 @@
+import pytest
+
+from gd.rate_limiter import RateLimiter, TokenBucket
+from tests.clock import FakeClock
+
+
+def test_token_bucket() -> None:
+    clock = FakeClock()
+
+    bucket = TokenBucket(2.0, 4.0, clock=clock)
+
+    for _ in range(4):
+        assert not bucket.try_acquire()
+
+    assert bucket.try_acquire() == pytest.approx(0.5)
+    assert bucket.try_acquire(2.0) == pytest.approx(1.0)
+
+    clock.advance(0.5)
+
+    assert not bucket.try_acquire()
+
+    clock.advance(60.0)
+
+    assert bucket.tokens == 4.0  # capped by the capacity
+
+
+def test_token_bucket_invalid() -> None:
+    with pytest.raises(ValueError):
+        TokenBucket(0.0, 1.0)
+
+    with pytest.raises(ValueError):
+        TokenBucket(1.0, 0.0)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_acquire() -> None:
+    bucket = TokenBucket(1000.0, 1.0)
+
+    assert not await bucket.acquire()
+    assert await bucket.acquire() > 0.0
+
+
+def test_rate_limiter_capacity() -> None:
+    rate_limiter = RateLimiter(rate=0.5)
+
+    bucket = rate_limiter._global_bucket
+
+    assert bucket is not None
+    assert bucket.capacity == 1.0
+
+    assert not bucket.try_acquire()
+
+
+def test_rate_limiter_burst() -> None:
+    with pytest.raises(ValueError):
+        RateLimiter(rate=1.0, burst=0.5)
+
+    with pytest.raises(ValueError):
+        RateLimiter(route_rate=1.0, route_burst=0.0)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_limit() -> None:
+    rate_limiter = RateLimiter(rate=1000.0, concurrency=2)
+
+    for _ in range(3):
+        async with rate_limiter.limit("route"):
+            assert rate_limiter.in_flight == 1
+
+    assert not rate_limiter.in_flight
+
+    statistics = rate_limiter.statistics()
+
+    assert statistics.total == 3
+    assert statistics.peak_in_flight == 1
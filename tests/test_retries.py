@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime as format_date_time
+
+from gd.retries import RetryPolicy, parse_retry_after
+from tests.clock import FakeClock
+
+
+def test_parse_retry_after() -> None:
+    assert parse_retry_after("13") == 13.0
+    assert parse_retry_after(" 1.5 ") == 1.5
+    assert parse_retry_after("-1") == 0.0
+
+    assert parse_retry_after("soon") is None
+
+    date_time = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    delay = parse_retry_after(format_date_time(date_time, usegmt=True))
+
+    assert delay is not None
+    assert 25.0 < delay <= 30.0
+
+
+def test_retry_policy_statuses() -> None:
+    policy = RetryPolicy()
+
+    assert policy.should_retry_status(429)
+    assert policy.should_retry_status(503)
+
+    assert not policy.should_retry_status(200)
+    assert not policy.should_retry_status(404)
+
+
+def test_retry_policy_compute_delay() -> None:
+    policy = RetryPolicy(multiply=0.0, max_retry_after=10.0)
+
+    backoff = policy.create_backoff()
+
+    assert policy.compute_delay(backoff, None) == 0.0
+    assert policy.compute_delay(backoff, "5") == 5.0
+    assert policy.compute_delay(backoff, "120") == 10.0
+    assert policy.compute_delay(backoff, "never") == 0.0
+
+    policy = RetryPolicy(multiply=0.0, respect_retry_after=False)
+
+    assert policy.compute_delay(policy.create_backoff(), "5") == 0.0
+
+
+def test_retry_policy_can_wait() -> None:
+    clock = FakeClock()
+
+    policy = RetryPolicy(max_elapsed=10.0, clock=clock)
+
+    assert policy.can_wait(0.0, 10.0)
+
+    clock.advance(5.0)
+
+    assert policy.can_wait(0.0, 5.0)
+    assert not policy.can_wait(0.0, 5.5)
+
+    assert RetryPolicy(max_elapsed=None, clock=clock).can_wait(0.0, 1000.0)
@@ -0,0 +1,103 @@
+from math import hypot
+from random import Random
+from typing import List
+
+import pytest
+
+from gd.api.editor import Editor
+from gd.api.header import Header
+from gd.api.objects import Groups, Object
+from gd.api.spatial_index import SpatialIndex
+
+SEED = 42
+
+
+def random_objects(random: Random, count: int) -> List[Object]:
+    return [
+        Object(
+            id=1,
+            x=random.uniform(-300.0, 3000.0),
+            y=random.uniform(-300.0, 600.0),
+            groups=Groups(random.sample(range(1, 10), random.randrange(3))),
+        )
+        for _ in range(count)
+    ]
+
+
+def test_spatial_index_nearest() -> None:
+    random = Random(SEED)
+
+    objects = random_objects(random, 500)
+
+    index = SpatialIndex()
+
+    index.add_from_iterable(objects)
+
+    for _ in range(100):
+        x = random.uniform(-500.0, 3500.0)
+        y = random.uniform(-500.0, 800.0)
+
+        expected = min(hypot(object.x - x, object.y - y) for object in objects)
+
+        nearest = index.nearest(x, y)
+
+        assert nearest is not None
+        assert hypot(nearest.x - x, nearest.y - y) == expected
+
+        assert index.nearest(x, y, max_distance=expected / 2.0) is None
+
+
+def test_spatial_index_query_rectangle() -> None:
+    random = Random(SEED)
+
+    objects = random_objects(random, 500)
+
+    index = SpatialIndex(cell_size=45.0)
+
+    index.add_from_iterable(objects)
+
+    for _ in range(50):
+        x_start = random.uniform(-300.0, 3000.0)
+        y_start = random.uniform(-300.0, 600.0)
+        x_stop = x_start + random.uniform(0.0, 500.0)
+        y_stop = y_start + random.uniform(0.0, 500.0)
+
+        expected = {
+            id(object)
+            for object in objects
+            if x_start <= object.x <= x_stop and y_start <= object.y <= y_stop
+        }
+
+        result = {id(object) for object in index.query_rectangle(x_start, y_start, x_stop, y_stop)}
+
+        assert result == expected
+
+
+def test_spatial_index_move() -> None:
+    editor = Editor(Header(), [Object(id=1, x=15.0, y=15.0)])
+
+    editor.enable_spatial_index()
+
+    (object,) = editor.objects
+
+    object.move(3000.0, 0.0)
+
+    assert not list(editor.iter_objects_in_rectangle(0.0, 0.0, 30.0, 30.0))
+    assert editor.nearest_object(3000.0, 0.0) is object
+    assert editor.x_length == 3015.0
+
+
+def test_observer_conflict() -> None:
+    objects = [Object(id=1), Object(id=1)]
+
+    editor = Editor(Header(), list(objects))
+    other = Editor(Header(), objects[1:])
+
+    other.enable_spatial_index()
+
+    with pytest.raises(ValueError):
+        editor.enable_spatial_index()
+
+    assert editor.spatial_index is None
+    assert objects[0].observer is None  # nothing is attached on failure
+    assert objects[1].observer is other
@@ -0,0 +1,136 @@
+from random import Random
+from typing import List
+
+import pytest
+
+from gd.api.editor import Editor, get_time_length
+from gd.api.header import Header
+from gd.api.objects import Object
+from gd.api.speed_timeline import SpeedTimeline
+from gd.enums import Speed, SpeedChangeType
+
+SEED = 7
+
+
+def random_speed_changes(random: Random, count: int) -> List[Object]:
+    speed_change_ids = [speed_change_type.id for speed_change_type in SpeedChangeType]
+
+    return [
+        Object(id=random.choice(speed_change_ids), x=random.uniform(0.0, 10000.0))
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("speed", tuple(Speed))
+def test_time_at_matches_get_time_length(speed: Speed) -> None:
+    random = Random(SEED)
+
+    speed_changes = random_speed_changes(random, 50)
+
+    editor = Editor(Header(speed=speed), speed_changes + [Object(id=1, x=10000.0)])
+
+    ordered = sorted(speed_changes, key=lambda speed_change: speed_change.x)
+
+    for _ in range(100):
+        x = random.uniform(0.0, 12000.0)
+
+        assert editor.time_at(x) == pytest.approx(get_time_length(x, speed, ordered))
+
+    assert editor.length == pytest.approx(get_time_length(10000.0, speed, ordered))
+
+
+def test_x_at_inverts_time_at() -> None:
+    random = Random(SEED)
+
+    timeline = SpeedTimeline.from_speed_changes(Speed.FAST, random_speed_changes(random, 50))
+
+    for _ in range(100):
+        x = random.uniform(0.0, 12000.0)
+
+        assert timeline.x_at(timeline.time_at(x)) == pytest.approx(x)
+
+    xs = [random.uniform(0.0, 12000.0) for _ in range(100)]
+
+    times = timeline.times_at(xs)
+
+    assert list(times) == [timeline.time_at(x) for x in xs]
+    assert list(timeline.xs_at(times)) == pytest.approx(xs)
+
+
+def test_speed_timeline_invalidation() -> None:
+    speed_change = Object(id=SpeedChangeType.FASTEST.id, x=300.0)
+
+    editor = Editor(Header(), [speed_change])
+
+    time = editor.time_at(600.0)
+
+    speed_change.move(150.0)
+
+    assert editor.time_at(600.0) > time
+
+    editor.header.speed = Speed.SLOW
+
+    assert editor.time_at(150.0) == pytest.approx(get_time_length(150.0, Speed.SLOW))
+
+    editor.remove_objects(speed_change)
+
+    assert editor.time_at(600.0) == pytest.approx(get_time_length(600.0, Speed.SLOW))
+
+
+def test_length_follows_direct_changes() -> None:
+    editor = Editor(Header(), [Object(id=1, x=3000.0)])
+
+    length = editor.length
+
+    portal = Object(id=SpeedChangeType.FASTEST.id, x=300.0)
+
+    editor.objects.append(portal)
+
+    assert editor.length < length
+
+    faster = editor.length
+
+    portal.x = 1500.0
+
+    assert faster < editor.length < length
+
+
+@pytest.mark.parametrize("name", ("x", "id"))
+def test_speed_timeline_invalidation_on_set(name: str) -> None:
+    portal = Object(id=SpeedChangeType.FASTEST.id, x=300.0)
+
+    editor = Editor(Header(), [portal, Object(id=1, x=3000.0)])
+
+    editor.enable_group_index()
+
+    length = editor.length
+
+    setattr(portal, name, 1500.0 if name == "x" else SpeedChangeType.SLOW.id)
+
+    assert editor.length > length
+
+    block = Object(id=1, x=1000.0)
+
+    editor.add_objects(block)
+
+    length = editor.length
+
+    block.id = SpeedChangeType.FASTEST.id
+
+    assert editor.length < length
+
+
+def test_speed_timeline_does_not_attach() -> None:
+    portal = Object(id=SpeedChangeType.FASTEST.id, x=300.0)
+
+    editor = Editor(Header(), [portal])
+    other = Editor(Header(), [portal])
+
+    assert editor.length == other.length
+
+    assert portal.observer is None
+
+    other.enable_spatial_index()
+    other.enable_group_index()
+
+    assert portal.observer is other
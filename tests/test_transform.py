@@ -0,0 +1,117 @@
+import pytest
+
+from gd.api.objects import MoveTrigger, Object, RotateTrigger
+from gd.api.transform import Selection, Transform
+
+
+def test_translation() -> None:
+    transform = Transform.translation(30.0, -15.0)
+
+    assert transform.is_translation()
+    assert transform.apply_point(1.0, 2.0) == (31.0, -13.0)
+    assert transform.apply_vector(1.0, 2.0) == (1.0, 2.0)
+
+
+def test_rotation() -> None:
+    transform = Transform.rotation(90.0, 15.0, 15.0)
+
+    assert not transform.is_translation()
+
+    assert transform.apply_point(15.0, 15.0) == pytest.approx((15.0, 15.0))
+    assert transform.apply_point(45.0, 15.0) == pytest.approx((15.0, -15.0))  # clockwise
+
+    assert transform.apply_rotation(30.0) == 120.0
+
+
+def test_mirror() -> None:
+    transform = Transform.h_mirror(15.0)
+
+    assert transform.apply_point(45.0, 30.0) == (-15.0, 30.0)
+    assert transform.apply_rotation(30.0) == -30.0
+
+    transform = Transform.v_mirror(15.0)
+
+    assert transform.apply_point(45.0, 30.0) == (45.0, 0.0)
+
+    assert Transform.h_mirror().then(Transform.v_mirror()).sign == 1.0
+
+
+def test_then() -> None:
+    first = Transform.rotation(45.0, 10.0, 20.0)
+    second = Transform.h_mirror(5.0)
+    third = Transform.scaling(2.0, 1.0, 1.0)
+
+    composed = first.then(second).then(third)
+
+    for x, y in ((0.0, 0.0), (15.0, -30.0), (100.0, 7.5)):
+        expected = third.apply_point(*second.apply_point(*first.apply_point(x, y)))
+
+        assert composed.apply_point(x, y) == pytest.approx(expected)
+
+    rotation = third.apply_rotation(second.apply_rotation(first.apply_rotation(30.0)))
+
+    assert composed.apply_rotation(30.0) == pytest.approx(rotation)
+    assert composed.scale == 2.0
+
+
+def test_apply_to_objects() -> None:
+    object = Object(id=1, x=30.0, y=0.0, rotation=30.0)
+
+    Transform.h_mirror().then(Transform.scaling(2.0)).apply(object)
+
+    assert (object.x, object.y) == (-60.0, 0.0)
+    assert object.rotation == -30.0
+    assert object.scale == 2.0
+
+    assert object.h_flipped
+    assert not object.v_flipped
+
+
+def test_move_trigger_offsets() -> None:
+    trigger = MoveTrigger(id=901, x_offset=30.0, y_offset=0.0)
+
+    Transform.rotation(90.0).apply(trigger)
+
+    assert (trigger.x_offset, trigger.y_offset) == pytest.approx((0.0, -30.0))
+
+    Transform.translation(100.0, 100.0).apply(trigger)
+
+    assert (trigger.x_offset, trigger.y_offset) == pytest.approx((0.0, -30.0))
+
+
+def test_rotate_trigger_target_rotation() -> None:
+    trigger = RotateTrigger(id=1346, target_rotation=90.0)
+
+    Transform.v_mirror().apply(trigger)
+
+    assert trigger.target_rotation == -90.0
+
+
+def test_selection() -> None:
+    first = Object(id=1, x=0.0, y=0.0)
+    second = Object(id=1, x=30.0, y=60.0)
+
+    selection = Selection.from_objects(first, second)
+
+    assert selection.bounds() == (0.0, 0.0, 30.0, 60.0)
+    assert selection.center() == (15.0, 30.0)
+
+    selection.move(15.0, 15.0)
+
+    assert (first.x, first.y) == (15.0, 15.0)
+    assert (second.x, second.y) == (45.0, 75.0)
+
+    selection.rotate(180.0)  # around the center, swapping the objects
+
+    assert (first.x, first.y) == pytest.approx((45.0, 75.0))
+    assert (second.x, second.y) == pytest.approx((15.0, 15.0))
+
+    selection.h_mirror()
+
+    assert (first.x, second.x) == pytest.approx((15.0, 45.0))
+    assert first.h_flipped and second.h_flipped
+
+
+def test_empty_selection() -> None:
+    with pytest.raises(ValueError):
+        Selection().center()
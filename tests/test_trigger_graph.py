@@ -0,0 +1,167 @@
+from typing import Type
+
+import pytest
+
+from gd.api.objects import (
+    CountTrigger,
+    Groups,
+    InstantCountTrigger,
+    MoveTrigger,
+    Object,
+    SpawnTrigger,
+    ToggleTrigger,
+    TouchTrigger,
+    Trigger,
+)
+from gd.api.trigger_graph import (
+    TriggerGraph,
+    is_activating,
+    is_enabling,
+    is_spawning,
+    strongly_connected_components,
+)
+from gd.enums import ToggleType, TriggerType
+
+
+def test_strongly_connected_components() -> None:
+    component_of, components = strongly_connected_components([[1], [2], [0, 3], [], [4]])
+
+    assert sorted(map(sorted, components)) == [[0, 1, 2], [3], [4]]
+
+    assert component_of[0] == component_of[1] == component_of[2]
+    assert component_of[3] != component_of[0]
+
+    # components come after all components reachable from them
+    assert component_of[3] < component_of[0]
+
+
+def test_strongly_connected_components_deep() -> None:
+    count = 100000
+
+    edges = [[index + 1] for index in range(count - 1)]
+    edges.append([0])
+
+    _, components = strongly_connected_components(edges)
+
+    assert len(components) == 1
+
+
+def spawn(group: int, target_group_id: int) -> SpawnTrigger:
+    return SpawnTrigger(
+        id=1268, target_group_id=target_group_id, spawn_triggered=True, groups=Groups((group,))
+    )
+
+
+def test_spawn_loop() -> None:
+    first = spawn(1, 2)
+    second = spawn(2, 1)
+    third = spawn(3, 1)
+
+    graph = TriggerGraph.from_objects(first, second, third)
+
+    assert graph.has_cycles()
+
+    (cycle,) = graph.cycles()
+
+    assert {id(trigger) for trigger in cycle} == {id(first), id(second)}
+
+    assert graph.is_in_cycle(first)
+    assert not graph.is_in_cycle(third)
+
+    assert graph.is_reachable(third, second)
+    assert not graph.is_reachable(first, third)
+
+
+def test_self_loop() -> None:
+    trigger = spawn(1, 1)
+
+    graph = TriggerGraph.from_objects(trigger)
+
+    assert graph.is_in_cycle(trigger)
+    assert graph.cycles() == [[trigger]]
+
+
+def test_toggle_off_is_not_activating() -> None:
+    toggle_on = ToggleTrigger(
+        id=1049, target_group_id=2, activate_group=True, touch_triggered=True, groups=Groups((1,))
+    )
+    toggle_off = ToggleTrigger(
+        id=1049, target_group_id=1, activate_group=False, touch_triggered=True, groups=Groups((2,))
+    )
+
+    assert is_enabling(toggle_on)
+    assert not is_activating(toggle_off)
+
+    graph = TriggerGraph.from_objects(toggle_on, toggle_off)
+
+    assert graph.successors(toggle_on) == [toggle_off]
+    assert not graph.successors(toggle_off)
+
+    assert not graph.has_cycles()
+
+
+def test_touch_trigger_modes() -> None:
+    touch = TouchTrigger(id=1595, target_group_id=1)
+
+    for toggle_type, spawning, enabling in (
+        (ToggleType.SPAWN, True, False),
+        (ToggleType.TOGGLE_ON, False, True),
+        (ToggleType.TOGGLE_OFF, False, False),
+    ):
+        touch.toggle_type = toggle_type
+
+        assert is_spawning(touch) is spawning
+        assert is_enabling(touch) is enabling
+
+
+def test_spawn_does_not_enable() -> None:
+    spawner = spawn(3, 1)
+    touched = MoveTrigger(id=901, target_group_id=2, touch_triggered=True, groups=Groups((1,)))
+
+    graph = TriggerGraph.from_objects(spawner, touched)
+
+    assert not graph.successors(spawner)
+
+
+def test_reachable_and_affected() -> None:
+    first = spawn(1, 2)
+    move = MoveTrigger(id=901, target_group_id=3, spawn_triggered=True, groups=Groups((2,)))
+
+    block = Object(id=1, groups=Groups((3,)))
+    other = Object(id=1, groups=Groups((4,)))
+
+    graph = TriggerGraph.from_objects(first, move, block, other)
+
+    assert len(graph) == 2
+
+    assert {id(trigger) for trigger in graph.reachable(first)} == {id(first), id(move)}
+    assert graph.reachable(move) == [move]
+
+    assert {id(object) for object in graph.affected(first)} == {id(move), id(block)}
+    assert graph.affected(move) == [block]
+
+    with pytest.raises(LookupError):
+        graph.reachable(spawn(1, 1))
+
+
+@pytest.mark.parametrize(
+    ("trigger_type", "trigger_class"),
+    ((TriggerType.COUNT, CountTrigger), (TriggerType.INSTANT_COUNT, InstantCountTrigger)),
+)
+def test_count_triggers(trigger_type: TriggerType, trigger_class: Type[Trigger]) -> None:
+    enabling = trigger_class(
+        id=trigger_type.id, target_group_id=2, activate_group=True, groups=Groups((1,))
+    )
+    disabling = trigger_class(
+        id=trigger_type.id, target_group_id=2, activate_group=False, groups=Groups((1,))
+    )
+
+    touched = MoveTrigger(id=901, target_group_id=3, touch_triggered=True, groups=Groups((2,)))
+
+    graph = TriggerGraph.from_objects(enabling, disabling, touched)
+
+    assert graph.successors(enabling) == [touched]
+    assert not graph.successors(disabling)
+
+    assert graph.is_reachable(enabling, touched)
+    assert not graph.is_reachable(disabling, touched)